@@ -1,5 +1,6 @@
 """Caching utilities for Taurus-PROTECT SDK."""
 
+from taurus_protect.cache.lru_cache import LRUCache
 from taurus_protect.cache.rules_container_cache import RulesContainerCache
 
-__all__ = ["RulesContainerCache"]
+__all__ = ["LRUCache", "RulesContainerCache"]
@@ -0,0 +1,58 @@
+"""Bounded least-recently-used cache."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+_K = TypeVar("_K", bound=Hashable)
+_V = TypeVar("_V")
+
+
+class LRUCache(Generic[_K, _V]):
+    """
+    Thread-safe cache keeping the ``maxsize`` most recently used entries.
+
+    A ``maxsize`` of 0 disables caching.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[_K, _V]" = OrderedDict()
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum number of entries; 0 when caching is disabled."""
+        return self._maxsize
+
+    def get(self, key: _K) -> Optional[_V]:
+        """Return the value stored for ``key`` and mark it recently used, or None."""
+        if self._maxsize <= 0:
+            return None
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: _K, value: _V) -> None:
+        """Store ``value`` for ``key``, dropping the least recently used entries."""
+        if self._maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: _K) -> Optional[_V]:
+        """Remove and return the value stored for ``key``, or None."""
+        with self._lock:
+            return self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
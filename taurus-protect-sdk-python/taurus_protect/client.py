@@ -93,6 +93,9 @@ class ProtectClient:
 
     DEFAULT_TIMEOUT: float = 30.0
     DEFAULT_RULES_CACHE_TTL: float = 300.0  # 5 minutes
+    # Enough kept-alive connections for the concurrent fan-out of
+    # AsyncTransactionService and the batched user lookups
+    DEFAULT_CONNECTION_POOL_MAXSIZE: int = 32
 
     def __init__(
         self,
@@ -102,6 +105,7 @@ class ProtectClient:
         min_valid_signatures: int,
         rules_cache_ttl: float,
         timeout: float,
+        connection_pool_maxsize: int = DEFAULT_CONNECTION_POOL_MAXSIZE,
     ) -> None:
         """
         Initialize ProtectClient.
@@ -115,6 +119,7 @@ class ProtectClient:
         self._min_valid_signatures = min_valid_signatures
         self._rules_cache_ttl = rules_cache_ttl
         self._timeout = timeout
+        self._connection_pool_maxsize = connection_pool_maxsize
         self._lock = threading.RLock()
         self._closed = False
 
@@ -175,6 +180,7 @@ class ProtectClient:
         min_valid_signatures: int = 1,
         rules_cache_ttl: float = DEFAULT_RULES_CACHE_TTL,
         timeout: float = DEFAULT_TIMEOUT,
+        connection_pool_maxsize: int = DEFAULT_CONNECTION_POOL_MAXSIZE,
     ) -> "ProtectClient":
         """
         Create a new ProtectClient instance.
@@ -189,6 +195,8 @@ class ProtectClient:
                 required for verification. Cannot exceed number of keys.
             rules_cache_ttl: TTL in seconds for rules container cache.
             timeout: HTTP request timeout in seconds.
+            connection_pool_maxsize: Maximum number of connections kept open
+                to the API host for reuse by concurrent requests.
 
         Returns:
             Configured ProtectClient instance.
@@ -240,6 +248,9 @@ class ProtectClient:
                 "min_valid_signatures must be greater than zero"
             )
 
+        if connection_pool_maxsize < 1:
+            raise ConfigurationError("connection_pool_maxsize must be greater than zero")
+
         return cls(
             host=host,
             auth=auth,
@@ -247,6 +258,7 @@ class ProtectClient:
             min_valid_signatures=min_valid_signatures,
             rules_cache_ttl=rules_cache_ttl,
             timeout=timeout,
+            connection_pool_maxsize=connection_pool_maxsize,
         )
 
     @classmethod
@@ -331,6 +343,11 @@ class ProtectClient:
             # Note: This assumes datetime objects are in UTC when converted.
             config.datetime_format = "%Y-%m-%dT%H:%M:%S.%fZ"
 
+            # The generated default scales with the CPU count, which can be
+            # fewer connections than concurrent requests; extra requests
+            # would then open and discard a new TLS connection each.
+            config.connection_pool_maxsize = self._connection_pool_maxsize
+
             # Create the ApiClient
             api_client = ApiClient(configuration=config)
 
@@ -3,11 +3,18 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Optional
+import re
+from typing import Any, Dict, Optional
 
-from taurus_protect._internal.openapi.rest import RESTClientObject
+import urllib3
+
+from taurus_protect._internal.openapi.exceptions import ApiException
+from taurus_protect._internal.openapi.rest import RESTClientObject, RESTResponse
 from taurus_protect.crypto.tpv1 import TPV1Auth
 
+# Methods for which the base REST client JSON-encodes a dict body.
+_BODY_METHODS = frozenset(("POST", "PUT", "PATCH", "OPTIONS", "DELETE"))
+
 
 class AuthenticatedRESTClient(RESTClientObject):
     """
@@ -41,7 +48,9 @@ class AuthenticatedRESTClient(RESTClientObject):
         Perform an HTTP request with TPV1 authentication.
 
         Signs the request with TPV1-HMAC-SHA256 before delegating to the
-        base REST client.
+        base REST client. JSON bodies are serialized once: the exact bytes
+        that were signed are sent, instead of letting the base client encode
+        the body a second time.
 
         Args:
             method: HTTP method (GET, POST, etc.).
@@ -87,6 +96,21 @@ class AuthenticatedRESTClient(RESTClientObject):
         # Add Authorization header
         headers["Authorization"] = auth_header
 
+        if (
+            body_str is not None
+            and not isinstance(body, (str, bytes))
+            and not post_params
+            and method.upper() in _BODY_METHODS
+            and (not content_type or re.search("json", content_type, re.IGNORECASE))
+        ):
+            return self._send_serialized(
+                method=method.upper(),
+                url=url,
+                headers=headers,
+                payload=body_str.encode("utf-8"),
+                _request_timeout=_request_timeout,
+            )
+
         # Delegate to base REST client
         return super().request(
             method=method,
@@ -96,3 +120,49 @@ class AuthenticatedRESTClient(RESTClientObject):
             post_params=post_params,
             _request_timeout=_request_timeout,
         )
+
+    def _send_serialized(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        payload: bytes,
+        _request_timeout: Any = None,
+    ) -> Any:
+        """
+        Send an already serialized JSON payload.
+
+        Mirrors the JSON branch of the base REST client without re-encoding
+        the body.
+
+        Args:
+            method: Upper-case HTTP method.
+            url: Full request URL.
+            headers: Request headers, including Authorization.
+            payload: Serialized request body.
+            _request_timeout: Total timeout or (connect, read) tuple.
+
+        Returns:
+            RESTResponse object.
+        """
+        timeout = None
+        if _request_timeout:
+            if isinstance(_request_timeout, (int, float)):
+                timeout = urllib3.Timeout(total=_request_timeout)
+            elif isinstance(_request_timeout, tuple) and len(_request_timeout) == 2:
+                timeout = urllib3.Timeout(connect=_request_timeout[0], read=_request_timeout[1])
+
+        try:
+            r = self.pool_manager.request(
+                method,
+                url,
+                body=payload,
+                timeout=timeout,
+                headers=headers,
+                preload_content=False,
+            )
+        except urllib3.exceptions.SSLError as e:
+            msg = "\n".join([type(e).__name__, str(e)])
+            raise ApiException(status=0, reason=msg)
+
+        return RESTResponse(r)
@@ -129,3 +129,35 @@ def parse_string_to_int(value: Optional[str], default: int = 0) -> int:
         return int(value)
     except (ValueError, TypeError):
         return default
+
+
+class _AttrFields:
+    """Dict-style ``get`` over the attributes of an object without ``__dict__``."""
+
+    __slots__ = ("_obj",)
+
+    def __init__(self, obj: Any) -> None:
+        self._obj = obj
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return getattr(self._obj, name, default)
+
+
+def dto_fields(dto: Any) -> Any:
+    """
+    Return a ``get``-able view of a DTO's field values.
+
+    Generated DTOs are pydantic models whose field values live in the
+    instance ``__dict__``. Reading them there skips pydantic's
+    ``__getattr__``, which raises (and is caught by ``getattr``) for every
+    field the DTO does not declare.
+
+    Args:
+        dto: OpenAPI DTO or any object with the expected attributes.
+
+    Returns:
+        The DTO's ``__dict__``, or a ``getattr``-backed view for objects
+        without one.
+    """
+    fields = getattr(dto, "__dict__", None)
+    return _AttrFields(dto) if fields is None else fields
@@ -2,36 +2,61 @@
 
 from __future__ import annotations
 
+import threading
+import weakref
 from typing import Any, List, Optional
 
-from taurus_protect.mappers._base import safe_datetime, safe_int, safe_string
+from taurus_protect.mappers._base import dto_fields, safe_datetime, safe_int, safe_string
 from taurus_protect.models.transaction import Transaction
 
+# Mapped transactions still referenced elsewhere, by ID. Transactions are
+# immutable, so a new mapping equal to a live one is replaced by it: pollers
+# that keep mapping unchanged transactions retain a single copy of each.
+_interned: "weakref.WeakValueDictionary[str, Transaction]" = weakref.WeakValueDictionary()
+_interned_lock = threading.Lock()
+
 
 def map_transaction(dto: Any) -> Transaction:
     """Map OpenAPI transaction DTO to domain model."""
-    return Transaction(
-        id=safe_string(getattr(dto, "id", None)) or "",
-        request_id=safe_string(getattr(dto, "request_id", None)),
-        wallet_id=safe_string(getattr(dto, "wallet_id", None)),
-        address_id=safe_string(getattr(dto, "address_id", None)),
-        currency=safe_string(getattr(dto, "currency", None)),
-        blockchain=safe_string(getattr(dto, "blockchain", None)),
-        tx_hash=safe_string(getattr(dto, "tx_hash", None)) or safe_string(getattr(dto, "hash", None)),
-        block_height=safe_int(getattr(dto, "block_height", None)) or safe_int(getattr(dto, "block_number", None)),
-        block_hash=safe_string(getattr(dto, "block_hash", None)),
-        amount=safe_string(getattr(dto, "amount", None)),
-        fee=safe_string(getattr(dto, "fee", None)),
-        direction=safe_string(getattr(dto, "direction", None)),
-        status=safe_string(getattr(dto, "status", None)),
-        confirmations=safe_int(getattr(dto, "confirmations", None)) or 0,
-        created_at=safe_datetime(getattr(dto, "created_at", None)) or safe_datetime(getattr(dto, "creation_date", None)),
-        confirmed_at=safe_datetime(getattr(dto, "confirmed_at", None)) or safe_datetime(getattr(dto, "confirmation_date", None)),
+    # Several of these names are not fields of the generated DTO: read them
+    # from its __dict__ rather than through a failing getattr each.
+    get = dto_fields(dto).get
+    tx = Transaction(
+        id=safe_string(get("id")) or "",
+        request_id=safe_string(get("request_id")),
+        wallet_id=safe_string(get("wallet_id")),
+        address_id=safe_string(get("address_id")),
+        currency=safe_string(get("currency")),
+        blockchain=safe_string(get("blockchain")),
+        tx_hash=safe_string(get("tx_hash")) or safe_string(get("hash")),
+        block_height=safe_int(get("block_height")) or safe_int(get("block_number")),
+        block_hash=safe_string(get("block_hash")),
+        amount=safe_string(get("amount")),
+        fee=safe_string(get("fee")),
+        direction=safe_string(get("direction")),
+        status=safe_string(get("status")),
+        confirmations=safe_int(get("confirmations")) or 0,
+        created_at=safe_datetime(get("created_at")) or safe_datetime(get("creation_date")),
+        confirmed_at=safe_datetime(get("confirmed_at"))
+        or safe_datetime(get("confirmation_date")),
     )
+    return _intern(tx)
+
+
+def _intern(tx: Transaction) -> Transaction:
+    """Return the live transaction equal to ``tx``, or register ``tx``."""
+    if not tx.id:
+        return tx
+    with _interned_lock:
+        existing = _interned.get(tx.id)
+        if existing is not None and existing == tx:
+            return existing
+        _interned[tx.id] = tx
+    return tx
 
 
 def map_transactions(dtos: Optional[List[Any]]) -> List[Transaction]:
     """Map list of OpenAPI transaction DTOs to domain models."""
     if not dtos:
         return []
-    return [map_transaction(dto) for dto in dtos]
+    return list(map(map_transaction, dtos))
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from functools import cached_property
+from typing import Any, Dict, List, Mapping, Optional
 
 from pydantic import BaseModel, Field
 
@@ -373,7 +374,24 @@ class RejectPledgeActionsRequest(BaseModel):
 # Filter options
 
 
-class ListPledgesOptions(BaseModel):
+class _PledgeListOptions(BaseModel):
+    """
+    Base for pledge list options.
+
+    Options are frozen so the API query parameters can be derived once per
+    instance (``_query_params``) and reused across paginated calls.
+    """
+
+    model_config = {"frozen": True}
+
+    def model_copy(self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False) -> Any:
+        copied = super().model_copy(update=update, deep=deep)
+        # The copy shares __dict__ contents, including derived query params.
+        copied.__dict__.pop("_query_params", None)
+        return copied
+
+
+class ListPledgesOptions(_PledgeListOptions):
     """Options for listing pledges."""
 
     limit: int = Field(default=50, ge=1, le=1000, description="Maximum items to return")
@@ -385,8 +403,19 @@ class ListPledgesOptions(BaseModel):
     )
     participant_id: Optional[str] = Field(default=None, description="Filter by participant ID")
 
+    @cached_property
+    def _query_params(self) -> Dict[str, Any]:
+        """Keyword arguments for ``taurus_network_service_get_pledges``."""
+        return {
+            "statuses": self.statuses or None,
+            "currency_id": self.currency_id or None,
+            "owner_participant_id": self.participant_id or None,
+            "sort_order": self.direction or None,
+            "cursor_page_size": str(self.limit),
+        }
+
 
-class ListPledgeActionsOptions(BaseModel):
+class ListPledgeActionsOptions(_PledgeListOptions):
     """Options for listing pledge actions."""
 
     limit: int = Field(default=50, ge=1, le=1000, description="Maximum items to return")
@@ -395,11 +424,35 @@ class ListPledgeActionsOptions(BaseModel):
     action_types: Optional[List[str]] = Field(default=None, description="Filter by action types")
     pledge_id: Optional[str] = Field(default=None, description="Filter by pledge ID")
 
+    @cached_property
+    def _query_params(self) -> Dict[str, Any]:
+        """
+        Keyword arguments shared by the pledge action list endpoints.
 
-class ListPledgeWithdrawalsOptions(BaseModel):
+        ``statuses`` is excluded because the for-approval endpoint does not accept it.
+        """
+        return {
+            "action_types": self.action_types,
+            "pledge_id": self.pledge_id,
+            "limit": str(self.limit),
+            "offset": str(self.offset) if self.offset > 0 else None,
+        }
+
+
+class ListPledgeWithdrawalsOptions(_PledgeListOptions):
     """Options for listing pledge withdrawals."""
 
     limit: int = Field(default=50, ge=1, le=1000, description="Maximum items to return")
     offset: int = Field(default=0, ge=0, description="Number of items to skip")
     statuses: Optional[List[str]] = Field(default=None, description="Filter by statuses")
     pledge_id: Optional[str] = Field(default=None, description="Filter by pledge ID")
+
+    @cached_property
+    def _query_params(self) -> Dict[str, Any]:
+        """Keyword arguments for ``taurus_network_service_get_pledges_withdrawals``."""
+        return {
+            "statuses": self.statuses,
+            "pledge_id": self.pledge_id,
+            "limit": str(self.limit),
+            "offset": str(self.offset) if self.offset > 0 else None,
+        }
@@ -1,6 +1,6 @@
 """Services for Taurus-PROTECT SDK."""
 
-from taurus_protect.services._base import BaseService
+from taurus_protect.services._base import BaseAsyncService, BaseService
 from taurus_protect.services.action_service import ActionService
 from taurus_protect.services.address_service import AddressService
 from taurus_protect.services.air_gap_service import AirGapService
@@ -39,11 +39,14 @@ from taurus_protect.services.staking_service import StakingService
 from taurus_protect.services.statistics_service import StatisticsService
 from taurus_protect.services.tag_service import TagService
 from taurus_protect.services.token_metadata_service import TokenMetadataService
-from taurus_protect.services.transaction_service import TransactionService
+from taurus_protect.services.transaction_service import (
+    AsyncTransactionService,
+    TransactionService,
+)
 from taurus_protect.services.user_device_service import UserDeviceService
 from taurus_protect.services.user_service import UserService
 from taurus_protect.services.visibility_group_service import VisibilityGroupService
-from taurus_protect.services.wallet_service import WalletService
+from taurus_protect.services.wallet_service import AsyncWalletService, WalletService
 from taurus_protect.services.webhook_call_service import (
     ApiRequestCursor,
     WebhookCallResult,
@@ -58,6 +61,7 @@ from taurus_protect.services.whitelisted_asset_service import WhitelistedAssetSe
 __all__ = [
     # Base
     "BaseService",
+    "BaseAsyncService",
     # Core services
     "ActionService",
     "AddressService",
@@ -92,10 +96,12 @@ __all__ = [
     "StatisticsService",
     "TagService",
     "TokenMetadataService",
+    "AsyncTransactionService",
     "TransactionService",
     "UserDeviceService",
     "UserService",
     "VisibilityGroupService",
+    "AsyncWalletService",
     "WalletService",
     "ApiRequestCursor",
     "WebhookCallResult",
@@ -2,8 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import timedelta
-from typing import TYPE_CHECKING, Any, Optional, Tuple, Union
+from functools import partial, wraps
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from taurus_protect.errors import APIError, map_http_error
 from taurus_protect.models.pagination import Pagination
@@ -11,6 +32,216 @@ from taurus_protect.models.pagination import Pagination
 if TYPE_CHECKING:
     pass  # Import types for type checking only
 
+_F = TypeVar("_F", bound=Callable[..., Any])
+_K = TypeVar("_K", bound=Hashable)
+_R = TypeVar("_R")
+_P = TypeVar("_P")
+_S = TypeVar("_S", bound="BaseService")
+_A = TypeVar("_A", bound="BaseAsyncService[Any]")
+
+# Cursor and page request direction of a cursor-paginated request
+CursorPage = Tuple[Optional[str], Optional[str]]
+
+# Keyword arguments for @dataclass that drop the per-instance __dict__ of
+# classes created per DTO or request; slots=True needs Python 3.10+
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Query string values for the limits and offsets most calls use
+_SMALL_INT_STRS = tuple(str(i) for i in range(1025))
+
+
+def int_param(value: int) -> str:
+    """Format a non-negative int query parameter, reusing the strings of small values."""
+    return _SMALL_INT_STRS[value] if 0 <= value < len(_SMALL_INT_STRS) else str(value)
+
+
+def api_call(
+    rethrow: Tuple[Type[Exception], ...] = (APIError, ValueError),
+) -> Callable[[_F], _F]:
+    """
+    Convert unexpected errors raised by a service method into APIError.
+
+    Exceptions matching ``rethrow`` propagate unchanged; anything else,
+    including ApiException from the generated client, goes through
+    ``BaseService._handle_error``.
+
+    Args:
+        rethrow: Exception types to re-raise as is.
+
+    Returns:
+        Decorator for ``BaseService`` methods.
+    """
+
+    def decorator(func: _F) -> _F:
+        @wraps(func)
+        def wrapper(self: BaseService, *args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(self, *args, **kwargs)
+            except rethrow:
+                raise
+            except Exception as e:
+                raise self._handle_error(e) from e
+
+        return cast(_F, wrapper)
+
+    return decorator
+
+
+class _InFlightCall(Generic[_R]):
+    """Result slot shared by the callers of one in-flight call."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[_R] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight(Generic[_R]):
+    """
+    Coalesce concurrent calls that share a key into a single call.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for it and receive the same result or exception.
+    Nothing is kept once the call completes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _InFlightCall[_R]] = {}
+
+    def do(self, key: Hashable, func: Callable[[], _R]) -> _R:
+        """
+        Run ``func`` for ``key``, or wait for the call already in flight.
+
+        Args:
+            key: Identifies equivalent calls.
+            func: Performs the call.
+
+        Returns:
+            The result of the (shared) call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            owner = call is None
+            if call is None:
+                call = self._calls[key] = _InFlightCall()
+
+        if not owner:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return cast(_R, call.result)
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class TTLCache(Generic[_K, _R]):
+    """
+    Bounded cache whose entries expire ``ttl`` seconds after being stored.
+
+    At most ``maxsize`` entries are kept, dropping the oldest first. A
+    ``ttl`` of 0 disables caching.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 128) -> None:
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[_K, Tuple[float, _R]]" = OrderedDict()
+
+    def get(self, key: _K) -> Optional[_R]:
+        """Return the value stored for ``key``, or None if absent or expired."""
+        if self._ttl <= 0:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= self._ttl:
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def put(self, key: _K, value: _R) -> None:
+        """Store ``value`` for ``key``."""
+        if self._ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+def iter_prefetched_pages(
+    fetch: Callable[[_P], _R],
+    first: _P,
+    next_page: Callable[[_R, _P], Optional[_P]],
+) -> Iterator[_R]:
+    """
+    Yield the replies of a paginated endpoint, fetching one page ahead.
+
+    While the caller processes a reply, the request for the following page
+    already runs on a background thread.
+
+    Args:
+        fetch: Requests the page identified by its argument.
+        first: Identifies the first page.
+        next_page: Given a reply and the page it answers, identifies the
+            following page, or returns None after the last one.
+
+    Yields:
+        The reply of each page, in order.
+    """
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        page = first
+        pending: Optional[Future[_R]] = executor.submit(fetch, page)
+        while pending is not None:
+            reply = pending.result()
+            following = next_page(reply, page)
+            pending = None
+            if following is not None:
+                page = following
+                pending = executor.submit(fetch, page)
+            yield reply
+    finally:
+        executor.shutdown(wait=False)
+
+
+def next_cursor_page(reply: Any, page: CursorPage) -> Optional[CursorPage]:
+    """
+    Return the page after a cursor-paginated reply, for :func:`iter_prefetched_pages`.
+
+    Args:
+        reply: A reply with a ``cursor`` holding ``current_page`` and ``has_next``.
+        page: The page the reply answers (unused).
+
+    Returns:
+        ``(cursor, "NEXT")``, or None if the reply is the last page.
+    """
+    cursor = getattr(reply, "cursor", None)
+    current_page = getattr(cursor, "current_page", None) if cursor else None
+    if current_page and getattr(cursor, "has_next", False):
+        return current_page, "NEXT"
+    return None
+
 
 class BaseService:
     """
@@ -89,6 +320,24 @@ class BaseService:
 
         return Pagination.from_response(total_items, offset, limit)
 
+    @staticmethod
+    def _total_items(reply: Any) -> Any:
+        """
+        Read the total item count from a paginated API reply.
+
+        Args:
+            reply: The API reply or cursor object.
+
+        Returns:
+            The reply's total_items value, or None if it has none.
+        """
+        # Generated reply models declare total_items, so the lookup almost
+        # always succeeds; try/except is cheaper than getattr with a default.
+        try:
+            return reply.total_items
+        except AttributeError:
+            return None
+
     @staticmethod
     def _validate_required(value: Any, name: str) -> None:
         """
@@ -101,7 +350,62 @@ class BaseService:
         Raises:
             ValueError: If value is None or empty string.
         """
+        # Valid non-empty strings are by far the common case: check them first
+        # so they return after a single type test.
+        if type(value) is str:
+            if value.strip():
+                return
+            raise ValueError(f"{name} cannot be empty")
         if value is None:
             raise ValueError(f"{name} cannot be None")
         if isinstance(value, str) and not value.strip():
             raise ValueError(f"{name} cannot be empty")
+
+
+class BaseAsyncService(Generic[_S]):
+    """
+    Base class for the asyncio interfaces to blocking services.
+
+    Each call runs the blocking request on a worker thread so that many
+    calls can be awaited together; at most ``max_concurrency`` requests
+    are in flight at once and the rest wait their turn. Subclasses wrap
+    the service methods with :meth:`_run`.
+    """
+
+    DEFAULT_MAX_CONCURRENCY: int = 16
+
+    # Name prefix of the worker threads
+    _THREAD_NAME_PREFIX: str = "taurus-protect"
+
+    def __init__(self, service: _S, max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> None:
+        """
+        Initialize the async service.
+
+        Args:
+            service: The blocking service to run requests with.
+            max_concurrency: Maximum number of concurrent requests.
+
+        Raises:
+            ValueError: If max_concurrency is not positive.
+        """
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+        self._service = service
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix=self._THREAD_NAME_PREFIX
+        )
+
+    async def __aenter__(self: _A) -> _A:
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker threads once pending requests complete."""
+        self._executor.shutdown(wait=False)
+
+    async def _run(self, func: Callable[..., _R], *args: Any, **kwargs: Any) -> _R:
+        """Run ``func(*args, **kwargs)`` on a worker thread and return its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
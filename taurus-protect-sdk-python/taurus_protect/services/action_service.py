@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
+from taurus_protect.errors import APIError, NotFoundError
 from taurus_protect.mappers.action import action_from_dto, actions_from_dto
 from taurus_protect.models.action import Action
 from taurus_protect.models.pagination import Pagination
@@ -64,22 +65,16 @@ class ActionService(BaseService):
 
             result = getattr(resp, "action", None)
             if result is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Action {action_id} not found")
 
             action = action_from_dto(result)
             if action is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Action {action_id} not found")
 
             return action
+        except (APIError, NotFoundError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError, NotFoundError
-
-            if isinstance(e, (APIError, NotFoundError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def list(
@@ -117,15 +112,13 @@ class ActionService(BaseService):
             actions = actions_from_dto(result) if result else []
 
             pagination = self._extract_pagination(
-                total_items=getattr(resp, "total_items", None),
+                total_items=self._total_items(resp),
                 offset=offset,
                 limit=limit,
             )
 
             return actions, pagination
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
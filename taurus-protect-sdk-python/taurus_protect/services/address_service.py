@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
+from taurus_protect.errors import APIError, NotFoundError
 from taurus_protect.mappers.address import address_from_dto, addresses_from_dto
 from taurus_protect.models.address import Address, CreateAddressRequest, ListAddressesOptions
 from taurus_protect.models.pagination import Pagination
@@ -90,25 +91,19 @@ class AddressService(BaseService):
 
             result = getattr(resp, "result", None)
             if result is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Address {address_id} not found")
 
             address = address_from_dto(result)
             if address is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Address {address_id} not found")
 
             # Mandatory signature verification if cache is available
             self._verify_address_signature(address)
 
             return address
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def list(
@@ -187,17 +182,15 @@ class AddressService(BaseService):
                 self._verify_address_signature(address, rules_container)
 
             pagination = self._extract_pagination(
-                total_items=getattr(resp, "total_items", None),
+                total_items=self._total_items(resp),
                 offset=getattr(resp, "offset", None),
                 limit=limit,
             )
 
             return addresses, pagination
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def list_with_options(
@@ -266,17 +259,15 @@ class AddressService(BaseService):
                 self._verify_address_signature(address, rules_container)
 
             pagination = self._extract_pagination(
-                total_items=getattr(resp, "total_items", None),
+                total_items=self._total_items(resp),
                 offset=getattr(resp, "offset", None),
                 limit=opts.limit,
             )
 
             return addresses, pagination
+        except APIError:
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, APIError):
-                raise
             raise self._handle_error(e) from e
 
     def create(self, request: CreateAddressRequest) -> Address:
@@ -347,22 +338,16 @@ class AddressService(BaseService):
 
             result = getattr(resp, "result", None)
             if result is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to create address: no result returned")
 
             address = address_from_dto(result)
             if address is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to create address: invalid response")
 
             return address
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def create_attribute(
@@ -393,11 +378,9 @@ class AddressService(BaseService):
                 "attributes": [{"key": key, "value": value}],
             }
             self._addresses_api.wallet_service_create_address_attributes(str(address_id), body=body)
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def delete_attribute(
@@ -425,11 +408,9 @@ class AddressService(BaseService):
             self._addresses_api.wallet_service_delete_address_attribute(
                 str(address_id), str(attribute_id)
             )
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def get_proof_of_reserve(
@@ -459,11 +440,9 @@ class AddressService(BaseService):
                 str(address_id), challenge
             )
             return getattr(resp, "result", None)
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def _verify_address_signature(
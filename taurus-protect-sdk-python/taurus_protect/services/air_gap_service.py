@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+from taurus_protect.errors import APIError
 from taurus_protect.models.staking import UnsignedPayload
 from taurus_protect.services._base import BaseService
 
@@ -88,11 +89,9 @@ class AirGapService(BaseService):
 
             # Try to get bytes from response object
             return bytes(resp) if resp else bytes()
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def submit_signed_payload(self, request_id: int, signed_payload: bytes) -> None:
@@ -130,9 +129,7 @@ class AirGapService(BaseService):
             body = {"payload": signed_payload}
 
             self._api.air_gap_service_submit_incoming_air_gap(body=body)
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
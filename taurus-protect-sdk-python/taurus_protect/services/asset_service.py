@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
+from taurus_protect.errors import APIError
 from taurus_protect.mappers._base import safe_bool, safe_int, safe_string
 from taurus_protect.models.blockchain import Asset
 from taurus_protect.models.pagination import Pagination
@@ -129,17 +130,15 @@ class AssetService(BaseService):
             assets = assets_from_dto(result) if result else []
 
             pagination = self._extract_pagination(
-                total_items=getattr(resp, "total_items", None) or getattr(resp, "totalItems", None),
+                total_items=self._total_items(resp) or getattr(resp, "totalItems", None),
                 offset=getattr(resp, "offset", None),
                 limit=limit,
             )
 
             return assets, pagination
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def get(self, asset_id: str) -> Asset:
@@ -193,11 +192,9 @@ class AssetService(BaseService):
                 symbol=asset_id,
                 enabled=True,
             )
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError, NotFoundError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def get_wallets(
@@ -243,17 +240,15 @@ class AssetService(BaseService):
             result = getattr(resp, "result", None) or getattr(resp, "wallets", [])
 
             pagination = self._extract_pagination(
-                total_items=getattr(resp, "total_items", None) or getattr(resp, "totalItems", None),
+                total_items=self._total_items(resp) or getattr(resp, "totalItems", None),
                 offset=getattr(resp, "offset", None),
                 limit=limit,
             )
 
             return result or [], pagination
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def get_addresses(
@@ -299,15 +294,13 @@ class AssetService(BaseService):
             result = getattr(resp, "result", None) or getattr(resp, "addresses", [])
 
             pagination = self._extract_pagination(
-                total_items=getattr(resp, "total_items", None) or getattr(resp, "totalItems", None),
+                total_items=self._total_items(resp) or getattr(resp, "totalItems", None),
                 offset=getattr(resp, "offset", None),
                 limit=limit,
             )
 
             return result or [], pagination
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
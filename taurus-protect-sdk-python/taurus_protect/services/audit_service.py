@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
+from taurus_protect.errors import APIError, NotFoundError
 from taurus_protect.mappers.audit import audit_from_dto, audits_from_dto
 from taurus_protect.models.audit import Audit
 from taurus_protect.models.pagination import Pagination
@@ -76,7 +77,7 @@ class AuditService(BaseService):
 
             # Extract pagination from cursor
             cursor = getattr(resp, "cursor", None)
-            total = getattr(cursor, "total_items", None) if cursor else None
+            total = self._total_items(cursor) if cursor else None
             pagination = self._extract_pagination(
                 total_items=total,
                 offset=offset,
@@ -84,11 +85,9 @@ class AuditService(BaseService):
             )
 
             return audits, pagination
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def get(self, audit_id: str) -> Audit:
@@ -119,14 +118,10 @@ class AuditService(BaseService):
                 if audit.id == audit_id:
                     return audit
 
-            from taurus_protect.errors import NotFoundError
-
             raise NotFoundError(f"Audit {audit_id} not found")
+        except (APIError, NotFoundError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError, NotFoundError
-
-            if isinstance(e, (APIError, NotFoundError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def export_audit_trails(
@@ -165,9 +160,7 @@ class AuditService(BaseService):
                 format=format,
             )
             return getattr(resp, "result", "") or ""
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
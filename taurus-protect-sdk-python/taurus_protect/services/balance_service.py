@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
+from taurus_protect.errors import APIError
 from taurus_protect.mappers.currency import (
     asset_balances_from_dto,
     nft_collection_balances_from_dto,
@@ -98,17 +99,15 @@ class BalanceService(BaseService):
             balances = asset_balances_from_dto(result) if result else []
 
             pagination = self._extract_pagination(
-                total_items=getattr(resp, "total_items", None),
+                total_items=self._total_items(resp),
                 offset=offset,
                 limit=limit,
             )
 
             return balances, pagination
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def list_nft_collections(
@@ -156,15 +155,13 @@ class BalanceService(BaseService):
             balances = nft_collection_balances_from_dto(result) if result else []
 
             pagination = self._extract_pagination(
-                total_items=getattr(resp, "total_items", None),
+                total_items=self._total_items(resp),
                 offset=offset,
                 limit=limit,
             )
 
             return balances, pagination
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
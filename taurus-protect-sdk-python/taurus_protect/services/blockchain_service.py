@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, List, Optional
 
+from taurus_protect.errors import APIError, NotFoundError
 from taurus_protect.mappers._base import safe_bool, safe_int, safe_string
 from taurus_protect.models.blockchain import Blockchain
 from taurus_protect.services._base import BaseService
@@ -126,11 +127,9 @@ class BlockchainService(BaseService):
 
             result = getattr(resp, "result", None) or getattr(resp, "blockchains", None)
             return blockchains_from_dto(result) if result else []
+        except APIError:
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, APIError):
-                raise
             raise self._handle_error(e) from e
 
     def get(
@@ -169,17 +168,13 @@ class BlockchainService(BaseService):
             blockchains = blockchains_from_dto(result) if result else []
 
             if not blockchains:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Blockchain {blockchain}/{network} not found")
 
             # Return the first matching blockchain
             return blockchains[0]
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def get_by_id(self, blockchain_id: str) -> Blockchain:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, List, Optional
 
+from taurus_protect.errors import APIError
 from taurus_protect.mappers.business_rule import business_rule_from_dto, business_rules_from_dto
 from taurus_protect.models.business_rule import BusinessRule, BusinessRuleResult
 from taurus_protect.services._base import BaseService
@@ -98,11 +99,9 @@ class BusinessRuleService(BaseService):
                 current_page=result_current_page,
                 has_next=has_next,
             )
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def list_by_wallet(
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, List, Optional
 
+from taurus_protect.errors import APIError, NotFoundError
 from taurus_protect.mappers.audit import (
     change_from_dto,
     changes_from_dto,
@@ -83,15 +84,11 @@ class ChangeService(BaseService):
             reply = self._changes_api.change_service_create_change(body)
             result = getattr(reply, "result", None)
             if result is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError("createChange returned no result")
             return getattr(result, "id", "")
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def get(self, change_id: str) -> Change:
@@ -115,22 +112,16 @@ class ChangeService(BaseService):
 
             result = getattr(resp, "result", None)
             if result is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Change {change_id} not found")
 
             change = change_from_dto(result)
             if change is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Change {change_id} not found")
 
             return change
+        except (APIError, NotFoundError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError, NotFoundError
-
-            if isinstance(e, (APIError, NotFoundError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def list(
@@ -175,11 +166,9 @@ class ChangeService(BaseService):
                 current_page=current_page,
                 has_next=has_next,
             )
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def list_for_approval(
@@ -221,11 +210,9 @@ class ChangeService(BaseService):
                 current_page=current_page,
                 has_next=has_next,
             )
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def approve_change(self, change_id: str) -> None:
@@ -242,11 +229,9 @@ class ChangeService(BaseService):
 
         try:
             self._changes_api.change_service_approve_change(change_id, body={})
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def approve_changes(self, change_ids: List[str]) -> None:
@@ -269,11 +254,9 @@ class ChangeService(BaseService):
 
             body = TgvalidatordApproveChangesRequest(ids=change_ids)
             self._changes_api.change_service_approve_changes(body)
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def reject_change(self, change_id: str) -> None:
@@ -290,11 +273,9 @@ class ChangeService(BaseService):
 
         try:
             self._changes_api.change_service_reject_change(change_id, body={})
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def reject_changes(self, change_ids: List[str]) -> None:
@@ -317,9 +298,7 @@ class ChangeService(BaseService):
 
             body = TgvalidatordRejectChangesRequest(ids=change_ids)
             self._changes_api.change_service_reject_changes(body)
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
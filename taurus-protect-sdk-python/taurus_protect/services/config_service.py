@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, List
 
+from taurus_protect.errors import APIError
 from taurus_protect.mappers.webhook import tenant_config_from_dto
 from taurus_protect.models.webhook import Feature, TenantConfig
 from taurus_protect.services._base import BaseService
@@ -64,11 +65,9 @@ class ConfigService(BaseService):
                 return TenantConfig()
 
             return config
+        except APIError:
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, APIError):
-                raise
             raise self._handle_error(e) from e
 
     def get_features(self) -> List[Feature]:
@@ -111,9 +110,7 @@ class ConfigService(BaseService):
                 features.append(Feature(name="exclude_container", enabled=True))
 
             return features
+        except APIError:
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, APIError):
-                raise
             raise self._handle_error(e) from e
@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
 from taurus_protect._internal.openapi.exceptions import ApiException
+from taurus_protect.errors import NotFoundError
 from taurus_protect.models.pagination import Pagination
 from taurus_protect.services._base import BaseService
 
@@ -64,14 +65,10 @@ class ContractWhitelistingService(BaseService):
             reply = self._api.whitelist_service_get_whitelisted_contract(str(contract_id))
             result = reply.result
             if result is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Whitelisted contract {contract_id} not found")
             return self._map_contract_from_dto(result)
-        except Exception as e:
-            if isinstance(e, ApiException):
-                raise self._handle_error(e)
-            raise
+        except ApiException as e:
+            raise self._handle_error(e) from e
 
     def list(
         self,
@@ -100,15 +97,13 @@ class ContractWhitelistingService(BaseService):
                     contracts.append(self._map_contract_from_dto(dto))
 
             pagination = self._extract_pagination(
-                getattr(reply, "total_items", None),
+                self._total_items(reply),
                 offset,
                 limit,
             )
             return contracts, pagination
-        except Exception as e:
-            if isinstance(e, ApiException):
-                raise self._handle_error(e)
-            raise
+        except ApiException as e:
+            raise self._handle_error(e) from e
 
     def create(
         self,
@@ -138,10 +133,8 @@ class ContractWhitelistingService(BaseService):
 
             reply = self._api.whitelist_service_create_whitelisted_contract(body=body)
             return int(reply.result) if reply.result else 0
-        except Exception as e:
-            if isinstance(e, ApiException):
-                raise self._handle_error(e)
-            raise
+        except ApiException as e:
+            raise self._handle_error(e) from e
 
     def delete(self, contract_id: int) -> None:
         """Delete a whitelisted contract."""
@@ -150,10 +143,8 @@ class ContractWhitelistingService(BaseService):
 
         try:
             self._api.whitelist_service_delete_whitelisted_contract(str(contract_id))
-        except Exception as e:
-            if isinstance(e, ApiException):
-                raise self._handle_error(e)
-            raise
+        except ApiException as e:
+            raise self._handle_error(e) from e
 
     def approve_whitelisted_contracts(
         self,
@@ -192,10 +183,8 @@ class ContractWhitelistingService(BaseService):
             )
 
             self._api.whitelist_service_approve_whitelisted_contract(body=body)
-        except Exception as e:
-            if isinstance(e, ApiException):
-                raise self._handle_error(e)
-            raise
+        except ApiException as e:
+            raise self._handle_error(e) from e
 
     def create_attribute(
         self,
@@ -239,10 +228,8 @@ class ContractWhitelistingService(BaseService):
                 whitelisted_contract_address_id=contract_id,
                 body=body,
             )
-        except Exception as e:
-            if isinstance(e, ApiException):
-                raise self._handle_error(e)
-            raise
+        except ApiException as e:
+            raise self._handle_error(e) from e
 
     def get_attribute(
         self,
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, List, Optional
 
-from taurus_protect.errors import NotFoundError
+from taurus_protect.errors import APIError, NotFoundError
 from taurus_protect.mappers.currency import currencies_from_dto, currency_from_dto
 from taurus_protect.models.currency import Currency
 from taurus_protect.services._base import BaseService
@@ -78,11 +78,9 @@ class CurrencyService(BaseService):
 
             result = getattr(resp, "currencies", None) or getattr(resp, "result", None)
             return currencies_from_dto(result) if result else []
+        except APIError:
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, APIError):
-                raise
             raise self._handle_error(e) from e
 
     def get(self, currency_id: str) -> Currency:
@@ -116,11 +114,9 @@ class CurrencyService(BaseService):
             raise NotFoundError(f"Currency with id '{currency_id}' not found")
         except NotFoundError:
             raise
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def get_by_blockchain(
@@ -177,11 +173,9 @@ class CurrencyService(BaseService):
             return currency
         except NotFoundError:
             raise
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def get_base_currency(self) -> Currency:
@@ -210,9 +204,7 @@ class CurrencyService(BaseService):
             return currency
         except NotFoundError:
             raise
+        except APIError:
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, APIError):
-                raise
             raise self._handle_error(e) from e
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
+from taurus_protect.errors import APIError, NotFoundError
 from taurus_protect.mappers._base import safe_bool, safe_datetime, safe_string
 from taurus_protect.models.blockchain import Exchange
 from taurus_protect.models.pagination import Pagination
@@ -143,9 +144,7 @@ class ExchangeService(BaseService):
             cursor = getattr(resp, "cursor", None)
             total_items = None
             if cursor:
-                total_items = getattr(cursor, "total_items", None) or getattr(
-                    cursor, "totalItems", None
-                )
+                total_items = self._total_items(cursor) or getattr(cursor, "totalItems", None)
 
             pagination = self._extract_pagination(
                 total_items=total_items,
@@ -154,11 +153,9 @@ class ExchangeService(BaseService):
             )
 
             return exchanges, pagination
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def get(self, exchange_id: str) -> Exchange:
@@ -187,22 +184,16 @@ class ExchangeService(BaseService):
                 or getattr(resp, "exchangeAccount", None)
             )
             if result is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Exchange account {exchange_id} not found")
 
             exchange = exchange_from_dto(result)
             if exchange is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Exchange account {exchange_id} not found")
 
             return exchange
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def list_counterparties(self) -> List[Any]:
@@ -220,11 +211,9 @@ class ExchangeService(BaseService):
 
             result = getattr(resp, "result", None) or getattr(resp, "exchanges", None)
             return result or []
+        except APIError:
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, APIError):
-                raise
             raise self._handle_error(e) from e
 
     def get_withdrawal_fee(
@@ -258,9 +247,7 @@ class ExchangeService(BaseService):
             )
 
             return getattr(resp, "result", None) or getattr(resp, "fee", None) or resp
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
@@ -5,6 +5,7 @@ from __future__ import annotations
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
+from taurus_protect.errors import APIError, NotFoundError
 from taurus_protect.models.pagination import Pagination
 from taurus_protect.models.staking import FeePayer
 from taurus_protect.services._base import BaseService
@@ -107,18 +108,16 @@ class FeePayerService(BaseService):
                     fee_payers.append(fee_payer)
 
             pagination = self._extract_pagination(
-                total_items=getattr(resp, "total_items", None),
+                total_items=self._total_items(resp),
                 offset=getattr(resp, "offset", None),
                 limit=limit,
             )
 
             return fee_payers, pagination
 
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def get(self, fee_payer_id: str) -> FeePayer:
@@ -149,23 +148,17 @@ class FeePayerService(BaseService):
             result = getattr(resp, "result", None) or getattr(resp, "fee_payer", resp)
 
             if result is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Fee payer {fee_payer_id} not found")
 
             fee_payer = self._map_fee_payer(result)
             if fee_payer is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Fee payer {fee_payer_id} not found")
 
             return fee_payer
 
+        except (APIError, ValueError, NotFoundError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError, NotFoundError
-
-            if isinstance(e, (APIError, ValueError, NotFoundError)):
-                raise
             raise self._handle_error(e) from e
 
     def _map_fee_payer(self, dto: Any) -> Optional[FeePayer]:
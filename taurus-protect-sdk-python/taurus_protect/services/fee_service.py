@@ -5,6 +5,7 @@ from __future__ import annotations
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, List, Optional
 
+from taurus_protect.errors import APIError
 from taurus_protect.models.staking import FeeEstimate
 from taurus_protect.services._base import BaseService
 
@@ -106,11 +107,9 @@ class FeeService(BaseService):
             # Return empty estimate if currency not found
             return FeeEstimate(currency=currency)
 
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def list(self) -> List[FeeEstimate]:
@@ -157,11 +156,9 @@ class FeeService(BaseService):
 
             return estimates
 
+        except APIError:
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, APIError):
-                raise
             raise self._handle_error(e) from e
 
     def _map_fee_estimate(
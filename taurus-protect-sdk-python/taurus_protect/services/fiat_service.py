@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
+from taurus_protect.errors import APIError, NotFoundError
 from taurus_protect.mappers._base import safe_bool, safe_int, safe_string
 from taurus_protect.models.blockchain import ExchangeRate, FiatCurrency, FiatProviderAccount
 from taurus_protect.models.pagination import Pagination
@@ -156,17 +157,15 @@ class FiatService(BaseService):
             accounts = fiat_provider_accounts_from_dto(result) if result else []
 
             pagination = self._extract_pagination(
-                total_items=getattr(resp, "total_items", None) or getattr(resp, "totalItems", None),
+                total_items=self._total_items(resp) or getattr(resp, "totalItems", None),
                 offset=getattr(resp, "offset", None),
                 limit=limit,
             )
 
             return accounts, pagination
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def get_account(self, account_id: str) -> FiatProviderAccount:
@@ -191,22 +190,16 @@ class FiatService(BaseService):
 
             result = getattr(resp, "result", None) or getattr(resp, "account", None)
             if result is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Fiat provider account {account_id} not found")
 
             account = fiat_provider_account_from_dto(result)
             if account is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Fiat provider account {account_id} not found")
 
             return account
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def get_base_currency(self) -> FiatCurrency:
@@ -232,11 +225,9 @@ class FiatService(BaseService):
                 return FiatCurrency(id="USD", code="USD", name="US Dollar", symbol="$")
 
             return currency
+        except APIError:
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, APIError):
-                raise
             raise self._handle_error(e) from e
 
     def get_rate(self, from_currency: str, to_currency: str) -> ExchangeRate:
@@ -300,16 +291,12 @@ class FiatService(BaseService):
                     pass
 
             # If rate not found, return a placeholder
-            from taurus_protect.errors import NotFoundError
-
             raise NotFoundError(
                 f"Exchange rate from {from_currency} to {to_currency} not available"
             )
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def list_providers(self) -> List[Any]:
@@ -327,9 +314,7 @@ class FiatService(BaseService):
 
             result = getattr(resp, "result", None) or getattr(resp, "providers", None)
             return result or []
+        except APIError:
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, APIError):
-                raise
             raise self._handle_error(e) from e
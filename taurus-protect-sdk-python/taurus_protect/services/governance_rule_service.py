@@ -75,10 +75,8 @@ class GovernanceRuleService(BaseService):
             return self.verify_governance_rules(rules)
         except IntegrityError:
             raise
-        except Exception as e:
-            if isinstance(e, ApiException):
-                raise self._handle_error(e)
-            raise
+        except ApiException as e:
+            raise self._handle_error(e) from e
 
     def get_rules_by_id(self, rules_id: str) -> Optional[GovernanceRules]:
         """
@@ -107,10 +105,8 @@ class GovernanceRuleService(BaseService):
             return self.verify_governance_rules(rules)
         except IntegrityError:
             raise
-        except Exception as e:
-            if isinstance(e, ApiException):
-                raise self._handle_error(e)
-            raise
+        except ApiException as e:
+            raise self._handle_error(e) from e
 
     def get_rules_proposal(self) -> Optional[GovernanceRules]:
         """
@@ -132,10 +128,8 @@ class GovernanceRuleService(BaseService):
 
             # Proposal rules are not verified
             return self._map_rules_from_dto(result)
-        except Exception as e:
-            if isinstance(e, ApiException):
-                raise self._handle_error(e)
-            raise
+        except ApiException as e:
+            raise self._handle_error(e) from e
 
     def get_rules_history(
         self, page_size: int = 50, cursor: Optional[str] = None
@@ -177,12 +171,10 @@ class GovernanceRuleService(BaseService):
             return GovernanceRulesHistoryResult(
                 rules=rules_list,
                 cursor=next_cursor,
-                total_items=getattr(reply, "total_items", None) or None,
+                total_items=self._total_items(reply) or None,
             )
-        except Exception as e:
-            if isinstance(e, ApiException):
-                raise self._handle_error(e)
-            raise
+        except ApiException as e:
+            raise self._handle_error(e) from e
 
     def get_public_keys(self) -> List[SuperAdminPublicKey]:
         """
@@ -211,10 +203,8 @@ class GovernanceRuleService(BaseService):
                     )
 
             return result
-        except Exception as e:
-            if isinstance(e, ApiException):
-                raise self._handle_error(e)
-            raise
+        except ApiException as e:
+            raise self._handle_error(e) from e
 
     def verify_governance_rules(self, rules: GovernanceRules) -> GovernanceRules:
         """
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
+from taurus_protect.errors import APIError, NotFoundError
 from taurus_protect.mappers.user import group_from_dto, groups_from_dto
 from taurus_protect.models.pagination import Pagination
 from taurus_protect.models.user import Group
@@ -71,22 +72,16 @@ class GroupService(BaseService):
 
             result = getattr(resp, "result", None)
             if result is None or len(result) == 0:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Group {group_id} not found")
 
             group = group_from_dto(result[0])
             if group is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Group {group_id} not found")
 
             return group
+        except (APIError, NotFoundError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError, NotFoundError
-
-            if isinstance(e, (APIError, NotFoundError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def list(
@@ -126,15 +121,13 @@ class GroupService(BaseService):
             groups = groups_from_dto(result) if result else []
 
             pagination = self._extract_pagination(
-                total_items=getattr(resp, "total_items", None),
+                total_items=self._total_items(resp),
                 offset=offset,
                 limit=limit,
             )
 
             return groups, pagination
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
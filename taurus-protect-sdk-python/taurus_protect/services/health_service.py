@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+from taurus_protect.errors import APIError
 from taurus_protect.services._base import BaseService
 
 if TYPE_CHECKING:
@@ -148,12 +149,10 @@ class HealthService(BaseService):
                 version=version,
                 message=message,
             )
-        except Exception as e:
+        except APIError as e:
             # If health check fails, return unhealthy status
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, APIError):
-                return HealthStatus(status="unhealthy", message=str(e))
+            return HealthStatus(status="unhealthy", message=str(e))
+        except Exception as e:
             raise self._handle_error(e) from e
 
     def get_all_health_checks(
@@ -187,11 +186,9 @@ class HealthService(BaseService):
             components = self._map_components(components_dto)
 
             return GetAllHealthChecksResult(components=components)
+        except APIError:
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, APIError):
-                raise
             raise self._handle_error(e) from e
 
     def _map_components(
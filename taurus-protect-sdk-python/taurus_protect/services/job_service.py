@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
+from taurus_protect.errors import APIError, NotFoundError
 from taurus_protect.mappers.audit import job_from_dto, jobs_from_dto
 from taurus_protect.models.audit import Job
 from taurus_protect.models.pagination import Pagination
@@ -82,11 +83,9 @@ class JobService(BaseService):
             )
 
             return paged_jobs, pagination
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def get(self, job_id: str) -> Job:
@@ -111,20 +110,14 @@ class JobService(BaseService):
 
             result = getattr(resp, "result", None)
             if result is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Job {job_id} not found")
 
             job = job_from_dto(result)
             if job is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Job {job_id} not found")
 
             return job
+        except (APIError, NotFoundError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError, NotFoundError
-
-            if isinstance(e, (APIError, NotFoundError, ValueError)):
-                raise
             raise self._handle_error(e) from e
@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
 from taurus_protect._internal.openapi.exceptions import ApiException
+from taurus_protect.errors import NotFoundError
 from taurus_protect.models.pagination import Pagination
 from taurus_protect.services._base import BaseService
 
@@ -62,14 +63,10 @@ class MultiFactorSignatureService(BaseService):
             reply = self._api.multi_factor_signature_service_get_challenge(challenge_id)
             result = reply.result
             if result is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Challenge {challenge_id} not found")
             return self._map_challenge_from_dto(result)
-        except Exception as e:
-            if isinstance(e, ApiException):
-                raise self._handle_error(e)
-            raise
+        except ApiException as e:
+            raise self._handle_error(e) from e
 
     def list_challenges(
         self,
@@ -96,15 +93,13 @@ class MultiFactorSignatureService(BaseService):
                     challenges.append(self._map_challenge_from_dto(dto))
 
             pagination = self._extract_pagination(
-                getattr(reply, "total_items", None),
+                self._total_items(reply),
                 offset,
                 limit,
             )
             return challenges, pagination
-        except Exception as e:
-            if isinstance(e, ApiException):
-                raise self._handle_error(e)
-            raise
+        except ApiException as e:
+            raise self._handle_error(e) from e
 
     def create_challenge(
         self,
@@ -128,10 +123,8 @@ class MultiFactorSignatureService(BaseService):
 
             reply = self._api.multi_factor_signature_service_create_challenge(body=body)
             return reply.result or ""
-        except Exception as e:
-            if isinstance(e, ApiException):
-                raise self._handle_error(e)
-            raise
+        except ApiException as e:
+            raise self._handle_error(e) from e
 
     def verify_challenge(
         self,
@@ -154,10 +147,8 @@ class MultiFactorSignatureService(BaseService):
 
             reply = self._api.multi_factor_signature_service_verify_challenge(body=body)
             return getattr(reply, "verified", False)
-        except Exception as e:
-            if isinstance(e, ApiException):
-                raise self._handle_error(e)
-            raise
+        except ApiException as e:
+            raise self._handle_error(e) from e
 
     @staticmethod
     def _map_challenge_from_dto(dto: Any) -> MultiFactorSignatureChallenge:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, List, Optional
 
+from taurus_protect.errors import APIError
 from taurus_protect.mappers.statistics import (
     price_history_from_dto,
     prices_from_dto,
@@ -84,11 +85,9 @@ class PriceService(BaseService):
                 ]
 
             return prices
+        except APIError:
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, APIError):
-                raise
             raise self._handle_error(e) from e
 
     def get_historical(
@@ -140,9 +139,7 @@ class PriceService(BaseService):
 
             result = getattr(resp, "result", None)
             return price_history_from_dto(result) if result else []
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
@@ -12,6 +12,7 @@ from cryptography.hazmat.primitives.asymmetric.ec import EllipticCurvePrivateKey
 
 from taurus_protect.crypto.hashing import calculate_hex_hash
 from taurus_protect.crypto.signing import sign_data
+from taurus_protect.errors import APIError, IntegrityError, NotFoundError
 from taurus_protect.mappers.request import request_from_dto, requests_from_dto
 from taurus_protect.models.pagination import Pagination
 from taurus_protect.models.request import (
@@ -92,25 +93,19 @@ class RequestService(BaseService):
 
             result = getattr(resp, "result", None)
             if result is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Request {request_id} not found")
 
             request = request_from_dto(result)
             if request is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Request {request_id} not found")
 
             # Mandatory hash verification
             self._verify_request_hash(request)
 
             return request
+        except (APIError, IntegrityError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError, IntegrityError
-
-            if isinstance(e, (APIError, IntegrityError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def list(
@@ -165,17 +160,15 @@ class RequestService(BaseService):
             requests = requests_from_dto(result) if result else []
 
             # Extract pagination from total_items
-            total_items = getattr(resp, "total_items", None)
+            total_items = self._total_items(resp)
             pagination = None
             if total_items is not None:
                 pagination = self._extract_pagination(total_items, offset, limit)
 
             return requests, pagination
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def get_for_approval(
@@ -221,15 +214,13 @@ class RequestService(BaseService):
             cursor = getattr(resp, "cursor", None)
             pagination = None
             if cursor is not None:
-                total = getattr(cursor, "total_items", None)
+                total = self._total_items(cursor)
                 pagination = self._extract_pagination(total, offset, limit)
 
             return requests, pagination
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def approve_requests(
@@ -292,11 +283,9 @@ class RequestService(BaseService):
             if signed_requests is not None:
                 return int(signed_requests)
             return 0
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def approve_request(
@@ -348,11 +337,9 @@ class RequestService(BaseService):
                 "comment": comment,
             }
             self._requests_api.request_service_reject_requests(body=body)
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def reject_request(
@@ -412,22 +399,16 @@ class RequestService(BaseService):
 
             result = getattr(resp, "result", None)
             if result is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to create request: no result returned")
 
             request = request_from_dto(result)
             if request is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to create request: invalid response")
 
             return request
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def create_internal_transfer_from_wallet(
@@ -469,16 +450,12 @@ class RequestService(BaseService):
 
             result = getattr(resp, "result", None)
             if result is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to create request: no result returned")
 
             return request_from_dto(result)
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def create_external_transfer(
@@ -520,16 +497,12 @@ class RequestService(BaseService):
 
             result = getattr(resp, "result", None)
             if result is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to create request: no result returned")
 
             return request_from_dto(result)
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def create_external_transfer_from_wallet(
@@ -571,16 +544,12 @@ class RequestService(BaseService):
 
             result = getattr(resp, "result", None)
             if result is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to create request: no result returned")
 
             return request_from_dto(result)
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def create_cancel_request(
@@ -616,16 +585,12 @@ class RequestService(BaseService):
 
             result = getattr(resp, "result", None)
             if result is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to create cancel request: no result")
 
             return request_from_dto(result)
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def create_incoming_request(
@@ -667,16 +632,12 @@ class RequestService(BaseService):
 
             result = getattr(resp, "result", None)
             if result is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to create incoming request: no result")
 
             return request_from_dto(result)
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def _verify_request_hash(self, request: Request) -> None:
@@ -700,8 +661,6 @@ class RequestService(BaseService):
 
         if not payload:
             if provided_hash:
-                from taurus_protect.errors import IntegrityError
-
                 raise IntegrityError(
                     "request hash verification failed: hash exists but payload is missing"
                 )
@@ -712,14 +671,10 @@ class RequestService(BaseService):
 
         # Explicit null check before constant-time comparison
         if provided_hash is None:
-            from taurus_protect.errors import IntegrityError
-
             raise IntegrityError("request hash verification failed: provided hash is null")
 
         # Use constant-time comparison to prevent timing attacks
         if not hmac.compare_digest(computed_hash, provided_hash):
-            from taurus_protect.errors import IntegrityError
-
             raise IntegrityError(
                 f"request hash verification failed: computed={computed_hash}, provided={provided_hash}"
             )
@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
 from taurus_protect._internal.openapi.exceptions import ApiException
+from taurus_protect.errors import NotFoundError
 from taurus_protect.models.pagination import Pagination
 from taurus_protect.services._base import BaseService
 
@@ -60,14 +61,10 @@ class ReservationService(BaseService):
             reply = self._api.reservation_service_get_reservation(str(reservation_id))
             result = reply.result
             if result is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Reservation {reservation_id} not found")
             return self._map_reservation_from_dto(result)
-        except Exception as e:
-            if isinstance(e, ApiException):
-                raise self._handle_error(e)
-            raise
+        except ApiException as e:
+            raise self._handle_error(e) from e
 
     def list(
         self,
@@ -94,15 +91,13 @@ class ReservationService(BaseService):
                     reservations.append(self._map_reservation_from_dto(dto))
 
             pagination = self._extract_pagination(
-                getattr(reply, "total_items", None),
+                self._total_items(reply),
                 offset,
                 limit,
             )
             return reservations, pagination
-        except Exception as e:
-            if isinstance(e, ApiException):
-                raise self._handle_error(e)
-            raise
+        except ApiException as e:
+            raise self._handle_error(e) from e
 
     def cancel(self, reservation_id: int) -> None:
         """Cancel a reservation."""
@@ -111,10 +106,8 @@ class ReservationService(BaseService):
 
         try:
             self._api.reservation_service_cancel_reservation(str(reservation_id))
-        except Exception as e:
-            if isinstance(e, ApiException):
-                raise self._handle_error(e)
-            raise
+        except ApiException as e:
+            raise self._handle_error(e) from e
 
     @staticmethod
     def _map_reservation_from_dto(dto: Any) -> Reservation:
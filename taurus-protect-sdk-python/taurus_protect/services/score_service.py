@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, List, Optional
 
+from taurus_protect.errors import APIError
 from taurus_protect.mappers.statistics import scores_from_dto
 from taurus_protect.models.statistics import Score
 from taurus_protect.services._base import BaseService
@@ -87,11 +88,9 @@ class ScoreService(BaseService):
 
             scores_list = getattr(resp, "scores", None)
             return scores_from_dto(scores_list) if scores_list else []
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def get_transaction_score(
@@ -191,9 +190,7 @@ class ScoreService(BaseService):
 
             scores_list = getattr(resp, "scores", None)
             return scores_from_dto(scores_list) if scores_list else []
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
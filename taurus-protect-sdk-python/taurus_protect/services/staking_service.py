@@ -5,6 +5,7 @@ from __future__ import annotations
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
+from taurus_protect.errors import APIError
 from taurus_protect.models.pagination import Pagination
 from taurus_protect.models.staking import StakingInfo, Validator
 from taurus_protect.services._base import BaseService
@@ -147,11 +148,9 @@ class StakingService(BaseService):
 
             return paginated_validators, pagination
 
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def _map_eth_validators(
@@ -281,11 +280,9 @@ class StakingService(BaseService):
 
             return StakingInfo(address_id=str(address_id))
 
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def _map_staking_info_from_dto(self, dto: Any, address_id: int) -> StakingInfo:
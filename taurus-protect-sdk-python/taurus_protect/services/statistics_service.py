@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
+from taurus_protect.errors import APIError
 from taurus_protect.mappers.statistics import portfolio_statistics_from_dto
 from taurus_protect.models.statistics import PortfolioStatistics, TransactionStatistics
 from taurus_protect.services._base import BaseService
@@ -70,11 +71,9 @@ class StatisticsService(BaseService):
 
             result = getattr(resp, "result", None)
             return portfolio_statistics_from_dto(result)
+        except APIError:
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, APIError):
-                raise
             raise self._handle_error(e) from e
 
     def get_transaction_stats(
@@ -135,9 +134,7 @@ class StatisticsService(BaseService):
                 incoming_volume="0",
                 outgoing_volume="0",
             )
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, List, Optional
 
+from taurus_protect.errors import APIError, NotFoundError
 from taurus_protect.mappers.user import tag_from_dto, tags_from_dto
 from taurus_protect.models.user import Tag
 from taurus_protect.services._base import BaseService
@@ -76,22 +77,16 @@ class TagService(BaseService):
 
             result = getattr(resp, "result", None)
             if result is None or len(result) == 0:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Tag {tag_id} not found")
 
             tag = tag_from_dto(result[0])
             if tag is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Tag {tag_id} not found")
 
             return tag
+        except (APIError, NotFoundError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError, NotFoundError
-
-            if isinstance(e, (APIError, NotFoundError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def list(
@@ -133,11 +128,9 @@ class TagService(BaseService):
 
             # Apply client-side pagination since API doesn't support it
             return tags[offset : offset + limit]
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def create(self, name: str, color: str) -> Tag:
@@ -168,22 +161,16 @@ class TagService(BaseService):
 
             result = getattr(resp, "result", None)
             if result is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to create tag: no result returned")
 
             tag = tag_from_dto(result)
             if tag is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to create tag: invalid response")
 
             return tag
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def delete(self, tag_id: str) -> None:
@@ -204,9 +191,7 @@ class TagService(BaseService):
 
         try:
             self._tags_api.tag_service_delete_tag(id=tag_id)
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
@@ -41,10 +41,12 @@ from taurus_protect.services.taurus_network.sharing_service import (
     ListSharedAssetsOptions,
     ShareAddressRequest,
     SharedAddress,
+    SharedAddressBatch,
     SharedAddressTrail,
     SharedAsset,
     ShareWhitelistedAssetRequest,
     SharingService,
+    serialize_shared_addresses,
 )
 
 __all__ = [
@@ -85,8 +87,10 @@ __all__ = [
     "ListSharedAssetsOptions",
     "ShareAddressRequest",
     "SharedAddress",
+    "SharedAddressBatch",
     "SharedAddressTrail",
     "SharedAsset",
     "ShareWhitelistedAssetRequest",
+    "serialize_shared_addresses",
     "SharingService",
 ]
@@ -6,6 +6,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
+from taurus_protect.errors import APIError, NotFoundError
 from taurus_protect.services._base import BaseService
 
 if TYPE_CHECKING:
@@ -636,24 +637,16 @@ class LendingService(BaseService):
 
             result = getattr(resp, "result", None)
             if result is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Lending agreement {lending_agreement_id} not found")
 
             agreement = _lending_agreement_from_dto(result)
             if agreement is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Lending agreement {lending_agreement_id} not found")
 
             return agreement
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if type(e).__name__ == "ApiException":
-                raise self._handle_error(e) from e
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def list_lending_agreements(
@@ -701,13 +694,9 @@ class LendingService(BaseService):
                 )
 
             return agreements, pagination
+        except APIError:
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if type(e).__name__ == "ApiException":
-                raise self._handle_error(e) from e
-            if isinstance(e, APIError):
-                raise
             raise self._handle_error(e) from e
 
     def list_lending_agreements_for_approval(
@@ -755,13 +744,9 @@ class LendingService(BaseService):
                 )
 
             return agreements, pagination
+        except APIError:
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if type(e).__name__ == "ApiException":
-                raise self._handle_error(e) from e
-            if isinstance(e, APIError):
-                raise
             raise self._handle_error(e) from e
 
     def create_lending_agreement(self, request: CreateLendingAgreementRequest) -> str:
@@ -824,13 +809,9 @@ class LendingService(BaseService):
 
             # Check for id directly on response
             return getattr(resp, "id", "") or ""
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if type(e).__name__ == "ApiException":
-                raise self._handle_error(e) from e
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def update_lending_agreement(
@@ -865,13 +846,9 @@ class LendingService(BaseService):
             self._lending_api.taurus_network_service_update_lending_agreement(
                 lending_agreement_id, body=body
             )
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if type(e).__name__ == "ApiException":
-                raise self._handle_error(e) from e
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def repay_lending_agreement(
@@ -905,13 +882,9 @@ class LendingService(BaseService):
             self._lending_api.taurus_network_service_repay_lending_agreement(
                 lending_agreement_id, body=body
             )
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if type(e).__name__ == "ApiException":
-                raise self._handle_error(e) from e
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def cancel_lending_agreement(self, lending_agreement_id: str) -> None:
@@ -933,13 +906,9 @@ class LendingService(BaseService):
             self._lending_api.taurus_network_service_cancel_lending_agreement(
                 lending_agreement_id, body={}
             )
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if type(e).__name__ == "ApiException":
-                raise self._handle_error(e) from e
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     # =========================================================================
@@ -990,13 +959,9 @@ class LendingService(BaseService):
 
             # Check for id directly on response
             return getattr(resp, "id", "") or ""
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if type(e).__name__ == "ApiException":
-                raise self._handle_error(e) from e
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def list_lending_agreement_attachments(
@@ -1031,13 +996,9 @@ class LendingService(BaseService):
                         attachments.append(attachment)
 
             return attachments
+        except APIError:
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if type(e).__name__ == "ApiException":
-                raise self._handle_error(e) from e
-            if isinstance(e, APIError):
-                raise
             raise self._handle_error(e) from e
 
     # =========================================================================
@@ -1067,24 +1028,16 @@ class LendingService(BaseService):
             # Offer is directly in lending_offer field
             result = getattr(resp, "lending_offer", None)
             if result is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Lending offer {offer_id} not found")
 
             offer = _lending_offer_from_dto(result)
             if offer is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Lending offer {offer_id} not found")
 
             return offer
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if type(e).__name__ == "ApiException":
-                raise self._handle_error(e) from e
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def list_lending_offers(
@@ -1135,13 +1088,9 @@ class LendingService(BaseService):
                 )
 
             return offers, pagination
+        except APIError:
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if type(e).__name__ == "ApiException":
-                raise self._handle_error(e) from e
-            if isinstance(e, APIError):
-                raise
             raise self._handle_error(e) from e
 
     def create_lending_offer(self, request: CreateLendingOfferRequest) -> str:
@@ -1194,13 +1143,9 @@ class LendingService(BaseService):
 
             # Check for id directly on response
             return getattr(resp, "id", "") or ""
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if type(e).__name__ == "ApiException":
-                raise self._handle_error(e) from e
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def delete_lending_offer(self, offer_id: str) -> None:
@@ -1218,13 +1163,9 @@ class LendingService(BaseService):
 
         try:
             self._lending_api.taurus_network_service_delete_lending_offer(offer_id)
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if type(e).__name__ == "ApiException":
-                raise self._handle_error(e) from e
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def delete_lending_offers(self) -> None:
@@ -1236,13 +1177,9 @@ class LendingService(BaseService):
         """
         try:
             self._lending_api.taurus_network_service_delete_lending_offers()
+        except APIError:
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if type(e).__name__ == "ApiException":
-                raise self._handle_error(e) from e
-            if isinstance(e, APIError):
-                raise
             raise self._handle_error(e) from e
 
     # =========================================================================
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import Any, List, Optional
 
+from taurus_protect.errors import APIError, NotFoundError
 from taurus_protect.mappers.taurus_network.participant import (
     my_participant_from_dto,
     participant_from_dto,
@@ -18,9 +19,6 @@ from taurus_protect.models.taurus_network.participant import (
 )
 from taurus_protect.services._base import BaseService
 
-if TYPE_CHECKING:
-    from taurus_protect._internal.openapi.exceptions import ApiException
-
 
 class ParticipantService(BaseService):
     """
@@ -78,19 +76,12 @@ class ParticipantService(BaseService):
 
             result = my_participant_from_dto(resp)
             if result is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError("My participant not found")
 
             return result
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect._internal.openapi.exceptions import ApiException
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
-            if isinstance(e, ApiException):
-                raise self._handle_error(e) from e
             raise self._handle_error(e) from e
 
     def get(
@@ -128,25 +119,16 @@ class ParticipantService(BaseService):
 
             result = getattr(resp, "result", None)
             if result is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Participant {participant_id} not found")
 
             participant = participant_from_dto(result)
             if participant is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Participant {participant_id} not found")
 
             return participant
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect._internal.openapi.exceptions import ApiException
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
-            if isinstance(e, ApiException):
-                raise self._handle_error(e) from e
             raise self._handle_error(e) from e
 
     def list(
@@ -182,14 +164,9 @@ class ParticipantService(BaseService):
 
             result = getattr(resp, "result", None)
             return participants_from_dto(result) if result else []
+        except APIError:
+            raise
         except Exception as e:
-            from taurus_protect._internal.openapi.exceptions import ApiException
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, APIError):
-                raise
-            if isinstance(e, ApiException):
-                raise self._handle_error(e) from e
             raise self._handle_error(e) from e
 
     def create_participant_attribute(
@@ -249,14 +226,9 @@ class ParticipantService(BaseService):
                 participant_id=participant_id,
                 body=body,
             )
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect._internal.openapi.exceptions import ApiException
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
-            if isinstance(e, ApiException):
-                raise self._handle_error(e) from e
             raise self._handle_error(e) from e
 
     def delete_participant_attribute(
@@ -291,12 +263,7 @@ class ParticipantService(BaseService):
                 participant_id=participant_id,
                 attribute_id=attribute_id,
             )
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect._internal.openapi.exceptions import ApiException
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
-            if isinstance(e, ApiException):
-                raise self._handle_error(e) from e
             raise self._handle_error(e) from e
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from cryptography.hazmat.primitives.asymmetric.ec import EllipticCurvePrivateKey
 
 from taurus_protect.crypto.hashing import calculate_hex_hash
 from taurus_protect.crypto.signing import sign_data
+from taurus_protect.errors import APIError, NotFoundError
 from taurus_protect.mappers.taurus_network.pledge import (
     pledge_action_from_dto,
     pledge_actions_from_dto,
@@ -33,11 +36,19 @@ from taurus_protect.models.taurus_network.pledge import (
     UpdatePledgeRequest,
     WithdrawPledgeRequest,
 )
-from taurus_protect.services._base import BaseService
+from taurus_protect.services._base import (
+    BaseService,
+    CursorPage,
+    api_call,
+    iter_prefetched_pages,
+    next_cursor_page,
+)
 
 if TYPE_CHECKING:
     pass  # For OpenAPI types when available
 
+_action_id = attrgetter("id")
+
 
 class PledgeService(BaseService):
     """
@@ -97,24 +108,15 @@ class PledgeService(BaseService):
         try:
             resp = self._pledge_api.taurus_network_service_get_pledge(pledge_id)
 
-            result = getattr(resp, "result", None)
-            if result is None:
-                from taurus_protect.errors import NotFoundError
-
-                raise NotFoundError(f"Pledge {pledge_id} not found")
-
-            pledge = pledge_from_dto(result)
+            # pledge_from_dto returns None exactly when the reply has no result
+            pledge = pledge_from_dto(getattr(resp, "result", None))
             if pledge is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Pledge {pledge_id} not found")
 
             return pledge
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def list_pledges(
@@ -136,31 +138,50 @@ class PledgeService(BaseService):
         options = opts or ListPledgesOptions()
 
         try:
-            resp = self._pledge_api.taurus_network_service_get_pledges(
-                statuses=options.statuses if options.statuses else None,
-                currency_id=options.currency_id if options.currency_id else None,
-                owner_participant_id=options.participant_id if options.participant_id else None,
-                sort_order=options.direction if options.direction else None,
-                cursor_page_size=str(options.limit) if options.limit > 0 else None,
-            )
+            resp = self._pledge_api.taurus_network_service_get_pledges(**options._query_params)
 
             result = getattr(resp, "result", None)
             pledges = pledges_from_dto(result) if result else []
 
             pagination = self._extract_pagination(
-                total_items=getattr(resp, "total_items", None),
+                total_items=self._total_items(resp),
                 offset=getattr(resp, "offset", None),
                 limit=options.limit,
             )
 
             return pledges, pagination
+        except APIError:
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, APIError):
-                raise
             raise self._handle_error(e) from e
 
+    def iter_pledges(
+        self,
+        opts: Optional[ListPledgesOptions] = None,
+    ) -> Iterator[Pledge]:
+        """
+        Iterate over all pledges matching the filters, one page at a time.
+
+        Pages of ``opts.limit`` pledges are fetched with the API cursor, the
+        next page in the background while the caller processes the current one.
+
+        Args:
+            opts: Optional filtering options; ``limit`` is the page size.
+
+        Yields:
+            Pledges in API order.
+
+        Raises:
+            APIError: If an API request fails.
+        """
+        options = opts or ListPledgesOptions()
+        return self._iter_prefetched_pages(
+            self._pledge_api.taurus_network_service_get_pledges,
+            options._query_params,
+            "pledges",
+            pledges_from_dto,
+        )
+
     def create_pledge(
         self,
         req: CreatePledgeRequest,
@@ -182,11 +203,7 @@ class PledgeService(BaseService):
             ValueError: If required fields are missing.
             APIError: If API request fails.
         """
-        if req is None:
-            raise ValueError("request cannot be None")
-        self._validate_required(req.shared_address_id, "shared_address_id")
-        self._validate_required(req.currency_id, "currency_id")
-        self._validate_required(req.amount, "amount")
+        self._validate_create_pledge_request(req)
 
         try:
             # Build request body
@@ -202,16 +219,14 @@ class PledgeService(BaseService):
                 body["externalReferenceId"] = req.external_reference_id
             if req.reconciliation_note:
                 body["reconciliationNote"] = req.reconciliation_note
-            if req.pledge_duration_setup:
-                body["pledgeDurationSetup"] = {}
-                if req.pledge_duration_setup.start_date:
-                    body["pledgeDurationSetup"][
-                        "startDate"
-                    ] = req.pledge_duration_setup.start_date.isoformat()
-                if req.pledge_duration_setup.end_date:
-                    body["pledgeDurationSetup"][
-                        "endDate"
-                    ] = req.pledge_duration_setup.end_date.isoformat()
+            duration_setup = req.pledge_duration_setup
+            if duration_setup:
+                duration: dict[str, str] = {}
+                if duration_setup.start_date:
+                    duration["startDate"] = duration_setup.start_date.isoformat()
+                if duration_setup.end_date:
+                    duration["endDate"] = duration_setup.end_date.isoformat()
+                body["pledgeDurationSetup"] = duration
             if req.key_value_attributes:
                 body["keyValueAttributes"] = [
                     {"key": attr.key, "value": attr.value} for attr in req.key_value_attributes
@@ -221,31 +236,64 @@ class PledgeService(BaseService):
 
             pledge_result = getattr(resp, "result", None)
             if pledge_result is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to create pledge: no result returned")
 
             pledge = pledge_from_dto(pledge_result)
             if pledge is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to create pledge: invalid response")
 
             action_result = getattr(resp, "action", None)
             action = pledge_action_from_dto(action_result)
             if action is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to create pledge: no action returned")
 
             return pledge, action
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
+    def create_pledges(
+        self,
+        reqs: List[CreatePledgeRequest],
+        max_in_flight: int = 16,
+    ) -> List[Tuple[Pledge, PledgeAction]]:
+        """
+        Create several pledges concurrently.
+
+        Issues up to ``max_in_flight`` ``create_pledge`` calls at a time over the
+        client's shared connection pool. All requests are validated before any
+        is sent. Pledges created before a failing call are not rolled back.
+
+        Args:
+            reqs: Pledge creation parameters.
+            max_in_flight: Maximum number of concurrent API calls.
+
+        Returns:
+            List of (created pledge, pledge action) tuples, in input order.
+
+        Raises:
+            ValueError: If any request is invalid or max_in_flight < 1.
+            APIError: If an API request fails.
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        if not reqs:
+            return []
+        for req in reqs:
+            self._validate_create_pledge_request(req)
+
+        with ThreadPoolExecutor(max_workers=min(max_in_flight, len(reqs))) as executor:
+            return list(executor.map(self.create_pledge, reqs))
+
+    def _validate_create_pledge_request(self, req: CreatePledgeRequest) -> None:
+        """Validate the required fields of a pledge creation request."""
+        if req is None:
+            raise ValueError("request cannot be None")
+        self._validate_required(req.shared_address_id, "shared_address_id")
+        self._validate_required(req.currency_id, "currency_id")
+        self._validate_required(req.amount, "amount")
+
     def update_pledge(
         self,
         pledge_id: str,
@@ -287,22 +335,16 @@ class PledgeService(BaseService):
 
             result = getattr(resp, "result", None)
             if result is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to update pledge: no result returned")
 
             pledge = pledge_from_dto(result)
             if pledge is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to update pledge: invalid response")
 
             return pledge
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def add_pledge_collateral(
@@ -342,29 +384,21 @@ class PledgeService(BaseService):
 
             pledge_result = getattr(resp, "result", None)
             if pledge_result is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to add collateral: no result returned")
 
             pledge = pledge_from_dto(pledge_result)
             if pledge is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to add collateral: invalid response")
 
             action_result = getattr(resp, "action", None)
             action = pledge_action_from_dto(action_result)
             if action is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to add collateral: no action returned")
 
             return pledge, action
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def withdraw_pledge(
@@ -411,29 +445,21 @@ class PledgeService(BaseService):
 
             withdrawal_result = getattr(resp, "result", None)
             if withdrawal_result is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to withdraw: no result returned")
 
             withdrawal = pledge_withdrawal_from_dto(withdrawal_result)
             if withdrawal is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to withdraw: invalid response")
 
             action_result = getattr(resp, "action", None)
             action = pledge_action_from_dto(action_result)
             if action is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to withdraw: no action returned")
 
             return withdrawal, action
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def initiate_withdraw_pledge(
@@ -476,29 +502,21 @@ class PledgeService(BaseService):
 
             withdrawal_result = getattr(resp, "result", None)
             if withdrawal_result is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to initiate withdrawal: no result returned")
 
             withdrawal = pledge_withdrawal_from_dto(withdrawal_result)
             if withdrawal is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to initiate withdrawal: invalid response")
 
             action_result = getattr(resp, "action", None)
             action = pledge_action_from_dto(action_result)
             if action is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to initiate withdrawal: no action returned")
 
             return withdrawal, action
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def unpledge(
@@ -530,29 +548,21 @@ class PledgeService(BaseService):
 
             pledge_result = getattr(resp, "result", None)
             if pledge_result is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to unpledge: no result returned")
 
             pledge = pledge_from_dto(pledge_result)
             if pledge is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to unpledge: invalid response")
 
             action_result = getattr(resp, "action", None)
             action = pledge_action_from_dto(action_result)
             if action is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to unpledge: no action returned")
 
             return pledge, action
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def reject_pledge(
@@ -591,22 +601,16 @@ class PledgeService(BaseService):
 
             result = getattr(resp, "result", None)
             if result is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to reject pledge: no result returned")
 
             pledge = pledge_from_dto(result)
             if pledge is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to reject pledge: invalid response")
 
             return pledge
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def list_pledge_actions(
@@ -630,29 +634,60 @@ class PledgeService(BaseService):
         try:
             resp = self._pledge_api.taurus_network_service_get_pledge_actions(
                 statuses=options.statuses,
-                action_types=options.action_types,
-                pledge_id=options.pledge_id,
-                limit=str(options.limit) if options.limit > 0 else None,
-                offset=str(options.offset) if options.offset > 0 else None,
+                **options._query_params,
             )
 
             result = getattr(resp, "result", None)
             actions = pledge_actions_from_dto(result) if result else []
 
             pagination = self._extract_pagination(
-                total_items=getattr(resp, "total_items", None),
+                total_items=self._total_items(resp),
                 offset=getattr(resp, "offset", None),
                 limit=options.limit,
             )
 
             return actions, pagination
+        except APIError:
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, APIError):
-                raise
             raise self._handle_error(e) from e
 
+    def iter_pledge_actions(
+        self,
+        opts: Optional[ListPledgeActionsOptions] = None,
+    ) -> Iterator[PledgeAction]:
+        """
+        Iterate over all pledge actions, one page at a time.
+
+        Pages of ``opts.limit`` actions are fetched with the API cursor only as
+        the caller advances. The endpoint filters by pledge ID only, so the
+        ``statuses`` and ``action_types`` options are applied client-side.
+
+        Args:
+            opts: Optional filtering options; ``limit`` is the page size.
+
+        Yields:
+            Pledge actions in API order.
+
+        Raises:
+            APIError: If an API request fails.
+        """
+        options = opts or ListPledgeActionsOptions()
+        actions = self._iter_prefetched_pages(
+            self._pledge_api.taurus_network_service_get_pledge_actions,
+            {"pledge_id": options.pledge_id, "cursor_page_size": str(options.limit)},
+            "result",
+            pledge_actions_from_dto,
+        )
+        statuses = set(options.statuses) if options.statuses else None
+        action_types = set(options.action_types) if options.action_types else None
+        for action in actions:
+            if statuses is not None and action.status not in statuses:
+                continue
+            if action_types is not None and action.action_type not in action_types:
+                continue
+            yield action
+
     def list_pledge_actions_for_approval(
         self,
         opts: Optional[ListPledgeActionsOptions] = None,
@@ -675,27 +710,22 @@ class PledgeService(BaseService):
 
         try:
             resp = self._pledge_api.taurus_network_service_get_pledge_actions_for_approval(
-                action_types=options.action_types,
-                pledge_id=options.pledge_id,
-                limit=str(options.limit) if options.limit > 0 else None,
-                offset=str(options.offset) if options.offset > 0 else None,
+                **options._query_params
             )
 
             result = getattr(resp, "result", None)
             actions = pledge_actions_from_dto(result) if result else []
 
             pagination = self._extract_pagination(
-                total_items=getattr(resp, "total_items", None),
+                total_items=self._total_items(resp),
                 offset=getattr(resp, "offset", None),
                 limit=options.limit,
             )
 
             return actions, pagination
+        except APIError:
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, APIError):
-                raise
             raise self._handle_error(e) from e
 
     def approve_pledge_actions(
@@ -731,15 +761,23 @@ class PledgeService(BaseService):
             raise ValueError("private_key cannot be None")
 
         # Validate all actions have metadata with hash
+        ids: List[str] = []
         for action in actions:
             if action.metadata is None:
                 raise ValueError("action metadata cannot be None")
             if not action.metadata.hash:
                 raise ValueError("action metadata hash cannot be empty")
+            ids.append(action.id)
 
         try:
-            # Sort actions by ID (string sort, as IDs might be UUIDs)
-            sorted_actions = sorted(actions, key=lambda a: a.id)
+            # Sort actions by ID (string sort, as IDs might be UUIDs).
+            # Freshly listed pages are usually already in order, so only sort
+            # when needed; sorted() is stable, so the result is identical.
+            if all(prev <= cur for prev, cur in zip(ids, ids[1:])):
+                sorted_actions = actions
+            else:
+                sorted_actions = sorted(actions, key=_action_id)
+                ids = [a.id for a in sorted_actions]
 
             # Build concatenated hash string - array of hex hashes
             hashes = [a.metadata.hash for a in sorted_actions]
@@ -750,7 +788,7 @@ class PledgeService(BaseService):
 
             # Build API request
             body = {
-                "ids": [a.id for a in sorted_actions],
+                "ids": ids,
                 "comment": comment,
                 "signature": signature,
             }
@@ -763,11 +801,9 @@ class PledgeService(BaseService):
 
             # If no count returned, assume all were approved
             return len(actions)
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def reject_pledge_actions(
@@ -807,13 +843,51 @@ class PledgeService(BaseService):
 
             # If no count returned, assume all were rejected
             return len(req.ids)
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
+    def iter_pledge_withdrawals(
+        self,
+        opts: Optional[ListPledgeWithdrawalsOptions] = None,
+    ) -> Iterator[PledgeWithdrawal]:
+        """
+        Iterate over all pledge withdrawals, one page at a time.
+
+        Pages of ``opts.limit`` withdrawals are fetched with the API cursor only
+        as the caller advances. A single status is filtered server-side;
+        several statuses are applied client-side.
+
+        Args:
+            opts: Optional filtering options; ``limit`` is the page size.
+
+        Yields:
+            Pledge withdrawals in API order.
+
+        Raises:
+            APIError: If an API request fails.
+        """
+        options = opts or ListPledgeWithdrawalsOptions()
+        statuses = options.statuses or []
+        withdrawals = self._iter_prefetched_pages(
+            self._pledge_api.taurus_network_service_get_pledges_withdrawals,
+            {
+                "pledge_id": options.pledge_id,
+                "withdrawal_status": statuses[0] if len(statuses) == 1 else None,
+                "cursor_page_size": str(options.limit),
+            },
+            "withdrawals",
+            pledge_withdrawals_from_dto,
+        )
+        if len(statuses) <= 1:
+            yield from withdrawals
+            return
+        wanted = set(statuses)
+        for withdrawal in withdrawals:
+            if withdrawal.status in wanted:
+                yield withdrawal
+
     def list_pledge_withdrawals(
         self,
         opts: Optional[ListPledgeWithdrawalsOptions] = None,
@@ -834,25 +908,57 @@ class PledgeService(BaseService):
 
         try:
             resp = self._pledge_api.taurus_network_service_get_pledges_withdrawals(
-                statuses=options.statuses,
-                pledge_id=options.pledge_id,
-                limit=str(options.limit) if options.limit > 0 else None,
-                offset=str(options.offset) if options.offset > 0 else None,
+                **options._query_params
             )
 
             result = getattr(resp, "result", None)
             withdrawals = pledge_withdrawals_from_dto(result) if result else []
 
             pagination = self._extract_pagination(
-                total_items=getattr(resp, "total_items", None),
+                total_items=self._total_items(resp),
                 offset=getattr(resp, "offset", None),
                 limit=options.limit,
             )
 
             return withdrawals, pagination
+        except APIError:
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, APIError):
-                raise
             raise self._handle_error(e) from e
+
+    @api_call(rethrow=(APIError,))
+    def _fetch_page(
+        self,
+        fetch: Callable[..., Any],
+        params: Dict[str, Any],
+        current_page: Optional[str],
+        page_request: Optional[str],
+    ) -> Any:
+        """Fetch one page of a cursor-paginated pledge endpoint."""
+        return fetch(cursor_current_page=current_page, cursor_page_request=page_request, **params)
+
+    def _iter_prefetched_pages(
+        self,
+        fetch: Callable[..., Any],
+        params: Dict[str, Any],
+        items_attr: str,
+        mapper: Callable[[Any], List[Any]],
+    ) -> Iterator[Any]:
+        """
+        Walk a cursor-paginated endpoint, fetching one page ahead.
+
+        Args:
+            fetch: The OpenAPI list method.
+            params: Filter and page size keyword arguments.
+            items_attr: Reply attribute holding the page items.
+            mapper: Converts the page items to domain models.
+
+        Yields:
+            Mapped items, page by page.
+        """
+        first: CursorPage = (None, None)
+        pages = iter_prefetched_pages(
+            lambda page: self._fetch_page(fetch, params, *page), first, next_cursor_page
+        )
+        for resp in pages:
+            yield from mapper(getattr(resp, items_attr, None))
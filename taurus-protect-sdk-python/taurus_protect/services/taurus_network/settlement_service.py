@@ -4,15 +4,33 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
-
-from taurus_protect.services._base import BaseService
+from operator import attrgetter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from taurus_protect.errors import APIError, NotFoundError
+from taurus_protect.services._base import (
+    DATACLASS_SLOTS,
+    BaseService,
+    api_call,
+    int_param,
+    iter_prefetched_pages,
+    next_cursor_page,
+)
 
 if TYPE_CHECKING:
     pass  # For OpenAPI types when available
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SettlementAssetTransfer:
     """
     Asset transfer within a settlement leg.
@@ -28,7 +46,7 @@ class SettlementAssetTransfer:
     amount: str = ""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SettlementClipTransaction:
     """
     A transaction within a settlement clip.
@@ -42,7 +60,7 @@ class SettlementClipTransaction:
     status: str = ""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SettlementClip:
     """
     A clip (execution batch) within a settlement.
@@ -58,7 +76,7 @@ class SettlementClip:
     transactions: List[SettlementClipTransaction] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Settlement:
     """
     A Taurus Network settlement.
@@ -94,7 +112,7 @@ class Settlement:
     updated_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ListSettlementsOptions:
     """
     Options for listing settlements.
@@ -116,7 +134,7 @@ class ListSettlementsOptions:
     page_request: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ListSettlementsForApprovalOptions:
     """
     Options for listing settlements pending approval.
@@ -136,7 +154,7 @@ class ListSettlementsForApprovalOptions:
     page_request: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CreateSettlementRequest:
     """
     Request to create a settlement.
@@ -158,7 +176,7 @@ class CreateSettlementRequest:
     start_execution_date: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CursorPagination:
     """
     Cursor-based pagination information.
@@ -174,62 +192,131 @@ class CursorPagination:
     has_previous: bool = False
 
 
+_CLIP_FIELDS = ("id", "status")
+_ROOT_FIELDS = (
+    "id",
+    "creator_participant_id",
+    "target_participant_id",
+    "first_leg_participant_id",
+    "start_execution_date",
+    "status",
+    "workflow_id",
+    "created_at",
+    "updated_at",
+)
+_get_clip_fields = attrgetter(*_CLIP_FIELDS)
+_get_root_fields = attrgetter(*_ROOT_FIELDS)
+
+
+def _read_fields(
+    dto: Any, getter: Callable[[Any], Tuple[Any, ...]], names: Tuple[str, ...]
+) -> Tuple[Any, ...]:
+    """Read several DTO attributes at once, defaulting missing ones to None."""
+    try:
+        return getter(dto)
+    except AttributeError:
+        return tuple(getattr(dto, name, None) for name in names)
+
+
+def _pagination_from_resp(resp: Any) -> Optional[CursorPagination]:
+    """Extract cursor pagination from a list response."""
+    cursor = getattr(resp, "cursor", None)
+    if not cursor:
+        return None
+    return CursorPagination(
+        current_page=getattr(cursor, "current_page", None),
+        has_next=bool(getattr(cursor, "has_next", False)),
+        has_previous=bool(getattr(cursor, "has_previous", False)),
+    )
+
+
+def _assets_to_payload(assets: List[SettlementAssetTransfer]) -> List[Dict[str, str]]:
+    """Convert settlement asset transfers to the API request shape."""
+    return [
+        {
+            "sharedAddressID": asset.shared_address_id,
+            "currency": asset.currency,
+            "amount": asset.amount,
+        }
+        for asset in assets
+    ]
+
+
+def _build_settlement_body(request: CreateSettlementRequest) -> Dict[str, Any]:
+    """Build the create/replace settlement request body."""
+    body: Dict[str, Any] = {
+        "targetParticipantID": request.target_participant_id,
+        "firstLegParticipantID": request.first_leg_participant_id,
+        "firstLegAssets": _assets_to_payload(request.first_leg_assets),
+        "secondLegAssets": _assets_to_payload(request.second_leg_assets),
+    }
+    if request.clips:
+        body["clips"] = request.clips
+    if request.start_execution_date:
+        body["startExecutionDate"] = request.start_execution_date.isoformat()
+    return body
+
+
+def _asset_from_dto(asset: Any) -> SettlementAssetTransfer:
+    """Convert an OpenAPI settlement asset transfer DTO to domain model."""
+    return SettlementAssetTransfer(
+        shared_address_id=getattr(asset, "shared_address_id", "") or "",
+        currency=getattr(asset, "currency", "") or "",
+        amount=getattr(asset, "amount", "") or "",
+    )
+
+
+def _transaction_from_dto(tx: Any) -> SettlementClipTransaction:
+    """Convert an OpenAPI settlement clip transaction DTO to domain model."""
+    tx_id, tx_status = _read_fields(tx, _get_clip_fields, _CLIP_FIELDS)
+    return SettlementClipTransaction(id=tx_id or "", status=tx_status or "")
+
+
+def _clip_from_dto(clip: Any) -> SettlementClip:
+    """Convert an OpenAPI settlement clip DTO to domain model."""
+    transactions = [_transaction_from_dto(tx) for tx in getattr(clip, "transactions", None) or ()]
+    clip_id, clip_status = _read_fields(clip, _get_clip_fields, _CLIP_FIELDS)
+    return SettlementClip(id=clip_id or "", status=clip_status or "", transactions=transactions)
+
+
 def _settlement_from_dto(dto: Any) -> Optional[Settlement]:
     """Convert OpenAPI settlement DTO to domain model."""
     if dto is None:
         return None
 
-    first_leg_assets = []
-    for asset in getattr(dto, "first_leg_assets", None) or []:
-        first_leg_assets.append(
-            SettlementAssetTransfer(
-                shared_address_id=getattr(asset, "shared_address_id", "") or "",
-                currency=getattr(asset, "currency", "") or "",
-                amount=getattr(asset, "amount", "") or "",
-            )
-        )
-
-    second_leg_assets = []
-    for asset in getattr(dto, "second_leg_assets", None) or []:
-        second_leg_assets.append(
-            SettlementAssetTransfer(
-                shared_address_id=getattr(asset, "shared_address_id", "") or "",
-                currency=getattr(asset, "currency", "") or "",
-                amount=getattr(asset, "amount", "") or "",
-            )
-        )
-
-    clips = []
-    for clip in getattr(dto, "clips", None) or []:
-        transactions = []
-        for tx in getattr(clip, "transactions", None) or []:
-            transactions.append(
-                SettlementClipTransaction(
-                    id=getattr(tx, "id", "") or "",
-                    status=getattr(tx, "status", "") or "",
-                )
-            )
-        clips.append(
-            SettlementClip(
-                id=getattr(clip, "id", "") or "",
-                status=getattr(clip, "status", "") or "",
-                transactions=transactions,
-            )
-        )
+    first_leg_assets = [
+        _asset_from_dto(asset) for asset in getattr(dto, "first_leg_assets", None) or ()
+    ]
+    second_leg_assets = [
+        _asset_from_dto(asset) for asset in getattr(dto, "second_leg_assets", None) or ()
+    ]
+    clips = [_clip_from_dto(clip) for clip in getattr(dto, "clips", None) or ()]
+
+    (
+        settlement_id,
+        creator_participant_id,
+        target_participant_id,
+        first_leg_participant_id,
+        start_execution_date,
+        status,
+        workflow_id,
+        created_at,
+        updated_at,
+    ) = _read_fields(dto, _get_root_fields, _ROOT_FIELDS)
 
     return Settlement(
-        id=getattr(dto, "id", "") or "",
-        creator_participant_id=getattr(dto, "creator_participant_id", "") or "",
-        target_participant_id=getattr(dto, "target_participant_id", "") or "",
-        first_leg_participant_id=getattr(dto, "first_leg_participant_id", "") or "",
+        id=settlement_id or "",
+        creator_participant_id=creator_participant_id or "",
+        target_participant_id=target_participant_id or "",
+        first_leg_participant_id=first_leg_participant_id or "",
         first_leg_assets=first_leg_assets,
         second_leg_assets=second_leg_assets,
         clips=clips,
-        start_execution_date=getattr(dto, "start_execution_date", None),
-        status=getattr(dto, "status", "") or "",
-        workflow_id=getattr(dto, "workflow_id", "") or "",
-        created_at=getattr(dto, "created_at", None),
-        updated_at=getattr(dto, "updated_at", None),
+        start_execution_date=start_execution_date,
+        status=status or "",
+        workflow_id=workflow_id or "",
+        created_at=created_at,
+        updated_at=updated_at,
     )
 
 
@@ -262,6 +349,7 @@ class SettlementService(BaseService):
         super().__init__(api_client)
         self._settlement_api = settlement_api
 
+    @api_call()
     def get_settlement(self, settlement_id: str) -> Settlement:
         """
         Get a settlement by ID.
@@ -279,31 +367,19 @@ class SettlementService(BaseService):
         """
         self._validate_required(settlement_id, "settlement_id")
 
-        try:
-            resp = self._settlement_api.taurus_network_service_get_settlement(settlement_id)
-
-            result = getattr(resp, "result", None)
-            if result is None:
-                from taurus_protect.errors import NotFoundError
-
-                raise NotFoundError(f"Settlement {settlement_id} not found")
-
-            settlement = _settlement_from_dto(result)
-            if settlement is None:
-                from taurus_protect.errors import NotFoundError
+        resp = self._settlement_api.taurus_network_service_get_settlement(settlement_id)
 
-                raise NotFoundError(f"Settlement {settlement_id} not found")
+        result = getattr(resp, "result", None)
+        if result is None:
+            raise NotFoundError(f"Settlement {settlement_id} not found")
 
-            return settlement
-        except Exception as e:
-            from taurus_protect.errors import APIError
+        settlement = _settlement_from_dto(result)
+        if settlement is None:
+            raise NotFoundError(f"Settlement {settlement_id} not found")
 
-            if type(e).__name__ == "ApiException":
-                raise self._handle_error(e) from e
-            if isinstance(e, (APIError, ValueError)):
-                raise
-            raise self._handle_error(e) from e
+        return settlement
 
+    @api_call(rethrow=(APIError,))
     def list_settlements(
         self,
         options: Optional[ListSettlementsOptions] = None,
@@ -322,44 +398,25 @@ class SettlementService(BaseService):
         """
         opts = options or ListSettlementsOptions()
 
-        try:
-            resp = self._settlement_api.taurus_network_service_get_settlements(
-                counter_participant_id=opts.counter_participant_id,
-                statuses=opts.statuses,
-                sort_order=opts.sort_order,
-                cursor_current_page=opts.current_page,
-                cursor_page_request=opts.page_request,
-                cursor_page_size=str(opts.page_size) if opts.page_size > 0 else None,
-            )
-
-            result = getattr(resp, "result", None)
-            settlements = []
-            if result:
-                for dto in result:
-                    settlement = _settlement_from_dto(dto)
-                    if settlement:
-                        settlements.append(settlement)
-
-            # Extract cursor pagination
-            cursor = getattr(resp, "cursor", None)
-            pagination = None
-            if cursor:
-                pagination = CursorPagination(
-                    current_page=getattr(cursor, "current_page", None),
-                    has_next=getattr(cursor, "has_next", False) or False,
-                    has_previous=getattr(cursor, "has_previous", False) or False,
-                )
-
-            return settlements, pagination
-        except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if type(e).__name__ == "ApiException":
-                raise self._handle_error(e) from e
-            if isinstance(e, APIError):
-                raise
-            raise self._handle_error(e) from e
+        resp = self._settlement_api.taurus_network_service_get_settlements(
+            counter_participant_id=opts.counter_participant_id,
+            statuses=opts.statuses,
+            sort_order=opts.sort_order,
+            cursor_current_page=opts.current_page,
+            cursor_page_request=opts.page_request,
+            cursor_page_size=int_param(opts.page_size) if opts.page_size > 0 else None,
+        )
 
+        result = getattr(resp, "result", None)
+        settlements = [
+            settlement
+            for settlement in map(_settlement_from_dto, result or ())
+            if settlement is not None
+        ]
+
+        return settlements, _pagination_from_resp(resp)
+
+    @api_call(rethrow=(APIError,))
     def list_settlements_for_approval(
         self,
         options: Optional[ListSettlementsForApprovalOptions] = None,
@@ -378,43 +435,87 @@ class SettlementService(BaseService):
         """
         opts = options or ListSettlementsForApprovalOptions()
 
-        try:
-            resp = self._settlement_api.taurus_network_service_get_settlements_for_approval(
-                ids=opts.ids,
-                sort_order=opts.sort_order,
-                cursor_current_page=opts.current_page,
-                cursor_page_request=opts.page_request,
-                cursor_page_size=str(opts.page_size) if opts.page_size > 0 else None,
-            )
-
-            result = getattr(resp, "result", None)
-            settlements = []
-            if result:
-                for dto in result:
-                    settlement = _settlement_from_dto(dto)
-                    if settlement:
-                        settlements.append(settlement)
-
-            # Extract cursor pagination
-            cursor = getattr(resp, "cursor", None)
-            pagination = None
-            if cursor:
-                pagination = CursorPagination(
-                    current_page=getattr(cursor, "current_page", None),
-                    has_next=getattr(cursor, "has_next", False) or False,
-                    has_previous=getattr(cursor, "has_previous", False) or False,
-                )
-
-            return settlements, pagination
-        except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if type(e).__name__ == "ApiException":
-                raise self._handle_error(e) from e
-            if isinstance(e, APIError):
-                raise
-            raise self._handle_error(e) from e
+        resp = self._settlement_api.taurus_network_service_get_settlements_for_approval(
+            ids=opts.ids,
+            sort_order=opts.sort_order,
+            cursor_current_page=opts.current_page,
+            cursor_page_request=opts.page_request,
+            cursor_page_size=int_param(opts.page_size) if opts.page_size > 0 else None,
+        )
+
+        result = getattr(resp, "result", None)
+        settlements = [
+            settlement
+            for settlement in map(_settlement_from_dto, result or ())
+            if settlement is not None
+        ]
+
+        return settlements, _pagination_from_resp(resp)
+
+    def iter_settlements(
+        self,
+        options: Optional[ListSettlementsOptions] = None,
+    ) -> Iterator[Settlement]:
+        """
+        Iterate over all settlements, following the API cursor.
+
+        While the settlements of one page are converted and yielded, the next
+        page is already being fetched on a background thread.
+
+        Args:
+            options: Optional filtering and pagination options; ``current_page``
+                and ``page_request`` select the first page.
 
+        Yields:
+            Settlements in API order.
+
+        Raises:
+            APIError: If an API request fails.
+        """
+        opts = options or ListSettlementsOptions()
+        return self._iter_prefetched_pages(
+            self._settlement_api.taurus_network_service_get_settlements,
+            {
+                "counter_participant_id": opts.counter_participant_id,
+                "statuses": opts.statuses,
+                "sort_order": opts.sort_order,
+                "cursor_page_size": int_param(opts.page_size) if opts.page_size > 0 else None,
+            },
+            opts.current_page,
+            opts.page_request,
+        )
+
+    def iter_settlements_for_approval(
+        self,
+        options: Optional[ListSettlementsForApprovalOptions] = None,
+    ) -> Iterator[Settlement]:
+        """
+        Iterate over all settlements pending approval, following the API cursor.
+
+        Pages are prefetched one ahead, as in :meth:`iter_settlements`.
+
+        Args:
+            options: Optional filtering and pagination options.
+
+        Yields:
+            Settlements in API order.
+
+        Raises:
+            APIError: If an API request fails.
+        """
+        opts = options or ListSettlementsForApprovalOptions()
+        return self._iter_prefetched_pages(
+            self._settlement_api.taurus_network_service_get_settlements_for_approval,
+            {
+                "ids": opts.ids,
+                "sort_order": opts.sort_order,
+                "cursor_page_size": int_param(opts.page_size) if opts.page_size > 0 else None,
+            },
+            opts.current_page,
+            opts.page_request,
+        )
+
+    @api_call()
     def create_settlement(self, request: CreateSettlementRequest) -> str:
         """
         Create a new settlement.
@@ -438,55 +539,22 @@ class SettlementService(BaseService):
         if not request.second_leg_assets:
             raise ValueError("second_leg_assets cannot be empty")
 
+        resp = self._settlement_api.taurus_network_service_create_settlement(
+            body=_build_settlement_body(request)
+        )
+
         try:
-            # Build the request body
-            first_leg_assets = [
-                {
-                    "sharedAddressID": asset.shared_address_id,
-                    "currency": asset.currency,
-                    "amount": asset.amount,
-                }
-                for asset in request.first_leg_assets
-            ]
-
-            second_leg_assets = [
-                {
-                    "sharedAddressID": asset.shared_address_id,
-                    "currency": asset.currency,
-                    "amount": asset.amount,
-                }
-                for asset in request.second_leg_assets
-            ]
-
-            body = {
-                "targetParticipantID": request.target_participant_id,
-                "firstLegParticipantID": request.first_leg_participant_id,
-                "firstLegAssets": first_leg_assets,
-                "secondLegAssets": second_leg_assets,
-            }
-
-            if request.clips:
-                body["clips"] = request.clips
-            if request.start_execution_date:
-                body["startExecutionDate"] = request.start_execution_date.isoformat()
-
-            resp = self._settlement_api.taurus_network_service_create_settlement(body=body)
-
-            result = getattr(resp, "result", None)
-            if result:
-                return getattr(result, "id", "") or ""
-
-            # Check for id directly on response
-            return getattr(resp, "id", "") or ""
-        except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if type(e).__name__ == "ApiException":
-                raise self._handle_error(e) from e
-            if isinstance(e, (APIError, ValueError)):
-                raise
-            raise self._handle_error(e) from e
+            return resp.settlement_id or ""
+        except AttributeError:
+            pass
+
+        # Fall back to replies that carry the ID on a result or on the reply itself
+        result = getattr(resp, "result", None)
+        if result:
+            return getattr(result, "id", "") or ""
+        return getattr(resp, "id", "") or ""
 
+    @api_call()
     def cancel_settlement(self, settlement_id: str) -> None:
         """
         Cancel a settlement.
@@ -500,17 +568,9 @@ class SettlementService(BaseService):
         """
         self._validate_required(settlement_id, "settlement_id")
 
-        try:
-            self._settlement_api.taurus_network_service_cancel_settlement(settlement_id, body={})
-        except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if type(e).__name__ == "ApiException":
-                raise self._handle_error(e) from e
-            if isinstance(e, (APIError, ValueError)):
-                raise
-            raise self._handle_error(e) from e
+        self._settlement_api.taurus_network_service_cancel_settlement(settlement_id, body={})
 
+    @api_call()
     def replace_settlement(self, settlement_id: str, request: CreateSettlementRequest) -> None:
         """
         Replace a settlement with new attributes.
@@ -536,48 +596,46 @@ class SettlementService(BaseService):
         if not request.second_leg_assets:
             raise ValueError("second_leg_assets cannot be empty")
 
-        try:
-            # Build the request body
-            first_leg_assets = [
-                {
-                    "sharedAddressID": asset.shared_address_id,
-                    "currency": asset.currency,
-                    "amount": asset.amount,
-                }
-                for asset in request.first_leg_assets
-            ]
-
-            second_leg_assets = [
-                {
-                    "sharedAddressID": asset.shared_address_id,
-                    "currency": asset.currency,
-                    "amount": asset.amount,
-                }
-                for asset in request.second_leg_assets
-            ]
-
-            create_settlement_request = {
-                "targetParticipantID": request.target_participant_id,
-                "firstLegParticipantID": request.first_leg_participant_id,
-                "firstLegAssets": first_leg_assets,
-                "secondLegAssets": second_leg_assets,
-            }
-
-            if request.clips:
-                create_settlement_request["clips"] = request.clips
-            if request.start_execution_date:
-                create_settlement_request["startExecutionDate"] = (
-                    request.start_execution_date.isoformat()
-                )
-
-            body = {"createSettlementRequest": create_settlement_request}
-
-            self._settlement_api.taurus_network_service_replace_settlement(settlement_id, body=body)
-        except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if type(e).__name__ == "ApiException":
-                raise self._handle_error(e) from e
-            if isinstance(e, (APIError, ValueError)):
-                raise
-            raise self._handle_error(e) from e
+        body = {"createSettlementRequest": _build_settlement_body(request)}
+        self._settlement_api.taurus_network_service_replace_settlement(settlement_id, body=body)
+
+    @api_call(rethrow=(APIError,))
+    def _fetch_page(
+        self,
+        fetch: Callable[..., Any],
+        params: Dict[str, Any],
+        current_page: Optional[str],
+        page_request: Optional[str],
+    ) -> Any:
+        """Fetch one page of a cursor-paginated settlement endpoint."""
+        return fetch(cursor_current_page=current_page, cursor_page_request=page_request, **params)
+
+    def _iter_prefetched_pages(
+        self,
+        fetch: Callable[..., Any],
+        params: Dict[str, Any],
+        current_page: Optional[str],
+        page_request: Optional[str],
+    ) -> Iterator[Settlement]:
+        """
+        Walk a cursor-paginated settlement endpoint, fetching one page ahead.
+
+        Args:
+            fetch: The OpenAPI list method.
+            params: Filter and page size keyword arguments.
+            current_page: Cursor of the first page, if any.
+            page_request: Page request direction for the first page.
+
+        Yields:
+            Mapped settlements, page by page.
+        """
+        pages = iter_prefetched_pages(
+            lambda page: self._fetch_page(fetch, params, *page),
+            (current_page, page_request),
+            next_cursor_page,
+        )
+        for resp in pages:
+            for dto in getattr(resp, "result", None) or ():
+                settlement = _settlement_from_dto(dto)
+                if settlement is not None:
+                    yield settlement
@@ -2,18 +2,40 @@
 
 from __future__ import annotations
 
+import json
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
-
-from taurus_protect.services._base import BaseService
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from taurus_protect.errors import APIError
+from taurus_protect.mappers._base import dto_fields
+from taurus_protect.services._base import DATACLASS_SLOTS, BaseService, api_call, int_param
 from taurus_protect.services.taurus_network.settlement_service import CursorPagination
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is used otherwise
+    orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     pass  # For OpenAPI types when available
 
+_T = TypeVar("_T")
+
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SharedAddressTrail:
     """
     Trail entry for a shared address status change.
@@ -26,8 +48,12 @@ class SharedAddressTrail:
     status: str = ""
     changed_at: Optional[datetime] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the trail entry as a plain dict, like ``dataclasses.asdict``."""
+        return {"status": self.status, "changed_at": self.changed_at}
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class SharedAddress:
     """
     A shared address in Taurus Network.
@@ -63,8 +89,84 @@ class SharedAddress:
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the shared address as a plain dict, like ``dataclasses.asdict``."""
+        return {
+            "id": self.id,
+            "owner_participant_id": self.owner_participant_id,
+            "target_participant_id": self.target_participant_id,
+            "address_id": self.address_id,
+            "address": self.address,
+            "blockchain": self.blockchain,
+            "network": self.network,
+            "status": self.status,
+            "key_value_attributes": [dict(attr) for attr in self.key_value_attributes],
+            "trail": [entry.to_dict() for entry in self.trail],
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+
+@dataclass(**DATACLASS_SLOTS)
+class SharedAddressBatch:
+    """
+    A page of shared addresses stored column by column.
+
+    Each attribute is a list with one entry per shared address, so
+    ``batch.statuses[i]`` and ``batch.addresses[i]`` describe the same row.
+    Filtering on a single column (e.g. ``status`` or ``blockchain``) only
+    touches that list instead of one ``SharedAddress`` object per row.
+
+    Attributes:
+        ids: Shared address IDs.
+        owner_participant_ids: Participants who own/shared the addresses.
+        target_participant_ids: Participants the addresses are shared with.
+        address_ids: Underlying address IDs.
+        addresses: Blockchain address strings.
+        blockchains: Blockchain types (interned).
+        networks: Networks (interned).
+        statuses: Sharing statuses (interned).
+        key_value_attributes: Key-value attributes of each shared address.
+        trails: Status change trail of each shared address.
+        created_ats: When each sharing was created.
+        updated_ats: When each sharing was last updated.
+    """
+
+    ids: List[str] = field(default_factory=list)
+    owner_participant_ids: List[str] = field(default_factory=list)
+    target_participant_ids: List[str] = field(default_factory=list)
+    address_ids: List[str] = field(default_factory=list)
+    addresses: List[str] = field(default_factory=list)
+    blockchains: List[str] = field(default_factory=list)
+    networks: List[str] = field(default_factory=list)
+    statuses: List[str] = field(default_factory=list)
+    key_value_attributes: List[List[Dict[str, str]]] = field(default_factory=list)
+    trails: List[List[SharedAddressTrail]] = field(default_factory=list)
+    created_ats: List[Optional[datetime]] = field(default_factory=list)
+    updated_ats: List[Optional[datetime]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def row(self, index: int) -> SharedAddress:
+        """Materialize the shared address stored at ``index``."""
+        return SharedAddress(
+            self.ids[index],
+            self.owner_participant_ids[index],
+            self.target_participant_ids[index],
+            self.address_ids[index],
+            self.addresses[index],
+            self.blockchains[index],
+            self.networks[index],
+            self.statuses[index],
+            self.key_value_attributes[index],
+            self.trails[index],
+            self.created_ats[index],
+            self.updated_ats[index],
+        )
+
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SharedAsset:
     """
     A shared whitelisted asset in Taurus Network.
@@ -95,8 +197,23 @@ class SharedAsset:
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the shared asset as a plain dict, like ``dataclasses.asdict``."""
+        return {
+            "id": self.id,
+            "owner_participant_id": self.owner_participant_id,
+            "target_participant_id": self.target_participant_id,
+            "whitelisted_contract_id": self.whitelisted_contract_id,
+            "blockchain": self.blockchain,
+            "network": self.network,
+            "contract_address": self.contract_address,
+            "status": self.status,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ListSharedAddressesOptions:
     """
     Options for listing shared addresses.
@@ -128,7 +245,7 @@ class ListSharedAddressesOptions:
     page_request: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ListSharedAssetsOptions:
     """
     Options for listing shared assets.
@@ -160,7 +277,7 @@ class ListSharedAssetsOptions:
     page_request: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ShareAddressRequest:
     """
     Request to share an address with a participant.
@@ -176,7 +293,7 @@ class ShareAddressRequest:
     key_value_attributes: Optional[List[Dict[str, str]]] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ShareWhitelistedAssetRequest:
     """
     Request to share a whitelisted asset with a participant.
@@ -190,64 +307,133 @@ class ShareWhitelistedAssetRequest:
     whitelisted_contract_id: str
 
 
+# The mappers below pass every field positionally, in declaration order:
+# keyword parsing is the largest part of constructing these dataclasses.
+def _intern(value: Optional[str]) -> str:
+    """Intern a low-cardinality string field, mapping None to ""."""
+    if value.__class__ is str:
+        return sys.intern(value)
+    return value or ""
+
+
+def _key_value_attributes_from_dto(get: Callable[..., Any]) -> List[Dict[str, str]]:
+    """Convert the key-value attributes of a shared address DTO."""
+    result = []
+    for attr in get("key_value_attributes") or ():
+        attr_get = dto_fields(attr).get
+        result.append({"key": attr_get("key") or "", "value": attr_get("value") or ""})
+    return result
+
+
+def _trail_from_dto(get: Callable[..., Any]) -> List[SharedAddressTrail]:
+    """Convert the status change trail of a shared address DTO."""
+    trail = []
+    for entry in get("trail") or ():
+        entry_get = dto_fields(entry).get
+        trail.append(SharedAddressTrail(_intern(entry_get("status")), entry_get("changed_at")))
+    return trail
+
+
 def _shared_address_from_dto(dto: Any) -> Optional[SharedAddress]:
     """Convert OpenAPI shared address DTO to domain model."""
     if dto is None:
         return None
 
-    key_value_attributes = []
-    for attr in getattr(dto, "key_value_attributes", None) or []:
-        key_value_attributes.append(
-            {
-                "key": getattr(attr, "key", "") or "",
-                "value": getattr(attr, "value", "") or "",
-            }
-        )
-
-    trail = []
-    for entry in getattr(dto, "trail", None) or []:
-        trail.append(
-            SharedAddressTrail(
-                status=getattr(entry, "status", "") or "",
-                changed_at=getattr(entry, "changed_at", None),
-            )
-        )
-
+    get = dto_fields(dto).get
     return SharedAddress(
-        id=getattr(dto, "id", "") or "",
-        owner_participant_id=getattr(dto, "owner_participant_id", "") or "",
-        target_participant_id=getattr(dto, "target_participant_id", "") or "",
-        address_id=getattr(dto, "address_id", "") or "",
-        address=getattr(dto, "address", "") or "",
-        blockchain=getattr(dto, "blockchain", "") or "",
-        network=getattr(dto, "network", "") or "",
-        status=getattr(dto, "status", "") or "",
-        key_value_attributes=key_value_attributes,
-        trail=trail,
-        created_at=getattr(dto, "created_at", None),
-        updated_at=getattr(dto, "updated_at", None),
+        get("id") or "",
+        get("owner_participant_id") or "",
+        get("target_participant_id") or "",
+        get("address_id") or "",
+        get("address") or "",
+        _intern(get("blockchain")),
+        _intern(get("network")),
+        _intern(get("status")),
+        _key_value_attributes_from_dto(get),
+        _trail_from_dto(get),
+        get("created_at"),
+        get("updated_at"),
     )
 
 
+def _shared_addresses_from_dtos(dtos: Sequence[Any]) -> List[SharedAddress]:
+    """Convert a page of shared address DTOs, skipping None entries."""
+    return list(filter(None, map(_shared_address_from_dto, dtos)))
+
+
+def _shared_address_batch_from_dtos(dtos: Sequence[Any]) -> SharedAddressBatch:
+    """Convert a page of shared address DTOs into one columnar batch."""
+    batch = SharedAddressBatch()
+    for dto in dtos:
+        if dto is None:
+            continue
+        get = dto_fields(dto).get
+        batch.ids.append(get("id") or "")
+        batch.owner_participant_ids.append(get("owner_participant_id") or "")
+        batch.target_participant_ids.append(get("target_participant_id") or "")
+        batch.address_ids.append(get("address_id") or "")
+        batch.addresses.append(get("address") or "")
+        batch.blockchains.append(_intern(get("blockchain")))
+        batch.networks.append(_intern(get("network")))
+        batch.statuses.append(_intern(get("status")))
+        batch.key_value_attributes.append(_key_value_attributes_from_dto(get))
+        batch.trails.append(_trail_from_dto(get))
+        batch.created_ats.append(get("created_at"))
+        batch.updated_ats.append(get("updated_at"))
+    return batch
+
+
 def _shared_asset_from_dto(dto: Any) -> Optional[SharedAsset]:
     """Convert OpenAPI shared asset DTO to domain model."""
     if dto is None:
         return None
 
+    get = dto_fields(dto).get
     return SharedAsset(
-        id=getattr(dto, "id", "") or "",
-        owner_participant_id=getattr(dto, "owner_participant_id", "") or "",
-        target_participant_id=getattr(dto, "target_participant_id", "") or "",
-        whitelisted_contract_id=getattr(dto, "whitelisted_contract_id", "") or "",
-        blockchain=getattr(dto, "blockchain", "") or "",
-        network=getattr(dto, "network", "") or "",
-        contract_address=getattr(dto, "contract_address", "") or "",
-        status=getattr(dto, "status", "") or "",
-        created_at=getattr(dto, "created_at", None),
-        updated_at=getattr(dto, "updated_at", None),
+        get("id") or "",
+        get("owner_participant_id") or "",
+        get("target_participant_id") or "",
+        get("whitelisted_contract_id") or "",
+        _intern(get("blockchain")),
+        _intern(get("network")),
+        get("contract_address") or "",
+        _intern(get("status")),
+        get("created_at"),
+        get("updated_at"),
     )
 
 
+def _shared_assets_from_dtos(dtos: Sequence[Any]) -> List[SharedAsset]:
+    """Convert a page of shared asset DTOs, skipping None entries."""
+    return list(filter(None, map(_shared_asset_from_dto, dtos)))
+
+
+def _json_default(value: Any) -> str:
+    """Serialize datetimes for the stdlib JSON fallback."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def serialize_shared_addresses(addresses: List[SharedAddress]) -> bytes:
+    """
+    Serialize shared addresses to compact JSON.
+
+    Uses ``orjson`` when it is installed and the standard library otherwise.
+    Datetimes are written in ISO 8601 format.
+
+    Args:
+        addresses: The shared addresses to serialize.
+
+    Returns:
+        UTF-8 encoded JSON array of the addresses' ``to_dict()`` forms.
+    """
+    payload = [address.to_dict() for address in addresses]
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, default=_json_default, separators=(",", ":")).encode("utf-8")
+
+
 class SharingService(BaseService):
     """
     Service for Taurus Network shared address and asset operations.
@@ -300,51 +486,44 @@ class SharingService(BaseService):
         Raises:
             APIError: If API request fails.
         """
-        opts = options or ListSharedAddressesOptions()
-
-        try:
-            resp = self._shared_api.taurus_network_service_get_shared_addresses(
-                participant_id=opts.participant_id,
-                owner_participant_id=opts.owner_participant_id,
-                target_participant_id=opts.target_participant_id,
-                blockchain=opts.blockchain,
-                network=opts.network,
-                ids=opts.ids,
-                statuses=opts.statuses,
-                sort_order=opts.sort_order,
-                cursor_current_page=opts.current_page,
-                cursor_page_request=opts.page_request,
-                cursor_page_size=str(opts.page_size) if opts.page_size > 0 else None,
-            )
+        return self._list_page(
+            self._shared_api.taurus_network_service_get_shared_addresses,
+            _shared_addresses_from_dtos,
+            options or ListSharedAddressesOptions(),
+        )
+
+    def list_shared_addresses_batched(
+        self,
+        options: Optional[ListSharedAddressesOptions] = None,
+    ) -> Tuple[SharedAddressBatch, Optional[CursorPagination]]:
+        """
+        List shared addresses as a columnar batch.
+
+        Same request as :meth:`list_shared_addresses`, but the page is
+        returned as one ``SharedAddressBatch`` of parallel lists instead
+        of a list of ``SharedAddress`` objects, which is cheaper to build
+        and to filter by a single field.
+
+        Example:
+            >>> batch, _ = client.taurus_network.sharing.list_shared_addresses_batched()
+            >>> accepted = [i for i, s in enumerate(batch.statuses) if s == "accepted"]
 
-            result = getattr(resp, "result", None)
-            addresses = []
-            if result:
-                for dto in result:
-                    addr = _shared_address_from_dto(dto)
-                    if addr:
-                        addresses.append(addr)
-
-            # Extract cursor pagination
-            cursor = getattr(resp, "cursor", None)
-            pagination = None
-            if cursor:
-                pagination = CursorPagination(
-                    current_page=getattr(cursor, "current_page", None),
-                    has_next=getattr(cursor, "has_next", False) or False,
-                    has_previous=getattr(cursor, "has_previous", False) or False,
-                )
-
-            return addresses, pagination
-        except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if type(e).__name__ == "ApiException":
-                raise self._handle_error(e) from e
-            if isinstance(e, APIError):
-                raise
-            raise self._handle_error(e) from e
+        Args:
+            options: Optional filtering and pagination options.
 
+        Returns:
+            Tuple of (shared address batch, cursor pagination info).
+
+        Raises:
+            APIError: If API request fails.
+        """
+        return self._list_page(
+            self._shared_api.taurus_network_service_get_shared_addresses,
+            _shared_address_batch_from_dtos,
+            options or ListSharedAddressesOptions(),
+        )
+
+    @api_call()
     def share_address(self, request: ShareAddressRequest) -> None:
         """
         Share an address with a Taurus Network participant.
@@ -364,25 +543,16 @@ class SharingService(BaseService):
         self._validate_required(request.to_participant_id, "to_participant_id")
         self._validate_required(request.address_id, "address_id")
 
-        try:
-            body = {
-                "toParticipantID": request.to_participant_id,
-                "addressID": request.address_id,
-            }
-
-            if request.key_value_attributes:
-                body["keyValueAttributes"] = request.key_value_attributes
-
-            self._shared_api.taurus_network_service_share_address(body=body)
-        except Exception as e:
-            from taurus_protect.errors import APIError
+        body = {
+            "toParticipantID": request.to_participant_id,
+            "addressID": request.address_id,
+        }
+        if request.key_value_attributes:
+            body["keyValueAttributes"] = request.key_value_attributes
 
-            if type(e).__name__ == "ApiException":
-                raise self._handle_error(e) from e
-            if isinstance(e, (APIError, ValueError)):
-                raise
-            raise self._handle_error(e) from e
+        self._shared_api.taurus_network_service_share_address(body=body)
 
+    @api_call()
     def unshare_address(self, shared_address_id: str) -> None:
         """
         Unshare an address with a Taurus Network participant.
@@ -400,18 +570,9 @@ class SharingService(BaseService):
         """
         self._validate_required(shared_address_id, "shared_address_id")
 
-        try:
-            self._shared_api.taurus_network_service_unshare_address(
-                tn_shared_address_id=shared_address_id, body={}
-            )
-        except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if type(e).__name__ == "ApiException":
-                raise self._handle_error(e) from e
-            if isinstance(e, (APIError, ValueError)):
-                raise
-            raise self._handle_error(e) from e
+        self._shared_api.taurus_network_service_unshare_address(
+            tn_shared_address_id=shared_address_id, body={}
+        )
 
     # =========================================================================
     # Shared Asset Operations
@@ -433,51 +594,13 @@ class SharingService(BaseService):
         Raises:
             APIError: If API request fails.
         """
-        opts = options or ListSharedAssetsOptions()
-
-        try:
-            resp = self._shared_api.taurus_network_service_get_shared_assets(
-                participant_id=opts.participant_id,
-                owner_participant_id=opts.owner_participant_id,
-                target_participant_id=opts.target_participant_id,
-                blockchain=opts.blockchain,
-                network=opts.network,
-                ids=opts.ids,
-                statuses=opts.statuses,
-                sort_order=opts.sort_order,
-                cursor_current_page=opts.current_page,
-                cursor_page_request=opts.page_request,
-                cursor_page_size=str(opts.page_size) if opts.page_size > 0 else None,
-            )
-
-            result = getattr(resp, "result", None)
-            assets = []
-            if result:
-                for dto in result:
-                    asset = _shared_asset_from_dto(dto)
-                    if asset:
-                        assets.append(asset)
-
-            # Extract cursor pagination
-            cursor = getattr(resp, "cursor", None)
-            pagination = None
-            if cursor:
-                pagination = CursorPagination(
-                    current_page=getattr(cursor, "current_page", None),
-                    has_next=getattr(cursor, "has_next", False) or False,
-                    has_previous=getattr(cursor, "has_previous", False) or False,
-                )
-
-            return assets, pagination
-        except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if type(e).__name__ == "ApiException":
-                raise self._handle_error(e) from e
-            if isinstance(e, APIError):
-                raise
-            raise self._handle_error(e) from e
+        return self._list_page(
+            self._shared_api.taurus_network_service_get_shared_assets,
+            _shared_assets_from_dtos,
+            options or ListSharedAssetsOptions(),
+        )
 
+    @api_call()
     def share_whitelisted_asset(self, request: ShareWhitelistedAssetRequest) -> None:
         """
         Share a whitelisted asset with a Taurus Network participant.
@@ -494,22 +617,14 @@ class SharingService(BaseService):
         self._validate_required(request.to_participant_id, "to_participant_id")
         self._validate_required(request.whitelisted_contract_id, "whitelisted_contract_id")
 
-        try:
-            body = {
-                "toParticipantID": request.to_participant_id,
-                "whitelistedContractID": request.whitelisted_contract_id,
-            }
-
-            self._shared_api.taurus_network_service_share_whitelisted_asset(body=body)
-        except Exception as e:
-            from taurus_protect.errors import APIError
+        body = {
+            "toParticipantID": request.to_participant_id,
+            "whitelistedContractID": request.whitelisted_contract_id,
+        }
 
-            if type(e).__name__ == "ApiException":
-                raise self._handle_error(e) from e
-            if isinstance(e, (APIError, ValueError)):
-                raise
-            raise self._handle_error(e) from e
+        self._shared_api.taurus_network_service_share_whitelisted_asset(body=body)
 
+    @api_call()
     def unshare_whitelisted_asset(self, shared_asset_id: str) -> None:
         """
         Unshare a whitelisted asset with a Taurus Network participant.
@@ -527,15 +642,53 @@ class SharingService(BaseService):
         """
         self._validate_required(shared_asset_id, "shared_asset_id")
 
-        try:
-            self._shared_api.taurus_network_service_unshare_whitelisted_asset(
-                tn_shared_asset_id=shared_asset_id, body={}
+        self._shared_api.taurus_network_service_unshare_whitelisted_asset(
+            tn_shared_asset_id=shared_asset_id, body={}
+        )
+
+    @api_call(rethrow=(APIError,))
+    def _list_page(
+        self,
+        fetch: Callable[..., Any],
+        build: Callable[[Sequence[Any]], _T],
+        opts: Union[ListSharedAddressesOptions, ListSharedAssetsOptions],
+    ) -> Tuple[_T, Optional[CursorPagination]]:
+        """
+        Fetch and map one page of a cursor-paginated sharing endpoint.
+
+        Args:
+            fetch: The OpenAPI list method.
+            build: Converts the page of result DTOs to the returned items.
+            opts: Filtering and pagination options.
+
+        Returns:
+            Tuple of (built items, cursor pagination info).
+        """
+        resp = fetch(
+            participant_id=opts.participant_id,
+            owner_participant_id=opts.owner_participant_id,
+            target_participant_id=opts.target_participant_id,
+            blockchain=opts.blockchain,
+            network=opts.network,
+            ids=opts.ids,
+            statuses=opts.statuses,
+            sort_order=opts.sort_order,
+            cursor_current_page=opts.current_page,
+            cursor_page_request=opts.page_request,
+            cursor_page_size=int_param(opts.page_size) if opts.page_size > 0 else None,
+        )
+
+        result = getattr(resp, "result", None)
+        items = build(result or ())
+
+        # Extract cursor pagination
+        cursor = getattr(resp, "cursor", None)
+        pagination = None
+        if cursor:
+            pagination = CursorPagination(
+                current_page=getattr(cursor, "current_page", None),
+                has_next=bool(getattr(cursor, "has_next", False)),
+                has_previous=bool(getattr(cursor, "has_previous", False)),
             )
-        except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if type(e).__name__ == "ApiException":
-                raise self._handle_error(e) from e
-            if isinstance(e, (APIError, ValueError)):
-                raise
-            raise self._handle_error(e) from e
+
+        return items, pagination
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional
+import copy
+from typing import TYPE_CHECKING, Any, Hashable, Optional, Tuple, TypeVar
 
+from taurus_protect.cache.lru_cache import LRUCache
 from taurus_protect.mappers.token_metadata import (
     crypto_punk_metadata_from_dto,
     fa_token_metadata_from_dto,
@@ -14,11 +16,13 @@ from taurus_protect.models.token_metadata import (
     FATokenMetadata,
     TokenMetadata,
 )
-from taurus_protect.services._base import BaseService
+from taurus_protect.services._base import BaseService, api_call
 
 if TYPE_CHECKING:
     pass  # For OpenAPI types when available
 
+_T = TypeVar("_T")
+
 
 class TokenMetadataService(BaseService):
     """
@@ -27,6 +31,12 @@ class TokenMetadataService(BaseService):
     Provides methods to get metadata for various token types including
     ERC tokens (ERC721, ERC1155), FA tokens (Tezos), and CryptoPunks.
 
+    With ``cache_enabled=True``, successful lookups are kept in a bounded
+    per-service LRU cache keyed by the request arguments, since on-chain
+    token metadata does not change. Lookups with ``with_data=True`` are
+    never cached, so image payloads are not kept in memory. The cache is
+    off by default; call :meth:`clear_cache` to drop cached entries.
+
     Example:
         >>> # Get ERC token metadata
         >>> metadata = client.token_metadata.get("ETH", "0x1234...")
@@ -40,17 +50,49 @@ class TokenMetadataService(BaseService):
         ... )
     """
 
-    def __init__(self, api_client: Any, token_metadata_api: Any) -> None:
+    DEFAULT_CACHE_SIZE: int = 4096
+
+    def __init__(
+        self,
+        api_client: Any,
+        token_metadata_api: Any,
+        cache_enabled: bool = False,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
         """
         Initialize token metadata service.
 
         Args:
             api_client: The OpenAPI client instance.
             token_metadata_api: The TokenMetadataApi service from OpenAPI client.
+            cache_enabled: Whether to cache successful lookups made without data.
+            cache_size: Maximum number of cached lookups.
         """
         super().__init__(api_client)
         self._token_metadata_api = token_metadata_api
-
+        self._cache: LRUCache[Tuple[Hashable, ...], Any] = LRUCache(
+            cache_size if cache_enabled else 0
+        )
+
+    def clear_cache(self) -> None:
+        """Drop all cached token metadata."""
+        self._cache.clear()
+
+    def _cache_get(self, key: Optional[Tuple[Hashable, ...]]) -> Any:
+        """Return a copy of the cached value for ``key``, or None."""
+        if key is None:
+            return None
+        cached = self._cache.get(key)
+        # The models are mutable dataclasses: never hand out the cached instance.
+        return copy.deepcopy(cached) if cached is not None else None
+
+    def _cache_put(self, key: Optional[Tuple[Hashable, ...]], value: Optional[_T]) -> Optional[_T]:
+        """Cache a copy of a found ``value`` under a non-None ``key`` and return ``value``."""
+        if key is not None and value is not None and self._cache.maxsize > 0:
+            self._cache.put(key, copy.deepcopy(value))
+        return value
+
+    @api_call()
     def get(
         self,
         blockchain: str,
@@ -79,24 +121,23 @@ class TokenMetadataService(BaseService):
         self._validate_required(blockchain, "blockchain")
         self._validate_required(contract_address, "contract_address")
 
-        try:
-            resp = self._token_metadata_api.token_metadata_service_get_evmerc_token_metadata(
-                network=network,
-                contract=contract_address,
-                token=token_id,
-                with_data=with_data if with_data else None,
-                blockchain=blockchain,
-            )
+        key = None if with_data else ("erc", network, contract_address, token_id, blockchain)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached  # type: ignore[no-any-return]
 
-            result = getattr(resp, "result", None)
-            return token_metadata_from_dto(result)
-        except Exception as e:
-            from taurus_protect.errors import APIError, NotFoundError
+        resp = self._token_metadata_api.token_metadata_service_get_evmerc_token_metadata(
+            network=network,
+            contract=contract_address,
+            token=token_id,
+            with_data=with_data if with_data else None,
+            blockchain=blockchain,
+        )
 
-            if isinstance(e, (APIError, NotFoundError, ValueError)):
-                raise
-            raise self._handle_error(e) from e
+        result = getattr(resp, "result", None)
+        return self._cache_put(key, token_metadata_from_dto(result))
 
+    @api_call()
     def get_erc(
         self,
         network: str,
@@ -126,24 +167,23 @@ class TokenMetadataService(BaseService):
         self._validate_required(contract_address, "contract_address")
         self._validate_required(token_id, "token_id")
 
-        try:
-            resp = self._token_metadata_api.token_metadata_service_get_evmerc_token_metadata(
-                network=network,
-                contract=contract_address,
-                token=token_id,
-                with_data=with_data if with_data else None,
-                blockchain=blockchain,
-            )
+        key = None if with_data else ("erc", network, contract_address, token_id, blockchain)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached  # type: ignore[no-any-return]
 
-            result = getattr(resp, "result", None)
-            return token_metadata_from_dto(result)
-        except Exception as e:
-            from taurus_protect.errors import APIError, NotFoundError
+        resp = self._token_metadata_api.token_metadata_service_get_evmerc_token_metadata(
+            network=network,
+            contract=contract_address,
+            token=token_id,
+            with_data=with_data if with_data else None,
+            blockchain=blockchain,
+        )
 
-            if isinstance(e, (APIError, NotFoundError, ValueError)):
-                raise
-            raise self._handle_error(e) from e
+        result = getattr(resp, "result", None)
+        return self._cache_put(key, token_metadata_from_dto(result))
 
+    @api_call()
     def get_fa(
         self,
         network: str,
@@ -170,23 +210,22 @@ class TokenMetadataService(BaseService):
         self._validate_required(network, "network")
         self._validate_required(contract_address, "contract_address")
 
-        try:
-            resp = self._token_metadata_api.token_metadata_service_get_fa_token_metadata(
-                network=network,
-                contract=contract_address,
-                token=token_id,
-                with_data=with_data if with_data else None,
-            )
+        key = None if with_data else ("fa", network, contract_address, token_id)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached  # type: ignore[no-any-return]
 
-            result = getattr(resp, "result", None)
-            return fa_token_metadata_from_dto(result)
-        except Exception as e:
-            from taurus_protect.errors import APIError, NotFoundError
+        resp = self._token_metadata_api.token_metadata_service_get_fa_token_metadata(
+            network=network,
+            contract=contract_address,
+            token=token_id,
+            with_data=with_data if with_data else None,
+        )
 
-            if isinstance(e, (APIError, NotFoundError, ValueError)):
-                raise
-            raise self._handle_error(e) from e
+        result = getattr(resp, "result", None)
+        return self._cache_put(key, fa_token_metadata_from_dto(result))
 
+    @api_call()
     def get_crypto_punk(
         self,
         network: str,
@@ -215,19 +254,17 @@ class TokenMetadataService(BaseService):
         self._validate_required(contract_address, "contract_address")
         self._validate_required(punk_id, "punk_id")
 
-        try:
-            resp = self._token_metadata_api.token_metadata_service_get_crypto_punks_token_metadata(
-                network=network,
-                contract=contract_address,
-                token=punk_id,
-                blockchain=blockchain,
-            )
-
-            result = getattr(resp, "result", None)
-            return crypto_punk_metadata_from_dto(result)
-        except Exception as e:
-            from taurus_protect.errors import APIError, NotFoundError
-
-            if isinstance(e, (APIError, NotFoundError, ValueError)):
-                raise
-            raise self._handle_error(e) from e
+        key = ("crypto_punk", network, contract_address, punk_id, blockchain)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached  # type: ignore[no-any-return]
+
+        resp = self._token_metadata_api.token_metadata_service_get_crypto_punks_token_metadata(
+            network=network,
+            contract=contract_address,
+            token=punk_id,
+            blockchain=blockchain,
+        )
+
+        result = getattr(resp, "result", None)
+        return self._cache_put(key, crypto_punk_metadata_from_dto(result))
@@ -2,19 +2,107 @@
 
 from __future__ import annotations
 
+import json
+import os
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+from types import SimpleNamespace
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from taurus_protect._internal.openapi.exceptions import ApiException
+from taurus_protect._internal.openapi.models.tgvalidatord_transaction import (
+    TgvalidatordTransaction,
+)
+from taurus_protect._internal.openapi.rest import RESTResponse
+from taurus_protect.cache.lru_cache import LRUCache
 from taurus_protect.errors import NotFoundError
+from taurus_protect.mappers._base import parse_string_to_int
 from taurus_protect.mappers.transaction import map_transaction, map_transactions
 from taurus_protect.models.pagination import Pagination
 from taurus_protect.models.transaction import Transaction
-from taurus_protect.services._base import BaseService
+from taurus_protect.services._base import (
+    BaseAsyncService,
+    BaseService,
+    SingleFlight,
+    int_param,
+    iter_prefetched_pages,
+)
+
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is used otherwise
+    orjson = None  # type: ignore[assignment]
 
 if TYPE_CHECKING:
     from taurus_protect._internal.openapi.api.transactions_api import TransactionsApi
 
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# JSON key (camelCase alias) -> field name of the generated transaction DTO
+_TRANSACTION_FIELD_NAMES: Dict[str, str] = {
+    field.alias or name: name for name, field in TgvalidatordTransaction.model_fields.items()
+}
+
+
+def _page_params(limit: int, offset: int) -> Tuple[str, str]:
+    """
+    Validate and format limit/offset pagination parameters.
+
+    Args:
+        limit: Maximum number of items to return.
+        offset: Offset for pagination.
+
+    Returns:
+        Tuple of (limit, offset) query strings.
+
+    Raises:
+        ValueError: If limit is not positive or offset is negative.
+    """
+    if limit <= 0:
+        raise ValueError("limit must be positive")
+    if offset < 0:
+        raise ValueError("offset cannot be negative")
+    return int_param(limit), int_param(offset)
+
+
+def _decode_transactions_reply(resp: Any) -> SimpleNamespace:
+    """
+    Decode a raw transactions reply without the generated models.
+
+    Rows become namespaces keyed by DTO field name, which is all
+    ``map_transaction`` reads.
+
+    Args:
+        resp: The urllib3 response of a ``_without_preload_content`` call.
+
+    Returns:
+        A reply-like object with ``result`` and ``total_items``.
+
+    Raises:
+        ApiException: If the response status is not 2xx.
+    """
+    # RESTResponse is untyped generated code; the body it reads is bytes
+    http_resp: Any = RESTResponse(resp)
+    body: bytes = http_resp.read()
+    if not 200 <= http_resp.status <= 299:
+        raise ApiException.from_response(http_resp=http_resp, body=None, data=None)
+
+    data = _json_loads(body)
+    names = _TRANSACTION_FIELD_NAMES
+    rows = [
+        SimpleNamespace(**{names.get(key, key): value for key, value in row.items()})
+        for row in data.get("result") or ()
+    ]
+    return SimpleNamespace(result=rows, total_items=data.get("totalItems"))
+
 
 class TransactionService(BaseService):
     """
@@ -31,12 +119,31 @@ class TransactionService(BaseService):
         ...
         >>> # Get a transaction by hash
         >>> tx = client.transactions.get_by_hash("0x1234...")
+
+    With ``fast_decode=True``, transaction lists are decoded straight from
+    the JSON body (with orjson when installed) instead of through the
+    generated reply models, skipping their per-field validation.
+
+    With ``cache_enabled=True``, transactions found by :meth:`get` and
+    :meth:`get_by_hash` are kept in a bounded LRU cache under both their ID
+    and their hash. Cached transactions are returned as first fetched, so
+    their status and confirmation count are not refreshed; the cache is off
+    by default for that reason. Use :meth:`invalidate` or
+    :meth:`clear_cache` to drop entries.
+
+    Concurrent :meth:`get` or :meth:`get_by_hash` calls for the same
+    transaction share a single API request.
     """
 
+    DEFAULT_CACHE_SIZE: int = 4096
+
     def __init__(
         self,
         api_client: Any,
         transactions_api: "TransactionsApi",
+        cache_enabled: bool = False,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        fast_decode: bool = False,
     ) -> None:
         """
         Initialize the transaction service.
@@ -44,9 +151,71 @@ class TransactionService(BaseService):
         Args:
             api_client: The OpenAPI client instance.
             transactions_api: The transactions API instance.
+            cache_enabled: Whether to cache transactions found by ID or hash.
+            cache_size: Maximum number of cached lookup keys.
+            fast_decode: Whether to decode transaction lists without the
+                generated reply models.
         """
         super().__init__(api_client)
         self._api = transactions_api
+        self._cache: LRUCache[Tuple[str, str], Transaction] = LRUCache(
+            cache_size if cache_enabled else 0
+        )
+        self._fast_decode = fast_decode
+        self._inflight: SingleFlight[Transaction] = SingleFlight()
+
+    def clear_cache(self) -> None:
+        """Drop all cached transactions."""
+        self._cache.clear()
+
+    def invalidate(self, transaction_id_or_hash: Union[int, str]) -> None:
+        """
+        Drop a cached transaction, by ID or by hash.
+
+        Both cache entries of the transaction (ID and hash) are removed.
+
+        Args:
+            transaction_id_or_hash: The transaction ID or blockchain hash.
+        """
+        if isinstance(transaction_id_or_hash, int):
+            keys = [("id", str(transaction_id_or_hash))]
+        else:
+            keys = [("hash", transaction_id_or_hash), ("id", transaction_id_or_hash)]
+        for key in keys:
+            tx = self._cache.pop(key)
+            if tx is not None:
+                self._cache.pop(("id", tx.id))
+                self._cache.pop(("hash", tx.tx_hash or ""))
+
+    def _cache_put(self, tx: Transaction) -> Transaction:
+        """Cache ``tx`` under its ID and hash and return it."""
+        # Transaction is a frozen model, so the cached instance can be shared.
+        self._cache.put(("id", tx.id), tx)
+        if tx.tx_hash:
+            self._cache.put(("hash", tx.tx_hash), tx)
+        return tx
+
+    def _get_transactions(self, limit: str, offset: str, **filters: Any) -> Any:
+        """
+        Query the transactions endpoint with only the given filters.
+
+        The generated client defaults every other query parameter to None.
+
+        Args:
+            limit: Page size, as the API string.
+            offset: Page offset, as the API string.
+            **filters: Query parameters of ``transaction_service_get_transactions``.
+
+        Returns:
+            The API reply.
+        """
+        if self._fast_decode:
+            return _decode_transactions_reply(
+                self._api.transaction_service_get_transactions_without_preload_content(
+                    limit=limit, offset=offset, **filters
+                )
+            )
+        return self._api.transaction_service_get_transactions(limit=limit, offset=offset, **filters)
 
     def get(self, transaction_id: int) -> Transaction:
         """
@@ -65,42 +234,17 @@ class TransactionService(BaseService):
         if transaction_id <= 0:
             raise ValueError("transaction_id must be positive")
 
-        try:
-            reply = self._api.transaction_service_get_transactions(
-                currency=None,
-                direction=None,
-                query=None,
-                limit="1",
-                offset="0",
-                var_from=None,
-                to=None,
-                transaction_ids=None,
-                type=None,
-                source=None,
-                destination=None,
-                ids=[str(transaction_id)],
-                blockchain=None,
-                network=None,
-                from_block_number=None,
-                to_block_number=None,
-                hashes=None,
-                address=None,
-                amount_above=None,
-                exclude_unknown_source_destination=None,
-                customer_id=None,
-            )
-
-            result = reply.result
-            if not result:
-                raise NotFoundError(f"Transaction with id '{transaction_id}' not found")
+        key = ("id", str(transaction_id))
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
 
-            return map_transaction(result[0])
-        except NotFoundError:
-            raise
-        except Exception as e:
-            if isinstance(e, ApiException):
-                raise self._handle_error(e)
-            raise
+        return self._inflight.do(
+            key,
+            lambda: self._fetch_one(
+                f"Transaction with id '{transaction_id}' not found", ids=[key[1]]
+            ),
+        )
 
     def get_by_hash(self, tx_hash: str) -> Transaction:
         """
@@ -118,42 +262,45 @@ class TransactionService(BaseService):
         """
         self._validate_required(tx_hash, "tx_hash")
 
+        key = ("hash", tx_hash)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        return self._inflight.do(
+            key,
+            lambda: self._fetch_one(
+                f"Transaction with hash '{tx_hash}' not found", hashes=[tx_hash]
+            ),
+        )
+
+    def _fetch_one(self, not_found_message: str, **filters: Any) -> Transaction:
+        """
+        Fetch and cache the first transaction matching ``filters``.
+
+        Args:
+            not_found_message: Message of the NotFoundError raised on no match.
+            **filters: Query parameters selecting the transaction.
+
+        Returns:
+            The transaction.
+
+        Raises:
+            NotFoundError: If no transaction matches.
+            APIError: If the API call fails.
+        """
         try:
-            reply = self._api.transaction_service_get_transactions(
-                currency=None,
-                direction=None,
-                query=None,
-                limit="1",
-                offset="0",
-                var_from=None,
-                to=None,
-                transaction_ids=None,
-                type=None,
-                source=None,
-                destination=None,
-                ids=None,
-                blockchain=None,
-                network=None,
-                from_block_number=None,
-                to_block_number=None,
-                hashes=[tx_hash],
-                address=None,
-                amount_above=None,
-                exclude_unknown_source_destination=None,
-                customer_id=None,
-            )
+            reply = self._get_transactions("1", "0", **filters)
 
             result = reply.result
             if not result:
-                raise NotFoundError(f"Transaction with hash '{tx_hash}' not found")
+                raise NotFoundError(not_found_message)
 
-            return map_transaction(result[0])
+            return self._cache_put(map_transaction(result[0]))
         except NotFoundError:
             raise
-        except Exception as e:
-            if isinstance(e, ApiException):
-                raise self._handle_error(e)
-            raise
+        except ApiException as e:
+            raise self._handle_error(e) from e
 
     def list(
         self,
@@ -181,47 +328,27 @@ class TransactionService(BaseService):
         Raises:
             APIError: If the API call fails.
         """
-        if limit <= 0:
-            raise ValueError("limit must be positive")
-        if offset < 0:
-            raise ValueError("offset cannot be negative")
+        limit_param, offset_param = _page_params(limit, offset)
 
         try:
-            reply = self._api.transaction_service_get_transactions(
+            reply = self._get_transactions(
+                limit_param,
+                offset_param,
                 currency=currency,
                 direction=direction,
-                query=None,
-                limit=str(limit),
-                offset=str(offset),
                 var_from=from_date,
                 to=to_date,
-                transaction_ids=None,
-                type=None,
-                source=None,
-                destination=None,
-                ids=None,
-                blockchain=None,
-                network=None,
-                from_block_number=None,
-                to_block_number=None,
-                hashes=None,
-                address=None,
-                amount_above=None,
-                exclude_unknown_source_destination=None,
-                customer_id=None,
             )
 
             transactions = map_transactions(reply.result)
             pagination = self._extract_pagination(
-                getattr(reply, "total_items", None),
+                self._total_items(reply),
                 offset,
                 limit,
             )
             return transactions, pagination
-        except Exception as e:
-            if isinstance(e, ApiException):
-                raise self._handle_error(e)
-            raise
+        except ApiException as e:
+            raise self._handle_error(e) from e
 
     def list_by_address(
         self,
@@ -244,47 +371,99 @@ class TransactionService(BaseService):
             APIError: If the API call fails.
         """
         self._validate_required(address, "address")
-        if limit <= 0:
-            raise ValueError("limit must be positive")
-        if offset < 0:
-            raise ValueError("offset cannot be negative")
+        limit_param, offset_param = _page_params(limit, offset)
 
         try:
-            reply = self._api.transaction_service_get_transactions(
-                currency=None,
-                direction=None,
-                query=None,
-                limit=str(limit),
-                offset=str(offset),
-                var_from=None,
-                to=None,
-                transaction_ids=None,
-                type=None,
-                source=None,
-                destination=None,
-                ids=None,
-                blockchain=None,
-                network=None,
-                from_block_number=None,
-                to_block_number=None,
-                hashes=None,
-                address=address,
-                amount_above=None,
-                exclude_unknown_source_destination=None,
-                customer_id=None,
-            )
+            reply = self._get_transactions(limit_param, offset_param, address=address)
 
             transactions = map_transactions(reply.result)
             pagination = self._extract_pagination(
-                getattr(reply, "total_items", None),
+                self._total_items(reply),
                 offset,
                 limit,
             )
             return transactions, pagination
-        except Exception as e:
-            if isinstance(e, ApiException):
-                raise self._handle_error(e)
-            raise
+        except ApiException as e:
+            raise self._handle_error(e) from e
+
+    def iter_all(
+        self,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+        currency: Optional[str] = None,
+        direction: Optional[str] = None,
+        address: Optional[str] = None,
+        page_size: int = 50,
+    ) -> Iterator[Transaction]:
+        """
+        Iterate over all matching transactions, fetching one page ahead.
+
+        The transactions endpoint only offers offset pagination. While the
+        transactions of one page are mapped and yielded, the next page is
+        already being requested on a background thread. Transactions
+        recorded during the iteration can shift later pages.
+
+        Args:
+            from_date: Filter transactions after this date.
+            to_date: Filter transactions before this date.
+            currency: Filter by currency ID or symbol.
+            direction: Filter by direction ("incoming" or "outgoing").
+            address: Filter by source or destination address.
+            page_size: Number of transactions requested per page.
+
+        Yields:
+            Transactions in API order.
+
+        Raises:
+            APIError: If an API call fails.
+        """
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+
+        filters = {
+            "currency": currency,
+            "direction": direction,
+            "var_from": from_date,
+            "to": to_date,
+            "address": address,
+        }
+        return self._iter_prefetched_pages(filters, page_size)
+
+    def _iter_prefetched_pages(
+        self, filters: Dict[str, Any], page_size: int
+    ) -> Iterator[Transaction]:
+        """
+        Walk the offset-paginated transactions endpoint one page ahead.
+
+        Args:
+            filters: Query parameters shared by every page.
+            page_size: Number of transactions requested per page.
+
+        Yields:
+            Mapped transactions, page by page.
+        """
+
+        def next_offset(reply: Any, offset: int) -> Optional[int]:
+            result = getattr(reply, "result", None) or []
+            total = parse_string_to_int(self._total_items(reply), default=-1)
+            offset += page_size
+            if len(result) >= page_size and (total < 0 or offset < total):
+                return offset
+            return None
+
+        pages = iter_prefetched_pages(
+            lambda offset: self._fetch_page(filters, page_size, offset), 0, next_offset
+        )
+        for reply in pages:
+            for dto in getattr(reply, "result", None) or []:
+                yield map_transaction(dto)
+
+    def _fetch_page(self, filters: Dict[str, Any], page_size: int, offset: int) -> Any:
+        """Request one page of transactions for :meth:`_iter_prefetched_pages`."""
+        try:
+            return self._get_transactions(int_param(page_size), int_param(offset), **filters)
+        except ApiException as e:
+            raise self._handle_error(e) from e
 
     def export_csv(
         self,
@@ -312,38 +491,181 @@ class TransactionService(BaseService):
         Raises:
             APIError: If the API call fails.
         """
-        if limit <= 0:
-            raise ValueError("limit must be positive")
-        if offset < 0:
-            raise ValueError("offset cannot be negative")
+        limit_param, offset_param = _page_params(limit, offset)
+
+        reply = self._export_csv_page(
+            from_date, to_date, currency, direction, limit_param, offset_param
+        )
+        return reply.result or ""
+
+    def iter_export_csv(
+        self,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+        currency: Optional[str] = None,
+        direction: Optional[str] = None,
+        page_size: int = 1000,
+    ) -> Iterator[str]:
+        """
+        Export all matching transactions to CSV, one page at a time.
+
+        The export API wraps the CSV in a JSON reply, so a page must be
+        fully received before any of it can be used. Requesting pages of
+        ``page_size`` transactions keeps memory bounded by one page instead
+        of the whole export. The header row is only yielded with the first
+        chunk, so joining the chunks gives a single CSV document.
+
+        Args:
+            from_date: Filter transactions after this date.
+            to_date: Filter transactions before this date.
+            currency: Filter by currency ID or symbol.
+            direction: Filter by direction ("incoming" or "outgoing").
+            page_size: Number of transactions requested per page.
+
+        Yields:
+            CSV text chunks.
+
+        Raises:
+            APIError: If an API call fails.
+        """
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+
+        header: Optional[str] = None
+        offset = 0
+        while True:
+            reply = self._export_csv_page(
+                from_date, to_date, currency, direction, int_param(page_size), int_param(offset)
+            )
+            content = reply.result or ""
+            if header is None:
+                newline = content.find("\n")
+                header = content if newline < 0 else content[: newline + 1]
+                rows = content[len(header) :]
+                chunk = content
+            else:
+                rows = content[len(header) :] if content.startswith(header) else content
+                chunk = rows
+            if not rows.strip():
+                if chunk:
+                    yield chunk
+                return
+            yield chunk
+
+            offset += page_size
+            total = parse_string_to_int(self._total_items(reply), default=-1)
+            if 0 <= total <= offset:
+                return
+
+    def export_csv_to_file(
+        self,
+        path: Union[str, os.PathLike[str]],
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+        currency: Optional[str] = None,
+        direction: Optional[str] = None,
+        page_size: int = 1000,
+    ) -> None:
+        """
+        Export all matching transactions to a CSV file, page by page.
+
+        See :meth:`iter_export_csv`; at most one page is held in memory.
 
+        Args:
+            path: Destination file path, overwritten if it exists.
+            from_date: Filter transactions after this date.
+            to_date: Filter transactions before this date.
+            currency: Filter by currency ID or symbol.
+            direction: Filter by direction ("incoming" or "outgoing").
+            page_size: Number of transactions requested per page.
+
+        Raises:
+            APIError: If an API call fails.
+        """
+        chunks = self.iter_export_csv(from_date, to_date, currency, direction, page_size)
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            for chunk in chunks:
+                f.write(chunk)
+
+    def _export_csv_page(
+        self,
+        from_date: Optional[datetime],
+        to_date: Optional[datetime],
+        currency: Optional[str],
+        direction: Optional[str],
+        limit: str,
+        offset: str,
+    ) -> Any:
+        """Request one page of the CSV transaction export."""
         try:
-            reply = self._api.transaction_service_export_transactions(
+            return self._api.transaction_service_export_transactions(
                 currency=currency,
                 direction=direction,
-                query=None,
-                limit=str(limit),
-                offset=str(offset),
+                limit=limit,
+                offset=offset,
                 var_from=from_date,
                 to=to_date,
-                transaction_ids=None,
                 format="csv",
-                type=None,
-                source=None,
-                destination=None,
-                ids=None,
-                blockchain=None,
-                network=None,
-                from_block_number=None,
-                to_block_number=None,
-                amount_above=None,
-                exclude_unknown_source_destination=None,
-                hashes=None,
-                address=None,
             )
+        except ApiException as e:
+            raise self._handle_error(e) from e
 
-            return reply.result or ""
-        except Exception as e:
-            if isinstance(e, ApiException):
-                raise self._handle_error(e)
-            raise
+
+class AsyncTransactionService(BaseAsyncService[TransactionService]):
+    """
+    Asyncio interface to a :class:`TransactionService`.
+
+    Each call runs the blocking request on a worker thread; see
+    :class:`BaseAsyncService` for the concurrency limit and lifecycle.
+
+    Example:
+        >>> async with AsyncTransactionService(client.transactions) as transactions:
+        ...     txs = await asyncio.gather(*(transactions.get_by_hash(h) for h in hashes))
+    """
+
+    _THREAD_NAME_PREFIX = "taurus-protect-tx"
+
+    async def get(self, transaction_id: int) -> Transaction:
+        """Async version of :meth:`TransactionService.get`."""
+        return await self._run(self._service.get, transaction_id)
+
+    async def get_by_hash(self, tx_hash: str) -> Transaction:
+        """Async version of :meth:`TransactionService.get_by_hash`."""
+        return await self._run(self._service.get_by_hash, tx_hash)
+
+    async def list(
+        self,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+        currency: Optional[str] = None,
+        direction: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> Tuple[List[Transaction], Optional[Pagination]]:
+        """Async version of :meth:`TransactionService.list`."""
+        return await self._run(
+            self._service.list, from_date, to_date, currency, direction, limit, offset
+        )
+
+    async def list_by_address(
+        self,
+        address: str,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> Tuple[List[Transaction], Optional[Pagination]]:
+        """Async version of :meth:`TransactionService.list_by_address`."""
+        return await self._run(self._service.list_by_address, address, limit, offset)
+
+    async def export_csv(
+        self,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+        currency: Optional[str] = None,
+        direction: Optional[str] = None,
+        limit: int = 1000,
+        offset: int = 0,
+    ) -> str:
+        """Async version of :meth:`TransactionService.export_csv`."""
+        return await self._run(
+            self._service.export_csv, from_date, to_date, currency, direction, limit, offset
+        )
@@ -4,6 +4,13 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
+from taurus_protect._internal.openapi.models import (
+    user_device_service_approve_user_device_pairing_body as approve_pairing_body,
+)
+from taurus_protect._internal.openapi.models import (
+    user_device_service_start_user_device_pairing_body as start_pairing_body,
+)
+from taurus_protect.errors import APIError, NotFoundError
 from taurus_protect.mappers.user_device import (
     user_device_pairing_from_dto,
     user_device_pairing_info_from_dto,
@@ -97,8 +104,6 @@ class UserDeviceService(BaseService):
         """
         self._validate_required(device_id, "device_id")
 
-        from taurus_protect.errors import NotFoundError
-
         raise NotFoundError(
             f"Device {device_id} not found. Use get_pairing_status(pairing_id, nonce) instead."
         )
@@ -121,16 +126,12 @@ class UserDeviceService(BaseService):
 
             pairing = user_device_pairing_from_dto(resp)
             if pairing is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to create pairing: invalid response")
 
             return pairing
+        except APIError:
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, APIError):
-                raise
             raise self._handle_error(e) from e
 
     def start_pairing(
@@ -159,11 +160,7 @@ class UserDeviceService(BaseService):
         self._validate_required(encryption_key, "encryption_key")
 
         try:
-            from taurus_protect._internal.openapi.models.user_device_service_start_user_device_pairing_body import (
-                UserDeviceServiceStartUserDevicePairingBody,
-            )
-
-            body = UserDeviceServiceStartUserDevicePairingBody(
+            body = start_pairing_body.UserDeviceServiceStartUserDevicePairingBody(
                 nonce=nonce,
                 encryption_key=encryption_key,
             )
@@ -171,11 +168,9 @@ class UserDeviceService(BaseService):
                 pairing_id=pairing_id,
                 body=body,
             )
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def approve_pairing(
@@ -201,22 +196,16 @@ class UserDeviceService(BaseService):
         self._validate_required(nonce, "nonce")
 
         try:
-            from taurus_protect._internal.openapi.models.user_device_service_approve_user_device_pairing_body import (
-                UserDeviceServiceApproveUserDevicePairingBody,
-            )
-
-            body = UserDeviceServiceApproveUserDevicePairingBody(
+            body = approve_pairing_body.UserDeviceServiceApproveUserDevicePairingBody(
                 nonce=nonce,
             )
             self._user_device_api.user_device_service_approve_user_device_pairing(
                 pairing_id=pairing_id,
                 body=body,
             )
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def get_pairing_status(
@@ -253,14 +242,10 @@ class UserDeviceService(BaseService):
 
             info = user_device_pairing_info_from_dto(resp)
             if info is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Pairing {pairing_id} not found")
 
             return info
+        except (APIError, NotFoundError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError, NotFoundError
-
-            if isinstance(e, (APIError, NotFoundError, ValueError)):
-                raise
             raise self._handle_error(e) from e
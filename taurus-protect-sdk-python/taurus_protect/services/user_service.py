@@ -2,19 +2,39 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Iterator, List, Mapping, Optional, Tuple
 
 from taurus_protect._internal.openapi.models.user_service_create_attribute_body import (
     UserServiceCreateAttributeBody,
 )
+from taurus_protect.errors import (
+    APIError,
+    AuthenticationError,
+    AuthorizationError,
+    NotFoundError,
+)
 from taurus_protect.mappers.user import user_from_dto, users_from_dto
 from taurus_protect.models.pagination import Pagination
 from taurus_protect.models.user import User
-from taurus_protect.services._base import BaseService
+from taurus_protect.services._base import BaseService, SingleFlight
 
 if TYPE_CHECKING:
     pass  # For OpenAPI types when available
 
+# get_users_by_email queries at most this many emails per request, and runs
+# up to _EMAIL_BATCH_WORKERS requests at once
+_EMAIL_BATCH_SIZE = 100
+_EMAIL_BATCH_WORKERS = 8
+
+# create_user_attributes sends up to this many create requests at once
+_ATTRIBUTE_WORKERS = 8
+
+# Reply type of GET /users by status; other statuses raise ApiException
+_GET_USERS_RESPONSE_TYPES = {"200": "TgvalidatordGetUsersReply"}
+
 
 class UserService(BaseService):
     """
@@ -35,18 +55,44 @@ class UserService(BaseService):
         >>> # Get current user
         >>> current_user = client.users.get_current()
         >>> print(f"Logged in as: {current_user.email}")
+
+    The current user is cached for ``current_user_ttl`` seconds, since it
+    does not change for the lifetime of the credentials. The cache is
+    dropped when a request fails with 401 or 403; call
+    :meth:`refresh_current` to fetch it again explicitly. Concurrent
+    :meth:`get` calls for the same user share a single API request.
     """
 
-    def __init__(self, api_client: Any, users_api: Any) -> None:
+    DEFAULT_CURRENT_USER_TTL: float = 300.0
+
+    def __init__(
+        self,
+        api_client: Any,
+        users_api: Any,
+        current_user_ttl: float = DEFAULT_CURRENT_USER_TTL,
+    ) -> None:
         """
         Initialize user service.
 
         Args:
             api_client: The OpenAPI client instance.
             users_api: The UsersApi service from OpenAPI client.
+            current_user_ttl: Seconds to cache the current user; 0 disables caching.
         """
         super().__init__(api_client)
         self._users_api = users_api
+        self._current_user_ttl = current_user_ttl
+        self._current_user: Optional[Tuple[float, User]] = None
+        self._current_user_lock = threading.Lock()
+        self._inflight: SingleFlight[User] = SingleFlight()
+
+    def _handle_error(self, error: Exception) -> APIError:
+        """Convert API exceptions to domain errors, dropping the cached current user on 401/403."""
+        mapped = super()._handle_error(error)
+        if isinstance(mapped, (AuthenticationError, AuthorizationError)):
+            with self._current_user_lock:
+                self._current_user = None
+        return mapped
 
     def get(self, user_id: str) -> User:
         """
@@ -65,33 +111,50 @@ class UserService(BaseService):
         """
         self._validate_required(user_id, "user_id")
 
+        return self._inflight.do(user_id, lambda: self._fetch_user(user_id))
+
+    def _fetch_user(self, user_id: str) -> User:
+        """Fetch a user by ID for :meth:`get`."""
         try:
             resp = self._users_api.user_service_get_user(user_id)
 
             result = getattr(resp, "result", None)
             if result is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"User {user_id} not found")
 
             user = user_from_dto(result)
             if user is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"User {user_id} not found")
 
             return user
+        except (APIError, NotFoundError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError, NotFoundError
-
-            if isinstance(e, (APIError, NotFoundError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def get_current(self) -> User:
         """
         Get the current authenticated user.
 
+        Returns the cached user while it is younger than ``current_user_ttl``.
+
+        Returns:
+            The current user.
+
+        Raises:
+            APIError: If API request fails.
+        """
+        if self._current_user_ttl > 0:
+            with self._current_user_lock:
+                cached = self._current_user
+            if cached is not None and time.monotonic() - cached[0] < self._current_user_ttl:
+                return cached[1]
+        return self.refresh_current()
+
+    def refresh_current(self) -> User:
+        """
+        Fetch the current authenticated user, bypassing the cache.
+
         Returns:
             The current user.
 
@@ -103,22 +166,19 @@ class UserService(BaseService):
 
             result = getattr(resp, "result", None)
             if result is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to get current user: no result returned")
 
             user = user_from_dto(result)
             if user is None:
-                from taurus_protect.errors import APIError
-
                 raise APIError(500, "Failed to get current user: invalid response")
 
+            if self._current_user_ttl > 0:
+                with self._current_user_lock:
+                    self._current_user = (time.monotonic(), user)
             return user
+        except APIError:
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, APIError):
-                raise
             raise self._handle_error(e) from e
 
     def list(
@@ -161,22 +221,106 @@ class UserService(BaseService):
                 group_ids=None,
             )
 
-            result = getattr(resp, "result", None)
-            users = users_from_dto(result) if result else []
+            return self._users_page(resp, limit, offset)
+        except (APIError, ValueError):
+            raise
+        except Exception as e:
+            raise self._handle_error(e) from e
 
-            pagination = self._extract_pagination(
-                total_items=getattr(resp, "total_items", None),
-                offset=offset,
-                limit=limit,
-            )
+    def watch(
+        self,
+        interval: float,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> Iterator[Tuple[List[User], Optional[Pagination]]]:
+        """
+        Poll the same page of users every ``interval`` seconds.
 
-            return users, pagination
-        except Exception as e:
-            from taurus_protect.errors import APIError
+        The request is validated and serialized once; each poll only signs
+        and sends it again. The first page is fetched immediately. Stop
+        polling by breaking out of the loop or closing the generator.
+
+        Args:
+            interval: Seconds between the starts of two polls (must be positive).
+            limit: Maximum number of users to return (must be positive).
+            offset: Number of users to skip (must be non-negative).
+
+        Yields:
+            Tuple of (users list, pagination info) for each poll.
+
+        Raises:
+            ValueError: If interval, limit or offset are invalid.
+            APIError: If an API request fails.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        if limit <= 0:
+            raise ValueError("limit must be positive")
+        if offset < 0:
+            raise ValueError("offset cannot be negative")
 
-            if isinstance(e, (APIError, ValueError)):
+        return self._watch(interval, limit, offset)
+
+    def _watch(
+        self, interval: float, limit: int, offset: int
+    ) -> Iterator[Tuple[List[User], Optional[Pagination]]]:
+        """Send the serialized users request once per interval for :meth:`watch`."""
+        api_client = self._users_api.api_client
+        method, url, headers, body, post_params = self._users_api._user_service_get_users_serialize(
+            limit=str(limit),
+            offset=str(offset),
+            ids=None,
+            external_user_ids=None,
+            emails=None,
+            query=None,
+            public_key=None,
+            exclude_technical_users=None,
+            roles=None,
+            status=None,
+            totp_enabled=None,
+            group_ids=None,
+            _request_auth=None,
+            _content_type=None,
+            _headers=None,
+            _host_index=0,
+        )
+
+        next_poll = time.monotonic()
+        while True:
+            try:
+                # The signing REST client adds its Authorization header to the
+                # headers it is given, so every poll gets a fresh copy.
+                resp = api_client.call_api(method, url, dict(headers), body, post_params)
+                resp.read()
+                reply = api_client.response_deserialize(resp, _GET_USERS_RESPONSE_TYPES).data
+                page = self._users_page(reply, limit, offset)
+            except (APIError, ValueError):
                 raise
-            raise self._handle_error(e) from e
+            except Exception as e:
+                raise self._handle_error(e) from e
+            yield page
+
+            next_poll += interval
+            delay = next_poll - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_poll = time.monotonic()
+
+    def _users_page(
+        self, resp: Any, limit: int, offset: int
+    ) -> Tuple[List[User], Optional[Pagination]]:
+        """Map a users reply to the users and pagination returned by :meth:`list`."""
+        result = getattr(resp, "result", None)
+        users = users_from_dto(result) if result else []
+
+        pagination = self._extract_pagination(
+            total_items=self._total_items(resp),
+            offset=offset,
+            limit=limit,
+        )
+
+        return users, pagination
 
     def get_users_by_email(self, emails: List[str]) -> List[User]:
         """
@@ -195,31 +339,52 @@ class UserService(BaseService):
         if not emails:
             raise ValueError("emails cannot be empty")
 
-        try:
-            resp = self._users_api.user_service_get_users(
-                limit=None,
-                offset=None,
-                ids=None,
-                external_user_ids=None,
-                emails=emails,
-                query=None,
-                public_key=None,
-                exclude_technical_users=None,
-                roles=None,
-                status=None,
-                totp_enabled=None,
-                group_ids=None,
-            )
+        batches = [
+            emails[i : i + _EMAIL_BATCH_SIZE] for i in range(0, len(emails), _EMAIL_BATCH_SIZE)
+        ]
 
-            result = getattr(resp, "result", None)
-            return users_from_dto(result) if result else []
+        try:
+            if len(batches) == 1:
+                pages = [self._get_user_dtos_by_email(batches[0])]
+            else:
+                workers = min(_EMAIL_BATCH_WORKERS, len(batches))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    pages = list(executor.map(self._get_user_dtos_by_email, batches))
+
+            users = users_from_dto([dto for page in pages for dto in page])
+            # The same user can match emails from different batches
+            return list({user.id: user for user in users}.values())
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
+    def _get_user_dtos_by_email(self, emails: List[str]) -> List[Any]:
+        """
+        Fetch the user DTOs matching one batch of email addresses.
+
+        Args:
+            emails: At most ``_EMAIL_BATCH_SIZE`` email addresses.
+
+        Returns:
+            The raw user DTOs of the reply.
+        """
+        resp = self._users_api.user_service_get_users(
+            limit=str(len(emails)),
+            offset=None,
+            ids=None,
+            external_user_ids=None,
+            emails=emails,
+            query=None,
+            public_key=None,
+            exclude_technical_users=None,
+            roles=None,
+            status=None,
+            totp_enabled=None,
+            group_ids=None,
+        )
+        return getattr(resp, "result", None) or []
+
     def create_user_attribute(self, user_id: str, key: str, value: str) -> None:
         """
         Create an attribute for a user.
@@ -242,9 +407,48 @@ class UserService(BaseService):
                 user_id=user_id,
                 body=body,
             )
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
+            raise self._handle_error(e) from e
 
-            if isinstance(e, (APIError, ValueError)):
-                raise
+    def create_user_attributes(self, user_id: str, attributes: Mapping[str, str]) -> None:
+        """
+        Create several attributes for a user.
+
+        The API has no bulk endpoint, so one request is sent per attribute;
+        the requests run concurrently over the client's connection pool.
+
+        Args:
+            user_id: The user ID to create the attributes for.
+            attributes: Mapping of attribute keys to values.
+
+        Raises:
+            ValueError: If user_id or an attribute key is invalid.
+            APIError: If an API request fails.
+        """
+        self._validate_required(user_id, "user_id")
+        for key in attributes:
+            self._validate_required(key, "key")
+
+        bodies = [
+            UserServiceCreateAttributeBody(key=key, value=value)
+            for key, value in attributes.items()
+        ]
+
+        def create(body: UserServiceCreateAttributeBody) -> None:
+            self._users_api.user_service_create_attribute(user_id=user_id, body=body)
+
+        try:
+            if len(bodies) <= 1:
+                for body in bodies:
+                    create(body)
+            else:
+                workers = min(_ATTRIBUTE_WORKERS, len(bodies))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    # Consume the results so the first failure is raised
+                    list(executor.map(create, bodies))
+        except (APIError, ValueError):
+            raise
+        except Exception as e:
             raise self._handle_error(e) from e
@@ -2,19 +2,41 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
+from taurus_protect.errors import APIError, NotFoundError
 from taurus_protect.mappers.visibility_group import (
     visibility_group_from_dto,
+    visibility_group_user_from_dto,
     visibility_groups_from_dto,
 )
 from taurus_protect.models.pagination import Pagination
-from taurus_protect.models.visibility_group import VisibilityGroup
-from taurus_protect.services._base import BaseService
+from taurus_protect.models.visibility_group import VisibilityGroup, VisibilityGroupUser
+from taurus_protect.services._base import BaseService, SingleFlight, api_call
 
 if TYPE_CHECKING:
     pass  # For OpenAPI types when available
 
+# Groups in API order, and the same groups by ID
+_GroupIndex = Tuple[List[VisibilityGroup], Dict[str, VisibilityGroup]]
+
+# list(include_users=True) runs up to this many user requests at once
+_USER_FETCH_WORKERS = 8
+
+
+def _copy_users(users: List[VisibilityGroupUser]) -> List[VisibilityGroupUser]:
+    """Copy cached group users so callers cannot modify the cache."""
+    return [replace(user) for user in users]
+
+
+def _copy_group(group: VisibilityGroup) -> VisibilityGroup:
+    """Copy a cached group so callers cannot modify the cache."""
+    return replace(group, users=_copy_users(group.users))
+
 
 class VisibilityGroupService(BaseService):
     """
@@ -33,26 +55,51 @@ class VisibilityGroupService(BaseService):
         >>> # Get single visibility group
         >>> group = client.visibility_groups.get("group-123")
         >>> print(f"Description: {group.description}")
+
+    The API can only return every group at once, so fetched groups and
+    group users are kept for ``cache_ttl`` seconds and every method reads
+    them from there first, returning copies. Call :meth:`invalidate` after
+    changing groups.
     """
 
-    def __init__(self, api_client: Any, visibility_groups_api: Any) -> None:
+    DEFAULT_CACHE_TTL: float = 30.0
+
+    def __init__(
+        self,
+        api_client: Any,
+        visibility_groups_api: Any,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+    ) -> None:
         """
         Initialize visibility group service.
 
         Args:
             api_client: The OpenAPI client instance.
             visibility_groups_api: The RestrictedVisibilityGroupsApi service from OpenAPI client.
+            cache_ttl: Seconds to cache fetched groups and users; 0 disables caching.
         """
         super().__init__(api_client)
         self._visibility_groups_api = visibility_groups_api
-
+        self._cache_ttl = cache_ttl
+        self._groups: Optional[Tuple[float, _GroupIndex]] = None
+        self._users: Dict[str, Tuple[float, List[VisibilityGroupUser]]] = {}
+        self._groups_lock = threading.Lock()
+        self._inflight: SingleFlight[_GroupIndex] = SingleFlight()
+
+    def invalidate(self) -> None:
+        """Drop the cached visibility groups and group users."""
+        with self._groups_lock:
+            self._groups = None
+            self._users = {}
+
+    @api_call()
     def get(self, group_id: str) -> VisibilityGroup:
         """
         Get a visibility group by ID.
 
         Note: The API returns users within the group via a separate endpoint.
-        This method fetches the group from the list and enriches it with
-        user information if available.
+        This method finds the group among the cached or freshly listed
+        groups and enriches it with user information if available.
 
         Args:
             group_id: The visibility group ID to retrieve.
@@ -67,59 +114,75 @@ class VisibilityGroupService(BaseService):
         """
         self._validate_required(group_id, "group_id")
 
-        try:
-            # The API doesn't have a direct "get by ID" endpoint for visibility groups
-            # We need to list all groups and find the matching one
-            groups, _ = self.list()
-
-            for group in groups:
-                if group.id == group_id:
-                    # Try to fetch users for this group
-                    try:
-                        users_resp = self._visibility_groups_api.user_service_get_users_by_visibility_group_id(
-                            visibility_group_id=group_id,
-                        )
-                        users_result = getattr(users_resp, "result", None)
-                        if users_result:
-                            from taurus_protect.mappers.visibility_group import (
-                                visibility_group_user_from_dto,
-                            )
-
-                            group.users = [
-                                u
-                                for dto in users_result
-                                if (u := visibility_group_user_from_dto(dto)) is not None
-                            ]
-                    except Exception:
-                        # If we can't fetch users, return the group without them
-                        pass
-                    return group
-
-            from taurus_protect.errors import NotFoundError
-
+        # The API doesn't have a direct "get by ID" endpoint for visibility groups
+        # We need to list all groups and find the matching one
+        cached = self._cached_groups()
+        group = cached[1].get(group_id) if cached is not None else None
+        users = self._cached_users(group_id)
+        if group is None and users is None:
+            # The users request does not depend on the group list, so
+            # send it while the groups are being fetched
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                users_future = executor.submit(self._fetch_group_users, group_id)
+                group = self._fetch_groups()[1].get(group_id)
+                users = users_future.result()
+        elif group is None:
+            group = self._fetch_groups()[1].get(group_id)
+        elif users is None:
+            users = self._fetch_group_users(group_id)
+        if group is None:
             raise NotFoundError(f"Visibility group {group_id} not found")
-        except Exception as e:
-            from taurus_protect.errors import APIError, NotFoundError
 
-            if isinstance(e, (APIError, NotFoundError, ValueError)):
-                raise
-            raise self._handle_error(e) from e
+        # Return a copy so the cached group is never modified
+        return replace(group, users=_copy_users(group.users) if users is None else users)
+
+    @api_call()
+    def get_many(self, group_ids: List[str]) -> Dict[str, VisibilityGroup]:
+        """
+        Get several visibility groups by ID from a single group list.
+
+        Uses the cached groups when fresh, otherwise fetches every group
+        once. Unlike :meth:`get`, group users are not fetched separately.
+
+        Args:
+            group_ids: The visibility group IDs to retrieve.
+
+        Returns:
+            Dict of group ID to group. IDs that match no group are absent.
+
+        Raises:
+            ValueError: If any group_id is invalid.
+            APIError: If API request fails.
+        """
+        for group_id in group_ids:
+            self._validate_required(group_id, "group_id")
+
+        _, by_id = self._groups_index()
+
+        return {
+            group_id: _copy_group(by_id[group_id]) for group_id in group_ids if group_id in by_id
+        }
 
+    @api_call()
     def list(
         self,
         limit: int = 50,
         offset: int = 0,
+        include_users: bool = False,
     ) -> Tuple[List[VisibilityGroup], Optional[Pagination]]:
         """
         List visibility groups with pagination.
 
         Note: The underlying API does not support pagination parameters.
         The limit and offset parameters are provided for interface consistency
-        but filtering is done client-side.
+        but filtering is done client-side: every group is transferred, and
+        with caching disabled only the requested page is mapped.
 
         Args:
             limit: Maximum number of groups to return (must be positive).
             offset: Number of groups to skip (must be non-negative).
+            include_users: Also fetch the users of each returned group,
+                several groups at a time, as :meth:`get` does for one.
 
         Returns:
             Tuple of (visibility groups list, pagination info).
@@ -133,31 +196,136 @@ class VisibilityGroupService(BaseService):
         if offset < 0:
             raise ValueError("offset cannot be negative")
 
+        # Apply client-side pagination since API doesn't support it
+        if self._cache_ttl > 0:
+            all_groups, _ = self._groups_index()
+            total_items = len(all_groups)
+            paginated_groups = [_copy_group(g) for g in all_groups[offset : offset + limit]]
+        else:
+            # Nothing is cached, so skip mapping the groups outside the page
+            dtos = self._fetch_group_dtos()
+            total_items = len(dtos)
+            paginated_groups = visibility_groups_from_dto(dtos[offset : offset + limit])
+        if include_users:
+            self._attach_users(paginated_groups)
+
+        pagination = Pagination(
+            total_items=total_items,
+            offset=offset,
+            limit=limit,
+            has_more=offset + limit < total_items,
+        )
+
+        return paginated_groups, pagination
+
+    def _cached_groups(self) -> Optional[_GroupIndex]:
+        """Return the cached groups, or None if absent or expired."""
+        with self._groups_lock:
+            cached = self._groups
+        if cached is None or time.monotonic() - cached[0] >= self._cache_ttl:
+            return None
+        return cached[1]
+
+    def _groups_index(self) -> _GroupIndex:
+        """Return the cached groups, fetching them if absent or expired."""
+        cached = self._cached_groups()
+        return cached if cached is not None else self._fetch_groups()
+
+    def _attach_users(self, groups: List[VisibilityGroup]) -> None:
+        """Set the users of each (copied) group, fetching uncached users concurrently."""
+        users_by_id = {group.id: self._cached_users(group.id) for group in groups}
+        missing = [group_id for group_id, users in users_by_id.items() if users is None]
+        if missing:
+            workers = min(_USER_FETCH_WORKERS, len(missing))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                users_by_id.update(zip(missing, executor.map(self._fetch_group_users, missing)))
+        for group in groups:
+            users = users_by_id[group.id]
+            if users is not None:
+                group.users = users
+
+    def _cached_users(self, group_id: str) -> Optional[List[VisibilityGroupUser]]:
+        """Return a copy of the cached users of a group, or None if absent or expired."""
+        with self._groups_lock:
+            cached = self._users.get(group_id)
+        if cached is None or time.monotonic() - cached[0] >= self._cache_ttl:
+            return None
+        return _copy_users(cached[1])
+
+    def _fetch_group_users(self, group_id: str) -> Optional[List[VisibilityGroupUser]]:
+        """
+        Fetch and cache the users of a group for :meth:`get` and :meth:`list`.
+
+        Args:
+            group_id: The visibility group ID.
+
+        Returns:
+            The group's users, or None if the request failed or returned none.
+        """
         try:
-            resp = self._visibility_groups_api.user_service_get_visibility_groups()
+            users_resp = self._visibility_groups_api.user_service_get_users_by_visibility_group_id(
+                visibility_group_id=group_id,
+            )
+            users_result = getattr(users_resp, "result", None)
+            if not users_result:
+                return None
+            users = list(filter(None, map(visibility_group_user_from_dto, users_result)))
+        except Exception:
+            # If we can't fetch users, return the group without them
+            return None
+
+        if self._cache_ttl > 0:
+            with self._groups_lock:
+                self._users[group_id] = (time.monotonic(), users)
+        return _copy_users(users)
+
+    def _fetch_groups(self) -> _GroupIndex:
+        """
+        Fetch every visibility group and refresh the cache.
 
-            result = getattr(resp, "result", None)
-            all_groups = visibility_groups_from_dto(result) if result else []
+        Concurrent callers share a single request.
 
-            # Apply client-side pagination since API doesn't support it
-            total_items = len(all_groups)
-            paginated_groups = all_groups[offset : offset + limit]
+        Returns:
+            Tuple of (groups in API order, groups by ID).
+        """
+        return self._inflight.do("groups", self._load_groups)
 
-            pagination = Pagination(
-                total_items=total_items,
-                offset=offset,
-                limit=limit,
-                has_more=offset + limit < total_items,
-            )
+    def _fetch_group_dtos(self) -> List[Any]:
+        """Request every visibility group, returning the unmapped DTOs."""
+        resp = self._visibility_groups_api.user_service_get_visibility_groups()
+
+        result = getattr(resp, "result", None)
+        return [dto for dto in result if dto is not None] if result else []
+
+    def _load_groups(self) -> _GroupIndex:
+        """Request every visibility group for :meth:`_fetch_groups`."""
+        groups = visibility_groups_from_dto(self._fetch_group_dtos())
+        # Built in reverse so the first of any duplicate IDs wins
+        by_id = {group.id: group for group in reversed(groups)}
 
-            return paginated_groups, pagination
-        except Exception as e:
-            from taurus_protect.errors import APIError
+        if self._cache_ttl > 0:
+            with self._groups_lock:
+                self._groups = (time.monotonic(), (groups, by_id))
+        return groups, by_id
 
-            if isinstance(e, (APIError, ValueError)):
-                raise
-            raise self._handle_error(e) from e
+    @api_call(rethrow=(APIError,))
+    def iter_all(self) -> Iterator[VisibilityGroup]:
+        """
+        Iterate over all visibility groups.
+
+        The API returns every group in one response, so at most a single
+        request is made.
+
+        Returns:
+            Iterator over the visibility groups in API order.
+
+        Raises:
+            APIError: If API request fails.
+        """
+        groups, _ = self._groups_index()
+        return map(_copy_group, groups)
 
+    @api_call()
     def get_users(self, group_id: str) -> List[Any]:
         """
         Get users in a visibility group.
@@ -174,23 +342,12 @@ class VisibilityGroupService(BaseService):
         """
         self._validate_required(group_id, "group_id")
 
-        try:
-            resp = self._visibility_groups_api.user_service_get_users_by_visibility_group_id(
-                visibility_group_id=group_id,
-            )
-
-            result = getattr(resp, "result", None)
-            if result is None:
-                return []
-
-            from taurus_protect.mappers.visibility_group import (
-                visibility_group_user_from_dto,
-            )
+        resp = self._visibility_groups_api.user_service_get_users_by_visibility_group_id(
+            visibility_group_id=group_id,
+        )
 
-            return [u for dto in result if (u := visibility_group_user_from_dto(dto)) is not None]
-        except Exception as e:
-            from taurus_protect.errors import APIError
+        result = getattr(resp, "result", None)
+        if result is None:
+            return []
 
-            if isinstance(e, (APIError, ValueError)):
-                raise
-            raise self._handle_error(e) from e
+        return list(filter(None, map(visibility_group_user_from_dto, result)))
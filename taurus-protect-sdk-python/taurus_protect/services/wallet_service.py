@@ -2,8 +2,19 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
 
+from taurus_protect.errors import APIError, NotFoundError
 from taurus_protect.mappers.wallet import (
     asset_balance_from_dto,
     balance_history_point_from_dto,
@@ -14,11 +25,39 @@ from taurus_protect.mappers.wallet import (
 from taurus_protect.models.balance import AssetBalance, BalanceHistoryPoint
 from taurus_protect.models.pagination import Pagination
 from taurus_protect.models.wallet import CreateWalletRequest, ListWalletsOptions, Wallet
-from taurus_protect.services._base import BaseService
+from taurus_protect.services._base import (
+    BaseAsyncService,
+    BaseService,
+    SingleFlight,
+    api_call,
+    int_param,
+)
 
 if TYPE_CHECKING:
     pass  # For OpenAPI types when available
 
+# get_many requests at most this many wallet IDs per call
+_GET_MANY_BATCH_SIZE = 100
+
+# get_balance_histories runs up to this many history requests at once
+_BALANCE_HISTORY_WORKERS = 8
+
+# Unset filters for wallet_service_get_wallets_v2; see WalletService._get_wallets
+_NO_WALLET_FILTERS: Dict[str, Any] = {
+    "currencies": None,
+    "query": None,
+    "limit": None,
+    "offset": None,
+    "name": None,
+    "sort_order": None,
+    "exclude_disabled": None,
+    "tag_ids": None,
+    "only_positive_balance": None,
+    "blockchain": None,
+    "network": None,
+    "ids": None,
+}
+
 
 class WalletService(BaseService):
     """
@@ -56,11 +95,18 @@ class WalletService(BaseService):
         """
         super().__init__(api_client)
         self._wallets_api = wallets_api
+        self._get_inflight: SingleFlight[Wallet] = SingleFlight()
+        self._list_inflight: SingleFlight[Tuple[List[Wallet], Optional[Pagination]]] = (
+            SingleFlight()
+        )
 
+    @api_call()
     def get(self, wallet_id: int) -> Wallet:
         """
         Get a wallet by ID.
 
+        Concurrent calls for the same wallet share a single request.
+
         Args:
             wallet_id: The wallet ID to retrieve.
 
@@ -75,29 +121,59 @@ class WalletService(BaseService):
         if wallet_id <= 0:
             raise ValueError("wallet_id must be positive")
 
-        try:
-            resp = self._wallets_api.wallet_service_get_wallet_v2(str(wallet_id))
+        return self._get_inflight.do(wallet_id, lambda: self._fetch_wallet(wallet_id))
 
-            result = getattr(resp, "result", None)
-            if result is None:
-                from taurus_protect.errors import NotFoundError
+    def _fetch_wallet(self, wallet_id: int) -> Wallet:
+        """Fetch a wallet by ID for :meth:`get`."""
+        resp = self._wallets_api.wallet_service_get_wallet_v2(str(wallet_id))
+
+        result = getattr(resp, "result", None)
+        if result is None:
+            raise NotFoundError(f"Wallet {wallet_id} not found")
 
-                raise NotFoundError(f"Wallet {wallet_id} not found")
+        wallet = wallet_from_dto(result)
+        if wallet is None:
+            raise NotFoundError(f"Wallet {wallet_id} not found")
 
-            wallet = wallet_from_dto(result)
-            if wallet is None:
-                from taurus_protect.errors import NotFoundError
+        return wallet
 
-                raise NotFoundError(f"Wallet {wallet_id} not found")
+    @api_call()
+    def get_many(self, wallet_ids: List[int]) -> Dict[int, Wallet]:
+        """
+        Get several wallets by ID with as few requests as possible.
 
-            return wallet
-        except Exception as e:
-            from taurus_protect.errors import APIError
+        Wallets are requested through the list endpoint's ID filter, up to
+        100 IDs per request, instead of one request per wallet.
 
-            if isinstance(e, (APIError, ValueError)):
-                raise
-            raise self._handle_error(e) from e
+        Args:
+            wallet_ids: The wallet IDs to retrieve.
 
+        Returns:
+            Dict of wallet ID to wallet. IDs that match no wallet are absent.
+
+        Raises:
+            ValueError: If any wallet_id is invalid.
+            APIError: If API request fails.
+        """
+        if any(wallet_id <= 0 for wallet_id in wallet_ids):
+            raise ValueError("wallet_id must be positive")
+
+        ids = [str(wallet_id) for wallet_id in dict.fromkeys(wallet_ids)]
+        found: Dict[str, Wallet] = {}
+        for start in range(0, len(ids), _GET_MANY_BATCH_SIZE):
+            batch = ids[start : start + _GET_MANY_BATCH_SIZE]
+            resp = self._get_wallets(limit=int_param(len(batch)), ids=batch)
+            result = getattr(resp, "result", None)
+            for wallet in wallets_from_dto(result) if result else []:
+                found[wallet.id] = wallet
+
+        return {
+            wallet_id: found[key]
+            for wallet_id, key in zip(dict.fromkeys(wallet_ids), ids)
+            if key in found
+        }
+
+    @api_call()
     def list(
         self,
         limit: int = 50,
@@ -106,6 +182,8 @@ class WalletService(BaseService):
         """
         List wallets with pagination.
 
+        Concurrent calls for the same page share a single request.
+
         Args:
             limit: Maximum number of wallets to return (must be positive).
             offset: Number of wallets to skip (must be non-negative).
@@ -122,39 +200,28 @@ class WalletService(BaseService):
         if offset < 0:
             raise ValueError("offset cannot be negative")
 
-        try:
-            resp = self._wallets_api.wallet_service_get_wallets_v2(
-                currencies=None,
-                query=None,
-                limit=str(limit),
-                offset=str(offset),
-                name=None,
-                sort_order=None,
-                exclude_disabled=None,
-                tag_ids=None,
-                only_positive_balance=None,
-                blockchain=None,
-                network=None,
-                ids=None,
-            )
+        wallets, pagination = self._list_inflight.do(
+            (limit, offset), lambda: self._fetch_page(limit, offset)
+        )
+        # Each caller gets its own list; the wallets themselves are frozen
+        return list(wallets), pagination
 
-            result = getattr(resp, "result", None)
-            wallets = wallets_from_dto(result) if result else []
+    def _fetch_page(self, limit: int, offset: int) -> Tuple[List[Wallet], Optional[Pagination]]:
+        """Fetch a page of wallets for :meth:`list`."""
+        resp = self._get_wallets(limit=int_param(limit), offset=int_param(offset))
 
-            pagination = self._extract_pagination(
-                total_items=getattr(resp, "total_items", None),
-                offset=getattr(resp, "offset", None),
-                limit=limit,
-            )
+        result = getattr(resp, "result", None)
+        wallets = wallets_from_dto(result) if result else []
 
-            return wallets, pagination
-        except Exception as e:
-            from taurus_protect.errors import APIError
+        pagination = self._extract_pagination(
+            total_items=self._total_items(resp),
+            offset=getattr(resp, "offset", None),
+            limit=limit,
+        )
 
-            if isinstance(e, (APIError, ValueError)):
-                raise
-            raise self._handle_error(e) from e
+        return wallets, pagination
 
+    @api_call(rethrow=(APIError,))
     def list_with_options(
         self,
         options: Optional[ListWalletsOptions] = None,
@@ -173,41 +240,82 @@ class WalletService(BaseService):
         """
         opts = options or ListWalletsOptions()
 
-        try:
-            currencies = [opts.currency] if opts.currency else None
-
-            resp = self._wallets_api.wallet_service_get_wallets_v2(
-                currencies=currencies,
-                query=opts.query,
-                limit=str(opts.limit) if opts.limit > 0 else None,
-                offset=str(opts.offset) if opts.offset > 0 else None,
-                name=None,
-                sort_order=None,
-                exclude_disabled=opts.exclude_disabled if opts.exclude_disabled else None,
-                tag_ids=None,
-                only_positive_balance=None,
-                blockchain=None,
-                network=None,
-                ids=None,
-            )
+        currencies = [opts.currency] if opts.currency else None
 
-            result = getattr(resp, "result", None)
-            wallets = wallets_from_dto(result) if result else []
+        resp = self._get_wallets(
+            currencies=currencies,
+            query=opts.query,
+            limit=int_param(opts.limit) if opts.limit > 0 else None,
+            offset=int_param(opts.offset) if opts.offset > 0 else None,
+            exclude_disabled=opts.exclude_disabled if opts.exclude_disabled else None,
+        )
+
+        result = getattr(resp, "result", None)
+        wallets = wallets_from_dto(result) if result else []
+
+        pagination = self._extract_pagination(
+            total_items=self._total_items(resp),
+            offset=getattr(resp, "offset", None),
+            limit=opts.limit,
+        )
+
+        return wallets, pagination
+
+    def iter_all(
+        self,
+        currency: Optional[str] = None,
+        query: Optional[str] = None,
+        exclude_disabled: bool = False,
+        page_size: int = 200,
+    ) -> Iterator[Wallet]:
+        """
+        Iterate over all matching wallets, fetching pages as needed.
+
+        Args:
+            currency: Filter by currency.
+            query: Search query.
+            exclude_disabled: Exclude disabled wallets.
+            page_size: Number of wallets requested per page (1 to 1000).
 
-            pagination = self._extract_pagination(
-                total_items=getattr(resp, "total_items", None),
-                offset=getattr(resp, "offset", None),
-                limit=opts.limit,
-            )
+        Yields:
+            Wallets in API order.
 
-            return wallets, pagination
-        except Exception as e:
-            from taurus_protect.errors import APIError
+        Raises:
+            ValueError: If page_size is out of range.
+            APIError: If an API request fails.
+        """
+        if not 1 <= page_size <= 1000:
+            raise ValueError("page_size must be between 1 and 1000")
+
+        options = ListWalletsOptions(
+            limit=page_size,
+            currency=currency,
+            query=query,
+            exclude_disabled=exclude_disabled,
+        )
+        return self._iter_pages(options)
 
-            if isinstance(e, APIError):
-                raise
-            raise self._handle_error(e) from e
+    def _get_wallets(self, **filters: Any) -> Any:
+        """Call wallet_service_get_wallets_v2 with every filter not given left unset."""
+        return self._wallets_api.wallet_service_get_wallets_v2(**{**_NO_WALLET_FILTERS, **filters})
 
+    def _iter_pages(self, options: ListWalletsOptions) -> Iterator[Wallet]:
+        """
+        Walk the wallet pages for :meth:`iter_all`.
+
+        The server may return fewer wallets than requested, so the offset
+        advances by the wallets received, and the walk stops on an empty page
+        or once the reported total is reached rather than on a short page.
+        """
+        while True:
+            wallets, pagination = self.list_with_options(options)
+            yield from wallets
+            offset = options.offset + len(wallets)
+            if not wallets or (pagination is not None and 0 < pagination.total_items <= offset):
+                return
+            options = options.model_copy(update={"offset": offset})
+
+    @api_call()
     def get_by_name(
         self,
         name: str,
@@ -235,38 +343,18 @@ class WalletService(BaseService):
         if offset < 0:
             raise ValueError("offset cannot be negative")
 
-        try:
-            resp = self._wallets_api.wallet_service_get_wallets_v2(
-                currencies=None,
-                query=None,
-                limit=str(limit),
-                offset=str(offset),
-                name=name,
-                sort_order=None,
-                exclude_disabled=None,
-                tag_ids=None,
-                only_positive_balance=None,
-                blockchain=None,
-                network=None,
-                ids=None,
-            )
-
-            result = getattr(resp, "result", None)
-            wallets = wallets_from_dto(result) if result else []
+        resp = self._get_wallets(limit=int_param(limit), offset=int_param(offset), name=name)
 
-            pagination = self._extract_pagination(
-                total_items=getattr(resp, "total_items", None),
-                offset=getattr(resp, "offset", None),
-                limit=limit,
-            )
+        result = getattr(resp, "result", None)
+        wallets = wallets_from_dto(result) if result else []
 
-            return wallets, pagination
-        except Exception as e:
-            from taurus_protect.errors import APIError
+        pagination = self._extract_pagination(
+            total_items=self._total_items(resp),
+            offset=getattr(resp, "offset", None),
+            limit=limit,
+        )
 
-            if isinstance(e, (APIError, ValueError)):
-                raise
-            raise self._handle_error(e) from e
+        return wallets, pagination
 
     def create(self, request: CreateWalletRequest) -> Wallet:
         """
@@ -285,11 +373,8 @@ class WalletService(BaseService):
         """
         if request is None:
             raise ValueError("request cannot be None")
-        self._validate_required(request.blockchain, "blockchain")
-        self._validate_required(request.network, "network")
-        self._validate_required(request.name, "name")
 
-        return self._create_wallet(
+        return self.create_wallet(
             blockchain=request.blockchain,
             network=request.network,
             name=request.name,
@@ -298,6 +383,7 @@ class WalletService(BaseService):
             customer_id=request.customer_id or "",
         )
 
+    @api_call()
     def create_wallet(
         self,
         blockchain: str,
@@ -329,59 +415,29 @@ class WalletService(BaseService):
         self._validate_required(network, "network")
         self._validate_required(name, "name")
 
-        return self._create_wallet(
-            blockchain=blockchain,
-            network=network,
-            name=name,
-            is_omnibus=is_omnibus,
-            comment=comment,
-            customer_id=customer_id,
-        )
+        # Build request - field names depend on generated OpenAPI client
+        body = {
+            "blockchain": blockchain,
+            "network": network,
+            "name": name,
+            "is_omnibus": is_omnibus,
+        }
+        if comment:
+            body["comment"] = comment
+        if customer_id:
+            body["customer_id"] = customer_id
 
-    def _create_wallet(
-        self,
-        blockchain: str,
-        network: str,
-        name: str,
-        is_omnibus: bool,
-        comment: str,
-        customer_id: str,
-    ) -> Wallet:
-        """Internal wallet creation implementation."""
-        try:
-            # Build request - field names depend on generated OpenAPI client
-            body = {
-                "blockchain": blockchain,
-                "network": network,
-                "name": name,
-                "is_omnibus": is_omnibus,
-            }
-            if comment:
-                body["comment"] = comment
-            if customer_id:
-                body["customer_id"] = customer_id
-
-            resp = self._wallets_api.wallet_service_create_wallet(body=body)
+        resp = self._wallets_api.wallet_service_create_wallet(body=body)
 
-            result = getattr(resp, "result", None)
-            if result is None:
-                from taurus_protect.errors import APIError
+        result = getattr(resp, "result", None)
+        if result is None:
+            raise APIError(500, "Failed to create wallet: no result returned")
 
-                raise APIError(500, "Failed to create wallet: no result returned")
+        wallet = wallet_from_create_dto(result)
+        if wallet is None:
+            raise APIError(500, "Failed to create wallet: invalid response")
 
-            wallet = wallet_from_create_dto(result)
-            if wallet is None:
-                from taurus_protect.errors import APIError
-
-                raise APIError(500, "Failed to create wallet: invalid response")
-
-            return wallet
-        except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
-            raise self._handle_error(e) from e
+        return wallet
 
     def create_attribute(
         self,
@@ -401,23 +457,35 @@ class WalletService(BaseService):
             ValueError: If any argument is invalid.
             APIError: If API request fails.
         """
-        if wallet_id <= 0:
-            raise ValueError("wallet_id must be positive")
-        self._validate_required(key, "key")
-        self._validate_required(value, "value")
+        self.create_attributes(wallet_id, {key: value})
 
-        try:
-            body = {
-                "attributes": [{"key": key, "value": value}],
-            }
-            self._wallets_api.wallet_service_create_wallet_attributes(str(wallet_id), body=body)
-        except Exception as e:
-            from taurus_protect.errors import APIError
+    @api_call()
+    def create_attributes(self, wallet_id: int, attributes: Mapping[str, str]) -> None:
+        """
+        Create several attributes for a wallet in a single request.
 
-            if isinstance(e, (APIError, ValueError)):
-                raise
-            raise self._handle_error(e) from e
+        Args:
+            wallet_id: The wallet ID.
+            attributes: Mapping of attribute keys to values.
 
+        Raises:
+            ValueError: If any argument is invalid.
+            APIError: If API request fails.
+        """
+        if wallet_id <= 0:
+            raise ValueError("wallet_id must be positive")
+        for key, value in attributes.items():
+            self._validate_required(key, "key")
+            self._validate_required(value, "value")
+        if not attributes:
+            return
+
+        body = {
+            "attributes": [{"key": key, "value": value} for key, value in attributes.items()],
+        }
+        self._wallets_api.wallet_service_create_wallet_attributes(str(wallet_id), body=body)
+
+    @api_call()
     def get_balance_history(
         self,
         wallet_id: int,
@@ -442,23 +510,55 @@ class WalletService(BaseService):
         if interval_hours <= 0:
             raise ValueError("interval_hours must be positive")
 
-        try:
-            resp = self._wallets_api.wallet_service_get_wallet_balance_history(
-                str(wallet_id),
-                str(interval_hours),
-            )
+        resp = self._wallets_api.wallet_service_get_wallet_balance_history(
+            str(wallet_id),
+            int_param(interval_hours),
+        )
 
-            result = getattr(resp, "result", None)
-            if result is None:
-                return []
+        result = getattr(resp, "result", None)
+        if result is None:
+            return []
 
-            return [p for dto in result if (p := balance_history_point_from_dto(dto)) is not None]
-        except Exception as e:
-            from taurus_protect.errors import APIError
+        return list(filter(None, map(balance_history_point_from_dto, result)))
 
-            if isinstance(e, (APIError, ValueError)):
-                raise
-            raise self._handle_error(e) from e
+    def get_balance_histories(
+        self,
+        wallet_ids: List[int],
+        interval_hours: int,
+    ) -> Dict[int, List[BalanceHistoryPoint]]:
+        """
+        Get the balance history of several wallets.
+
+        The API has no bulk endpoint, so one request is sent per wallet;
+        the requests run concurrently over the client's connection pool.
+
+        Args:
+            wallet_ids: The wallet IDs.
+            interval_hours: The interval in hours for balance snapshots.
+
+        Returns:
+            Dict of wallet ID to its balance history points.
+
+        Raises:
+            ValueError: If arguments are invalid.
+            APIError: If an API request fails.
+        """
+        if any(wallet_id <= 0 for wallet_id in wallet_ids):
+            raise ValueError("wallet_id must be positive")
+        if interval_hours <= 0:
+            raise ValueError("interval_hours must be positive")
+
+        ids = list(dict.fromkeys(wallet_ids))
+
+        def history(wallet_id: int) -> List[BalanceHistoryPoint]:
+            return self.get_balance_history(wallet_id, interval_hours)
+
+        if len(ids) <= 1:
+            return {wallet_id: history(wallet_id) for wallet_id in ids}
+
+        workers = min(_BALANCE_HISTORY_WORKERS, len(ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(ids, executor.map(history, ids)))
 
     def get_tokens(
         self,
@@ -468,6 +568,9 @@ class WalletService(BaseService):
         """
         Get wallet tokens (asset balances).
 
+        Only the first page is returned; use :meth:`iter_tokens` to get
+        every token of a wallet.
+
         Args:
             wallet_id: The wallet ID.
             limit: Maximum number of tokens to return.
@@ -484,21 +587,115 @@ class WalletService(BaseService):
         if limit <= 0:
             raise ValueError("limit must be positive")
 
-        try:
-            resp = self._wallets_api.wallet_service_get_wallet_tokens(
-                str(wallet_id),
-                str(limit),
-                None,  # cursor
-            )
+        balances, _ = self._tokens_page(wallet_id, int_param(limit), None)
+        return balances
+
+    def iter_tokens(self, wallet_id: int, page_size: int = 200) -> Iterator[AssetBalance]:
+        """
+        Iterate over all tokens of a wallet, following the API cursor.
+
+        Args:
+            wallet_id: The wallet ID.
+            page_size: Number of tokens requested per page.
+
+        Yields:
+            Asset balances in API order.
+
+        Raises:
+            ValueError: If arguments are invalid.
+            APIError: If an API request fails.
+        """
+        if wallet_id <= 0:
+            raise ValueError("wallet_id must be positive")
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+
+        return self._iter_token_pages(wallet_id, int_param(page_size))
+
+    def _iter_token_pages(self, wallet_id: int, limit: str) -> Iterator[AssetBalance]:
+        """Walk the token pages for :meth:`iter_tokens`."""
+        cursor: Optional[Any] = None
+        while True:
+            balances, cursor = self._tokens_page(wallet_id, limit, cursor)
+            yield from balances
+            if not balances or not cursor:
+                return
+
+    @api_call()
+    def _tokens_page(
+        self, wallet_id: int, limit: str, cursor: Optional[Any]
+    ) -> Tuple[List[AssetBalance], Optional[Any]]:
+        """Fetch one page of wallet tokens, returning it with the next cursor."""
+        resp = self._wallets_api.wallet_service_get_wallet_tokens(str(wallet_id), limit, cursor)
+
+        balances = getattr(resp, "balances", None)
+        if balances is None:
+            return [], None
+
+        return (
+            list(filter(None, map(asset_balance_from_dto, balances))),
+            getattr(resp, "next", None),
+        )
+
+
+class AsyncWalletService(BaseAsyncService[WalletService]):
+    """
+    Asyncio interface to a :class:`WalletService`.
+
+    Each call runs the blocking request on a worker thread; see
+    :class:`BaseAsyncService` for the concurrency limit and lifecycle.
+
+    Example:
+        >>> async with AsyncWalletService(client.wallets) as wallets:
+        ...     tokens = await asyncio.gather(*(wallets.get_tokens(w.id) for w in page))
+    """
+
+    _THREAD_NAME_PREFIX = "taurus-protect-wallet"
 
-            balances = getattr(resp, "balances", None)
-            if balances is None:
-                return []
+    async def get(self, wallet_id: int) -> Wallet:
+        """Async version of :meth:`WalletService.get`."""
+        return await self._run(self._service.get, wallet_id)
 
-            return [b for dto in balances if (b := asset_balance_from_dto(dto)) is not None]
-        except Exception as e:
-            from taurus_protect.errors import APIError
+    async def get_many(self, wallet_ids: List[int]) -> Dict[int, Wallet]:
+        """Async version of :meth:`WalletService.get_many`."""
+        return await self._run(self._service.get_many, wallet_ids)
 
-            if isinstance(e, (APIError, ValueError)):
-                raise
-            raise self._handle_error(e) from e
+    async def list(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> Tuple[List[Wallet], Optional[Pagination]]:
+        """Async version of :meth:`WalletService.list`."""
+        return await self._run(self._service.list, limit, offset)
+
+    async def list_with_options(
+        self,
+        options: Optional[ListWalletsOptions] = None,
+    ) -> Tuple[List[Wallet], Optional[Pagination]]:
+        """Async version of :meth:`WalletService.list_with_options`."""
+        return await self._run(self._service.list_with_options, options)
+
+    async def get_by_name(
+        self,
+        name: str,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> Tuple[List[Wallet], Optional[Pagination]]:
+        """Async version of :meth:`WalletService.get_by_name`."""
+        return await self._run(self._service.get_by_name, name, limit, offset)
+
+    async def get_balance_history(
+        self,
+        wallet_id: int,
+        interval_hours: int,
+    ) -> List[BalanceHistoryPoint]:
+        """Async version of :meth:`WalletService.get_balance_history`."""
+        return await self._run(self._service.get_balance_history, wallet_id, interval_hours)
+
+    async def get_tokens(
+        self,
+        wallet_id: int,
+        limit: int = 50,
+    ) -> List[AssetBalance]:
+        """Async version of :meth:`WalletService.get_tokens`."""
+        return await self._run(self._service.get_tokens, wallet_id, limit)
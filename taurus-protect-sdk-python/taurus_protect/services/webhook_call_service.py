@@ -3,18 +3,40 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
+from taurus_protect.cache.lru_cache import LRUCache
+from taurus_protect.errors import APIError, NotFoundError
 from taurus_protect.mappers.webhook import webhook_call_from_dto, webhook_calls_from_dto
 from taurus_protect.models.pagination import Pagination
 from taurus_protect.models.webhook import WebhookCall
-from taurus_protect.services._base import BaseService
+from taurus_protect.services._base import (
+    DATACLASS_SLOTS,
+    BaseService,
+    CursorPage,
+    SingleFlight,
+    TTLCache,
+    api_call,
+    int_param,
+    iter_prefetched_pages,
+    next_cursor_page,
+)
 
 if TYPE_CHECKING:
     pass  # For OpenAPI types when available
 
+# list() filters, page size and cursor
+_PageKey = Tuple[Optional[str], Optional[str], Optional[str], Optional[str], int, Optional[str]]
+# Same as _PageKey, but the page size may be left to the API default
+_RequestKey = Tuple[
+    Optional[str], Optional[str], Optional[str], Optional[str], Optional[int], Optional[str]
+]
 
-@dataclass
+# get() scans the call history this many calls per request
+_GET_PAGE_SIZE = "100"
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ApiRequestCursor:
     """
     Cursor for paginated API requests.
@@ -30,7 +52,7 @@ class ApiRequestCursor:
     page_size: int = 50
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class WebhookCallResult:
     """
     Result from webhook calls list operation.
@@ -70,18 +92,66 @@ class WebhookCallService(BaseService):
         ...     webhook_id="webhook-123",
         ...     limit=50,
         ... )
+
+    With ``cache_enabled=True``, calls returned by :meth:`get_webhook_calls`,
+    :meth:`list` and :meth:`get` are kept in a bounded LRU cache that
+    :meth:`get` reads first. Cached calls are returned as first seen, so
+    their status and attempts are not refreshed as deliveries are retried;
+    the cache is off by default for that reason. Use :meth:`clear_cache`
+    to drop them.
+
+    With a positive ``page_cache_ttl``, pages returned by :meth:`list` are
+    kept for that many seconds, so asking for the same page again does not
+    send another request. A cached page does not show new calls or status
+    changes until it expires, so page caching is off by default.
+    Concurrent :meth:`list` calls for the same page, and concurrent
+    :meth:`get` calls for the same call, share a single request.
     """
 
-    def __init__(self, api_client: Any, webhook_calls_api: Any) -> None:
+    DEFAULT_CACHE_SIZE: int = 512
+    DEFAULT_GET_MAX_PAGES: int = 5
+    DEFAULT_PAGE_CACHE_TTL: float = 0.0
+
+    def __init__(
+        self,
+        api_client: Any,
+        webhook_calls_api: Any,
+        cache_enabled: bool = False,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        page_cache_ttl: float = DEFAULT_PAGE_CACHE_TTL,
+    ) -> None:
         """
         Initialize webhook call service.
 
         Args:
             api_client: The OpenAPI client instance.
             webhook_calls_api: The WebhookCallsApi service from OpenAPI client.
+            cache_enabled: Whether to cache the calls seen by :meth:`get`.
+            cache_size: Maximum number of cached calls.
+            page_cache_ttl: Seconds to cache pages returned by :meth:`list`;
+                0 (the default) disables caching.
         """
         super().__init__(api_client)
         self._webhook_calls_api = webhook_calls_api
+        self._cache: LRUCache[str, WebhookCall] = LRUCache(cache_size if cache_enabled else 0)
+        self._pages: TTLCache[_PageKey, Tuple[List[WebhookCall], Optional[Pagination]]] = TTLCache(
+            page_cache_ttl
+        )
+        self._list_inflight: SingleFlight[Tuple[List[WebhookCall], Optional[Pagination]]] = (
+            SingleFlight()
+        )
+        self._get_inflight: SingleFlight[WebhookCall] = SingleFlight()
+
+    def clear_cache(self) -> None:
+        """Drop all cached webhook calls and :meth:`list` pages."""
+        self._cache.clear()
+        self._pages.clear()
+
+    def _cache_put(self, calls: List[WebhookCall]) -> None:
+        """Cache ``calls`` by ID."""
+        # WebhookCall is a frozen model, so the cached instances can be shared.
+        for call in calls:
+            self._cache.put(call.id, call)
 
     def get_webhook_calls(
         self,
@@ -123,48 +193,28 @@ class WebhookCallService(BaseService):
             ...     next_cursor = ApiRequestCursor(current_page=result.cursor)
             ...     result = client.webhook_calls.get_webhook_calls(cursor=next_cursor)
         """
-        cursor_current_page = None
-        cursor_page_request = None
-        cursor_page_size = None
-
+        current_page = None
+        page_request = None
+        page_size = None
         if cursor is not None:
-            cursor_current_page = cursor.current_page
-            cursor_page_request = cursor.page_request
-            cursor_page_size = str(cursor.page_size) if cursor.page_size else None
+            current_page = cursor.current_page
+            page_request = cursor.page_request
+            page_size = cursor.page_size or None
+        key: _RequestKey = (webhook_id, event_id, status, sort_order, page_size, current_page)
 
         try:
-            resp = self._webhook_calls_api.webhook_service_get_webhook_calls(
-                event_id=event_id,
-                webhook_id=webhook_id,
-                status=status,
-                cursor_current_page=cursor_current_page,
-                cursor_page_request=cursor_page_request,
-                cursor_page_size=cursor_page_size,
-                sort_order=sort_order,
-            )
-
-            # Extract calls from response
-            calls_dto = getattr(resp, "calls", None) or getattr(resp, "result", None)
+            calls_dto, next_cursor, has_more = self._request_page(key, page_request)
             calls = webhook_calls_from_dto(calls_dto) if calls_dto else []
-
-            # Extract cursor for pagination
-            cursor_resp = getattr(resp, "cursor", None)
-            next_cursor = None
-            has_more = False
-            if cursor_resp:
-                next_cursor = getattr(cursor_resp, "current_page", None)
-                has_more = bool(next_cursor)
+            self._cache_put(calls)
 
             return WebhookCallResult(
                 calls=calls,
                 cursor=next_cursor,
                 has_more=has_more,
             )
+        except APIError:
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, APIError):
-                raise
             raise self._handle_error(e) from e
 
     def list(
@@ -210,90 +260,217 @@ class WebhookCallService(BaseService):
         if limit <= 0:
             raise ValueError("limit must be positive")
 
-        try:
-            resp = self._webhook_calls_api.webhook_service_get_webhook_calls(
-                event_id=event_id,
-                webhook_id=webhook_id,
-                status=status,
-                cursor_current_page=cursor,
-                cursor_page_request=None,
-                cursor_page_size=str(limit),
-                sort_order=sort_order,
-            )
+        key: _PageKey = (webhook_id, event_id, status, sort_order, limit, cursor)
+        page = self._pages.get(key)
+        if page is None:
+            page = self._list_inflight.do(key, lambda: self._fetch_list_page(key))
+        # Each caller gets its own list; the calls themselves are frozen
+        return list(page[0]), page[1]
+
+    @api_call()
+    def _fetch_list_page(self, key: _PageKey) -> Tuple[List[WebhookCall], Optional[Pagination]]:
+        """Fetch and cache a page of webhook calls for :meth:`list`."""
+        calls_dto, _, has_more = self._request_page(key)
+        calls = webhook_calls_from_dto(calls_dto) if calls_dto else []
+        self._cache_put(calls)
+
+        pagination = Pagination(
+            total_items=len(calls),
+            offset=0,
+            limit=key[4],
+            has_more=has_more,
+        )
+
+        self._pages.put(key, (calls, pagination))
+        return calls, pagination
+
+    @api_call()
+    def count(
+        self,
+        webhook_id: Optional[str] = None,
+        event_id: Optional[str] = None,
+        status: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Tuple[int, Optional[str]]:
+        """
+        Count the webhook calls of a page without converting them.
 
-            # Extract calls from response
-            calls_dto = getattr(resp, "calls", None) or getattr(resp, "result", None)
-            calls = webhook_calls_from_dto(calls_dto) if calls_dto else []
+        Sends the same request as :meth:`list` but skips mapping the calls,
+        for callers that only need the page size or whether more calls
+        follow, e.g. when polling for new failures.
 
-            # Extract cursor for pagination
-            cursor_resp = getattr(resp, "cursor", None)
-            next_cursor = None
-            has_more = False
-            if cursor_resp:
-                next_cursor = getattr(cursor_resp, "current_page", None)
-                has_more = bool(next_cursor)
-
-            pagination = Pagination(
-                total_items=len(calls),
-                offset=0,
-                limit=limit,
-                has_more=has_more,
-            )
+        Args:
+            webhook_id: Filter by webhook ID (optional).
+            event_id: Filter by event ID (optional).
+            status: Filter by call status (optional, e.g., "SUCCESS", "FAILED").
+            sort_order: Sort order for results (optional, "ASC" or "DESC").
+            limit: Maximum number of calls to count (must be positive).
+            cursor: Pagination cursor for the page (optional).
 
-            return calls, pagination
-        except Exception as e:
-            from taurus_protect.errors import APIError
+        Returns:
+            Tuple of (number of calls in the page, cursor of the next page or None).
 
-            if isinstance(e, (APIError, ValueError)):
-                raise
-            raise self._handle_error(e) from e
+        Raises:
+            ValueError: If limit is invalid.
+            APIError: If API request fails.
+        """
+        if limit <= 0:
+            raise ValueError("limit must be positive")
+
+        key: _PageKey = (webhook_id, event_id, status, sort_order, limit, cursor)
+        calls_dto, next_cursor, _ = self._request_page(key)
+        return len(calls_dto or ()), next_cursor
+
+    def _request_page(
+        self, key: _RequestKey, page_request: Optional[str] = None
+    ) -> Tuple[Optional[List[Any]], Optional[str], bool]:
+        """
+        Request one page of webhook calls.
+
+        Returns:
+            Tuple of (call DTOs or None, cursor of the next page or None, whether more follow).
+        """
+        webhook_id, event_id, status, sort_order, limit, cursor = key
+        resp = self._webhook_calls_api.webhook_service_get_webhook_calls(
+            event_id=event_id,
+            webhook_id=webhook_id,
+            status=status,
+            cursor_current_page=cursor,
+            cursor_page_request=page_request,
+            cursor_page_size=int_param(limit) if limit is not None else None,
+            sort_order=sort_order,
+        )
+
+        calls_dto = getattr(resp, "calls", None) or getattr(resp, "result", None)
+        cursor_resp = getattr(resp, "cursor", None)
+        next_cursor = getattr(cursor_resp, "current_page", None) if cursor_resp else None
+        return calls_dto, next_cursor or None, bool(next_cursor)
+
+    def iter_all(
+        self,
+        webhook_id: Optional[str] = None,
+        event_id: Optional[str] = None,
+        status: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        page_size: int = 100,
+    ) -> Iterator[WebhookCall]:
+        """
+        Iterate over all matching webhook calls, following the API cursor.
+
+        While the calls of one page are converted and yielded, the next
+        page is already being fetched on a background thread.
+
+        Args:
+            webhook_id: Filter by webhook ID (optional).
+            event_id: Filter by event ID (optional).
+            status: Filter by call status (optional, e.g., "SUCCESS", "FAILED").
+            sort_order: Sort order for results (optional, "ASC" or "DESC").
+            page_size: Number of calls requested per page (must be positive).
+
+        Yields:
+            Webhook calls in API order.
+
+        Raises:
+            ValueError: If page_size is invalid.
+            APIError: If an API request fails.
+        """
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+
+        params = {
+            "event_id": event_id,
+            "webhook_id": webhook_id,
+            "status": status,
+            "sort_order": sort_order,
+            "cursor_page_size": int_param(page_size),
+        }
+        return self._iter_prefetched_pages(params)
+
+    @api_call(rethrow=(APIError,))
+    def _fetch_page(
+        self,
+        params: Dict[str, Any],
+        current_page: Optional[str],
+        page_request: Optional[str],
+    ) -> Any:
+        """Fetch one page of webhook calls."""
+        return self._webhook_calls_api.webhook_service_get_webhook_calls(
+            cursor_current_page=current_page, cursor_page_request=page_request, **params
+        )
+
+    def _iter_prefetched_pages(self, params: Dict[str, Any]) -> Iterator[WebhookCall]:
+        """Walk the webhook call pages for :meth:`iter_all`, fetching one page ahead."""
+        first: CursorPage = (None, None)
+        pages = iter_prefetched_pages(
+            lambda page: self._fetch_page(params, *page), first, next_cursor_page
+        )
+        for resp in pages:
+            calls_dto = getattr(resp, "calls", None) or getattr(resp, "result", None)
+            yield from webhook_calls_from_dto(calls_dto) if calls_dto else []
 
-    def get(self, call_id: str) -> WebhookCall:
+    def get(self, call_id: str, max_pages: int = DEFAULT_GET_MAX_PAGES) -> WebhookCall:
         """
         Get a webhook call by ID.
 
-        Note: This method lists webhook calls and filters by ID since the API
-        does not provide a direct get-by-ID endpoint.
+        Note: The API does not provide a direct get-by-ID endpoint, so calls
+        not in the cache are searched for page by page through the call
+        history, newest first. Only the ``max_pages`` newest pages of 100
+        calls are searched, so older calls are reported as not found.
 
         Args:
             call_id: The webhook call ID to retrieve.
+            max_pages: Maximum number of history pages to search (must be positive).
 
         Returns:
             The webhook call.
 
         Raises:
-            ValueError: If call_id is empty.
-            NotFoundError: If webhook call not found.
+            ValueError: If call_id is empty or max_pages is invalid.
+            NotFoundError: If webhook call not found within ``max_pages`` pages.
             APIError: If API request fails.
         """
         self._validate_required(call_id, "call_id")
-
-        try:
-            # List all calls and find the one with matching ID
+        if max_pages <= 0:
+            raise ValueError("max_pages must be positive")
+
+        cached = self._cache.get(call_id)
+        if cached is not None:
+            return cached
+
+        return self._get_inflight.do(
+            (call_id, max_pages), lambda: self._find_call(call_id, max_pages)
+        )
+
+    @api_call()
+    def _find_call(self, call_id: str, max_pages: int) -> WebhookCall:
+        """Search up to ``max_pages`` pages of the call history for :meth:`get`."""
+        current_page: Optional[str] = None
+        for _ in range(max_pages):
             resp = self._webhook_calls_api.webhook_service_get_webhook_calls(
                 event_id=None,
                 webhook_id=None,
                 status=None,
-                cursor_current_page=None,
-                cursor_page_request=None,
-                cursor_page_size="100",
+                cursor_current_page=current_page,
+                cursor_page_request="NEXT" if current_page else None,
+                cursor_page_size=_GET_PAGE_SIZE,
                 sort_order=None,
             )
 
             calls_dto = getattr(resp, "calls", None)
-            if calls_dto:
-                for dto in calls_dto:
-                    if getattr(dto, "id", None) == call_id:
-                        call = webhook_call_from_dto(dto)
-                        if call:
-                            return call
-
-            from taurus_protect.errors import NotFoundError
-
-            raise NotFoundError(f"Webhook call {call_id} not found")
-        except Exception as e:
-            from taurus_protect.errors import APIError, NotFoundError
-
-            if isinstance(e, (APIError, NotFoundError, ValueError)):
-                raise
-            raise self._handle_error(e) from e
+            dto = next((d for d in calls_dto or () if getattr(d, "id", None) == call_id), None)
+            call = webhook_call_from_dto(dto) if dto is not None else None
+            if call:
+                self._cache_put([call])
+                return call
+
+            cursor = getattr(resp, "cursor", None)
+            if not calls_dto or cursor is None or not getattr(cursor, "has_next", False):
+                break
+            next_page = getattr(cursor, "current_page", None)
+            if not next_page or next_page == current_page:
+                break
+            current_page = next_page
+
+        raise NotFoundError(f"Webhook call {call_id} not found")
@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
+from taurus_protect.errors import APIError, NotFoundError
 from taurus_protect.mappers.webhook import webhook_from_dto, webhooks_from_dto
 from taurus_protect.models.pagination import Pagination
 from taurus_protect.models.webhook import Webhook
-from taurus_protect.services._base import BaseService
+from taurus_protect.services._base import BaseService, TTLCache
 
 if TYPE_CHECKING:
     pass  # For OpenAPI types when available
 
+# get() looks webhooks up in one page of this size
+_GET_PAGE_SIZE = "100"
+
+# There is no bulk create endpoint; create_many() sends up to
+# _CREATE_WORKERS create requests at once
+_CREATE_WORKERS = 8
+
 
 class WebhookService(BaseService):
     """
@@ -38,18 +47,43 @@ class WebhookService(BaseService):
         >>>
         >>> # Delete webhook
         >>> client.webhooks.delete("webhook-123")
+
+    With a positive ``page_cache_ttl``, pages returned by :meth:`list`, and
+    the page :meth:`get` searches, are kept for that many seconds, so asking
+    for the same page again does not send another request. Cached pages do
+    not show changes made elsewhere until they expire, so page caching is
+    off by default. :meth:`create` and :meth:`delete` drop the cached pages.
     """
 
-    def __init__(self, api_client: Any, webhooks_api: Any) -> None:
+    DEFAULT_PAGE_CACHE_TTL: float = 0.0
+
+    def __init__(
+        self,
+        api_client: Any,
+        webhooks_api: Any,
+        page_cache_ttl: float = DEFAULT_PAGE_CACHE_TTL,
+    ) -> None:
         """
         Initialize webhook service.
 
         Args:
             api_client: The OpenAPI client instance.
             webhooks_api: The WebhooksAPI service from OpenAPI client.
+            page_cache_ttl: Seconds to cache pages returned by :meth:`list`
+                and searched by :meth:`get`; 0 (the default) disables caching.
         """
         super().__init__(api_client)
         self._webhooks_api = webhooks_api
+        self._pages: TTLCache[Tuple[int, int], Tuple[List[Webhook], Optional[Pagination]]] = (
+            TTLCache(page_cache_ttl)
+        )
+        # Webhook DTOs by ID from the page searched by get()
+        self._index: TTLCache[str, Dict[Optional[str], Any]] = TTLCache(page_cache_ttl, maxsize=1)
+
+    def clear_cache(self) -> None:
+        """Drop the cached :meth:`list` and :meth:`get` pages."""
+        self._pages.clear()
+        self._index.clear()
 
     def list(
         self,
@@ -75,6 +109,11 @@ class WebhookService(BaseService):
         if offset < 0:
             raise ValueError("offset cannot be negative")
 
+        cached = self._pages.get((limit, offset))
+        if cached is not None:
+            # Each caller gets its own list; the webhooks themselves are frozen
+            return list(cached[0]), cached[1]
+
         try:
             resp = self._webhooks_api.webhook_service_get_webhooks(
                 type=None,
@@ -92,19 +131,18 @@ class WebhookService(BaseService):
             cursor = getattr(resp, "cursor", None)
             pagination = None
             if cursor:
-                total_items = getattr(cursor, "total_items", None)
+                total_items = self._total_items(cursor)
                 pagination = self._extract_pagination(
                     total_items=total_items,
                     offset=offset,
                     limit=limit,
                 )
 
-            return webhooks, pagination
+            self._pages.put((limit, offset), (webhooks, pagination))
+            return list(webhooks), pagination
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def get(self, webhook_id: str) -> Webhook:
@@ -128,32 +166,31 @@ class WebhookService(BaseService):
         self._validate_required(webhook_id, "webhook_id")
 
         try:
-            # List webhooks and find the one with matching ID
-            resp = self._webhooks_api.webhook_service_get_webhooks(
-                type=None,
-                url=None,
-                cursor_current_page=None,
-                cursor_page_request=None,
-                cursor_page_size="100",
-                sort_order=None,
-            )
-
-            webhooks_dto = getattr(resp, "webhooks", None)
-            if webhooks_dto:
-                for dto in webhooks_dto:
-                    if getattr(dto, "id", None) == webhook_id:
-                        webhook = webhook_from_dto(dto)
-                        if webhook:
-                            return webhook
+            index = self._index.get("webhooks")
+            dto = index.get(webhook_id) if index is not None else None
+            if dto is None:
+                # List webhooks and index them by ID for the following calls
+                resp = self._webhooks_api.webhook_service_get_webhooks(
+                    type=None,
+                    url=None,
+                    cursor_current_page=None,
+                    cursor_page_request=None,
+                    cursor_page_size=_GET_PAGE_SIZE,
+                    sort_order=None,
+                )
+                webhooks_dto = getattr(resp, "webhooks", None) or []
+                index = {getattr(d, "id", None): d for d in webhooks_dto}
+                self._index.put("webhooks", index)
+                dto = index.get(webhook_id)
 
-            from taurus_protect.errors import NotFoundError
+            webhook = webhook_from_dto(dto) if dto is not None else None
+            if webhook:
+                return webhook
 
             raise NotFoundError(f"Webhook {webhook_id} not found")
+        except (APIError, NotFoundError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError, NotFoundError
-
-            if isinstance(e, (APIError, NotFoundError, ValueError)):
-                raise
             raise self._handle_error(e) from e
 
     def create(
@@ -172,46 +209,89 @@ class WebhookService(BaseService):
             The created webhook.
 
         Raises:
-            ValueError: If url is empty or events is empty.
+            ValueError: If url is empty, events is empty or an event type is
+                blank or contains a comma.
             APIError: If API request fails.
         """
-        self._validate_required(url, "url")
-        if not events:
-            raise ValueError("events cannot be empty")
+        self._validate_create(url, events)
 
         try:
-            # Build request body
-            body = {
-                "url": url,
-                "type": ",".join(events),  # API expects comma-separated event types
-            }
-
-            resp = self._webhooks_api.webhook_service_create_webhook(body=body)
+            return self._create_webhook(url, events)
+        except (APIError, ValueError):
+            raise
+        except Exception as e:
+            raise self._handle_error(e) from e
+        finally:
+            self.clear_cache()
 
-            # Response contains the created webhook
-            webhook_dto = getattr(resp, "webhook", None)
-            if webhook_dto is None:
-                # Try to get from result field
-                webhook_dto = getattr(resp, "result", None)
+    def create_many(self, webhooks: Sequence[Tuple[str, List[str]]]) -> List[Webhook]:
+        """
+        Create several webhooks.
 
-            if webhook_dto is None:
-                from taurus_protect.errors import APIError
+        The create requests are sent concurrently, up to 8 at a time. If one
+        of them fails, the webhooks created by the others are kept and the
+        first error is raised.
 
-                raise APIError(500, "Failed to create webhook: no result returned")
+        Args:
+            webhooks: ``(url, events)`` pairs, as passed to :meth:`create`.
 
-            webhook = webhook_from_dto(webhook_dto)
-            if webhook is None:
-                from taurus_protect.errors import APIError
+        Returns:
+            The created webhooks, in the order of ``webhooks``.
 
-                raise APIError(500, "Failed to create webhook: invalid response")
+        Raises:
+            ValueError: If any url, events or event type is invalid.
+            APIError: If an API request fails.
+        """
+        for url, events in webhooks:
+            self._validate_create(url, events)
+        if not webhooks:
+            return []
 
-            return webhook
+        try:
+            workers = min(_CREATE_WORKERS, len(webhooks))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(lambda w: self._create_webhook(*w), webhooks))
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
+        finally:
+            self.clear_cache()
+
+    def _validate_create(self, url: str, events: List[str]) -> None:
+        """Validate the arguments of one webhook to create."""
+        self._validate_required(url, "url")
+        if not events:
+            raise ValueError("events cannot be empty")
+        # The API takes the event types as one comma-separated string
+        for event in events:
+            if not event or not event.strip() or "," in event:
+                raise ValueError(f"invalid event type: {event!r}")
+
+    def _create_webhook(self, url: str, events: List[str]) -> Webhook:
+        """Send the create request for one webhook."""
+        # Build request body
+        body = {
+            "url": url,
+            "type": ",".join(events),  # API expects comma-separated event types
+        }
+
+        resp = self._webhooks_api.webhook_service_create_webhook(body=body)
+
+        # Response contains the created webhook
+        webhook_dto = getattr(resp, "webhook", None)
+        if webhook_dto is None:
+            # Try to get from result field
+            webhook_dto = getattr(resp, "result", None)
+
+        if webhook_dto is None:
+            raise APIError(500, "Failed to create webhook: no result returned")
+
+        webhook = webhook_from_dto(webhook_dto)
+        if webhook is None:
+            raise APIError(500, "Failed to create webhook: invalid response")
+
+        return webhook
 
     def delete(self, webhook_id: str) -> None:
         """
@@ -229,9 +309,8 @@ class WebhookService(BaseService):
 
         try:
             self._webhooks_api.webhook_service_delete_webhook(id=webhook_id)
+            self.clear_cache()
+        except (APIError, ValueError):
+            raise
         except Exception as e:
-            from taurus_protect.errors import APIError
-
-            if isinstance(e, (APIError, ValueError)):
-                raise
             raise self._handle_error(e) from e
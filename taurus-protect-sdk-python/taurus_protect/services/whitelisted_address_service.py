@@ -136,10 +136,8 @@ class WhitelistedAddressService(BaseService):
             return envelope
         except IntegrityError:
             raise
-        except Exception as e:
-            if isinstance(e, ApiException):
-                raise self._handle_error(e)
-            raise
+        except ApiException as e:
+            raise self._handle_error(e) from e
 
     def list(
         self,
@@ -196,17 +194,15 @@ class WhitelistedAddressService(BaseService):
                         addresses.append(envelope.verified_whitelisted_address)
 
             pagination = self._extract_pagination(
-                getattr(reply, "total_items", None),
+                self._total_items(reply),
                 offset,
                 limit,
             )
             return addresses, pagination
         except IntegrityError:
             raise
-        except Exception as e:
-            if isinstance(e, ApiException):
-                raise self._handle_error(e)
-            raise
+        except ApiException as e:
+            raise self._handle_error(e) from e
 
     def _verify_and_populate_envelope(
         self,
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 from cryptography.hazmat.primitives.asymmetric.ec import EllipticCurvePublicKey
 
 from taurus_protect._internal.openapi.exceptions import ApiException
+from taurus_protect.errors import IntegrityError, NotFoundError
 from taurus_protect.models.pagination import Pagination
 from taurus_protect.models.whitelisted_address import (
     SignedContractAddress,
@@ -101,18 +102,14 @@ class WhitelistedAssetService(BaseService):
             reply = self._api.whitelist_service_get_whitelisted_contract(id=str(asset_id))
             result = reply.result
             if result is None:
-                from taurus_protect.errors import NotFoundError
-
                 raise NotFoundError(f"Whitelisted asset {asset_id} not found")
 
             asset = self._map_asset_from_dto(result)
             self._verify_asset(asset, dto=result)
 
             return asset
-        except Exception as e:
-            if isinstance(e, ApiException):
-                raise self._handle_error(e)
-            raise
+        except ApiException as e:
+            raise self._handle_error(e) from e
 
     def list(
         self,
@@ -161,15 +158,13 @@ class WhitelistedAssetService(BaseService):
                     assets.append(asset)
 
             pagination = self._extract_pagination(
-                getattr(reply, "total_items", None),
+                self._total_items(reply),
                 offset,
                 limit,
             )
             return assets, pagination
-        except Exception as e:
-            if isinstance(e, ApiException):
-                raise self._handle_error(e)
-            raise
+        except ApiException as e:
+            raise self._handle_error(e) from e
 
     def _verify_asset(
         self,
@@ -195,8 +190,6 @@ class WhitelistedAssetService(BaseService):
             or not asset.rules_container
             or asset.signed_contract_address is None
         ):
-            from taurus_protect.errors import IntegrityError
-
             raise IntegrityError("verification enabled but required data missing")
 
         from taurus_protect.mappers.governance_rules import (
@@ -0,0 +1,33 @@
+"""Tests for LRUCache."""
+
+from taurus_protect.cache.lru_cache import LRUCache
+
+
+class TestLRUCache:
+    """Tests for LRUCache."""
+
+    def test_drops_least_recently_used_entry(self) -> None:
+        cache: LRUCache[str, int] = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+    def test_zero_maxsize_disables_caching(self) -> None:
+        cache: LRUCache[str, int] = LRUCache(maxsize=0)
+        cache.put("key", 1)
+
+        assert cache.get("key") is None
+
+    def test_pop_and_clear(self) -> None:
+        cache: LRUCache[str, int] = LRUCache(maxsize=4)
+        cache.put("a", 1)
+        cache.put("b", 2)
+
+        assert cache.pop("a") == 1
+        assert cache.pop("a") is None
+        cache.clear()
+        assert cache.get("b") is None
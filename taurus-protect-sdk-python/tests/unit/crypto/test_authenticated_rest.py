@@ -1,5 +1,6 @@
 """Tests for AuthenticatedRESTClient."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -65,26 +66,35 @@ class TestAuthenticatedRESTClient:
             assert headers["Authorization"].startswith("TPV1-HMAC-SHA256 ApiKey=test-api-key")
 
     def test_request_with_json_body(self, mock_configuration, tpv1_auth):
-        """Test that request properly handles JSON body for signing."""
+        """Test that a JSON body is serialized once and the signed bytes are sent."""
         client = AuthenticatedRESTClient(mock_configuration, tpv1_auth)
+        client.pool_manager = MagicMock()
 
         with patch.object(
             AuthenticatedRESTClient.__bases__[0], "request", return_value=MagicMock()
-        ) as mock_request:
+        ) as mock_request, patch.object(
+            tpv1_auth, "sign_request", wraps=tpv1_auth.sign_request
+        ) as mock_sign:
             body = {"name": "test-wallet", "currency": "BTC"}
             client.request(
                 method="POST",
                 url="https://api.example.com/v1/wallets",
                 headers={"Content-Type": "application/json"},
                 body=body,
+                _request_timeout=5,
             )
 
-            mock_request.assert_called_once()
-
-            # Verify the body was passed through unchanged
-            call_kwargs = mock_request.call_args
-            passed_body = call_kwargs.kwargs.get("body") or call_kwargs[1].get("body")
-            assert passed_body == body
+            # The base client is bypassed so the body is not encoded twice
+            mock_request.assert_not_called()
+            client.pool_manager.request.assert_called_once()
+
+            # Verify the sent bytes are exactly the signed JSON
+            call_kwargs = client.pool_manager.request.call_args
+            sent_body = call_kwargs.kwargs["body"]
+            assert sent_body == json.dumps(body).encode("utf-8")
+            assert mock_sign.call_args.kwargs["body"] == sent_body.decode("utf-8")
+            assert "Authorization" in call_kwargs.kwargs["headers"]
+            assert call_kwargs.kwargs["timeout"].total == 5
 
     def test_request_with_string_body(self, mock_configuration, tpv1_auth):
         """Test that request properly handles string body."""
@@ -1,10 +1,15 @@
 """Tests for base mapper utilities."""
 
 from datetime import datetime, timezone
+from types import SimpleNamespace
 
 import pytest
 
+from taurus_protect._internal.openapi.models.tgvalidatord_transaction import (
+    TgvalidatordTransaction,
+)
 from taurus_protect.mappers._base import (
+    dto_fields,
     parse_string_to_int,
     safe_bool,
     safe_datetime,
@@ -222,3 +227,31 @@ class TestParseStringToInt:
         """Test custom default value."""
         assert parse_string_to_int(None, default=50) == 50
         assert parse_string_to_int("abc", default=50) == 50
+
+
+class TestDtoFields:
+    """Tests for dto_fields function."""
+
+    def test_generated_dto(self) -> None:
+        """Test declared fields are read and undeclared ones default."""
+        fields = dto_fields(TgvalidatordTransaction(id="1", hash="0xabc"))
+        assert fields.get("hash") == "0xabc"
+        assert fields.get("tx_hash") is None
+        assert fields.get("tx_hash", "") == ""
+
+    def test_plain_object(self) -> None:
+        """Test objects with a __dict__."""
+        assert dto_fields(SimpleNamespace(id="1")).get("id") == "1"
+
+    def test_object_without_dict(self) -> None:
+        """Test slotted objects fall back to getattr."""
+
+        class Slotted:
+            __slots__ = ("id",)
+
+            def __init__(self) -> None:
+                self.id = "1"
+
+        fields = dto_fields(Slotted())
+        assert fields.get("id") == "1"
+        assert fields.get("missing", "x") == "x"
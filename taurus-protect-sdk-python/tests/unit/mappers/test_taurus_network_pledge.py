@@ -0,0 +1,46 @@
+"""Unit tests for Taurus Network pledge mappers."""
+
+from types import SimpleNamespace
+
+from taurus_protect.mappers.taurus_network.pledge import pledge_action_from_dto
+
+
+def _action_dto(**overrides: object) -> SimpleNamespace:
+    fields = dict(
+        id="a-1",
+        pledge_id="p-1",
+        action_type="CREATE_PLEDGE",
+        status="PENDING",
+        metadata=SimpleNamespace(hash="abc123", payload="{}"),
+        rule=None,
+        needs_approval_from=["team-1"],
+        pledge_withdrawal_id=None,
+        envelope=None,
+        trails=[],
+        created_at="2024-01-15T10:30:00Z",
+        last_approval_date=None,
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+class TestPledgeActionFromDto:
+    """Tests for pledge_action_from_dto function."""
+
+    def test_maps_fields(self) -> None:
+        result = pledge_action_from_dto(_action_dto())
+        assert result is not None
+        assert result.id == "a-1"
+        assert result.metadata is not None
+        assert result.metadata.hash == "abc123"
+        assert result.needs_approval_from == ["team-1"]
+
+    def test_returns_none_for_none(self) -> None:
+        assert pledge_action_from_dto(None) is None
+
+    def test_maps_each_dto_separately(self) -> None:
+        first = pledge_action_from_dto(_action_dto())
+        second = pledge_action_from_dto(_action_dto(needs_approval_from=["team-2"]))
+        assert first is not None and second is not None
+        assert first.needs_approval_from == ["team-1"]
+        assert second.needs_approval_from == ["team-2"]
@@ -73,6 +73,20 @@ class TestMapTransaction:
         assert result.tx_hash == "0xfallback"
         assert result.block_height == 200
 
+    def test_maps_generated_dto(self) -> None:
+        from taurus_protect._internal.openapi.models.tgvalidatord_transaction import (
+            TgvalidatordTransaction,
+        )
+
+        result = map_transaction(
+            TgvalidatordTransaction(id="tx-3", hash="0xabc", currency="ETH", status="CONFIRMED")
+        )
+        assert result.id == "tx-3"
+        assert result.tx_hash == "0xabc"
+        assert result.currency == "ETH"
+        assert result.wallet_id == ""
+        assert result.confirmations == 0
+
     def test_handles_all_none_fields(self) -> None:
         dto = SimpleNamespace(
             id=None,
@@ -123,3 +137,23 @@ class TestMapTransactions:
 
     def test_returns_empty_for_empty(self) -> None:
         assert map_transactions([]) == []
+
+
+class TestTransactionInterning:
+    """Tests for sharing equal mapped transactions."""
+
+    def test_reuses_live_equal_transaction(self) -> None:
+        first = map_transaction(SimpleNamespace(id="tx-intern-1", status="CONFIRMED"))
+        second = map_transaction(SimpleNamespace(id="tx-intern-1", status="CONFIRMED"))
+        assert second is first
+
+    def test_remaps_changed_transaction(self) -> None:
+        first = map_transaction(SimpleNamespace(id="tx-intern-2", confirmations=1))
+        second = map_transaction(SimpleNamespace(id="tx-intern-2", confirmations=2))
+        assert second is not first
+        assert second.confirmations == 2
+        assert map_transaction(SimpleNamespace(id="tx-intern-2", confirmations=2)) is second
+
+    def test_does_not_intern_without_id(self) -> None:
+        dto = SimpleNamespace(tx_hash="0xabc")
+        assert map_transaction(dto) is not map_transaction(dto)
@@ -0,0 +1,129 @@
+"""Tests for Taurus Network pledge domain models."""
+
+import pickle
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from taurus_protect.models.taurus_network.pledge import (
+    ListPledgeActionsOptions,
+    ListPledgesOptions,
+    Pledge,
+    PledgeAction,
+    PledgeActionMetadata,
+    PledgeAttribute,
+    PledgeWithdrawal,
+)
+
+
+class TestPledge:
+    """Tests for Pledge model."""
+
+    def _make_pledge(self) -> Pledge:
+        return Pledge(
+            id="p-1",
+            shared_address_id="sa-1",
+            currency_id="ETH",
+            amount="1000",
+            status="CONFIRMED",
+            attributes=[PledgeAttribute(key="desk", value="otc")],
+            created_at=datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc),
+        )
+
+    def test_pledge_is_frozen(self) -> None:
+        """Test that pledge is immutable."""
+        pledge = self._make_pledge()
+
+        with pytest.raises(ValidationError):
+            pledge.amount = "2000"  # type: ignore
+
+    def test_json_roundtrip(self) -> None:
+        """Test that pledge survives a JSON roundtrip."""
+        pledge = self._make_pledge()
+
+        assert Pledge.model_validate_json(pledge.model_dump_json()) == pledge
+
+    def test_pickle_roundtrip(self) -> None:
+        """Test that pledge survives a pickle roundtrip."""
+        pledge = self._make_pledge()
+
+        assert pickle.loads(pickle.dumps(pledge)) == pledge
+
+
+class TestPledgeAction:
+    """Tests for PledgeAction model."""
+
+    def _make_action(self) -> PledgeAction:
+        return PledgeAction(
+            id="a-1",
+            pledge_id="p-1",
+            action_type="CREATE_PLEDGE",
+            status="PENDING",
+            metadata=PledgeActionMetadata(hash="abc123", payload="{}"),
+            needs_approval_from=["team-1"],
+        )
+
+    def test_action_is_frozen(self) -> None:
+        """Test that action and its metadata are immutable."""
+        action = self._make_action()
+
+        with pytest.raises(ValidationError):
+            action.id = "a-2"  # type: ignore
+        with pytest.raises(ValidationError):
+            action.metadata.hash = "other"  # type: ignore
+
+    def test_json_roundtrip(self) -> None:
+        """Test that action survives a JSON roundtrip."""
+        action = self._make_action()
+
+        assert PledgeAction.model_validate_json(action.model_dump_json()) == action
+
+    def test_pickle_roundtrip(self) -> None:
+        """Test that action survives a pickle roundtrip."""
+        action = self._make_action()
+
+        assert pickle.loads(pickle.dumps(action)) == action
+
+
+class TestPledgeWithdrawal:
+    """Tests for PledgeWithdrawal model."""
+
+    def test_json_and_pickle_roundtrip(self) -> None:
+        """Test that withdrawal survives JSON and pickle roundtrips."""
+        withdrawal = PledgeWithdrawal(id="w-1", pledge_id="p-1", amount="10", tx_hash="0xabc")
+
+        assert PledgeWithdrawal.model_validate_json(withdrawal.model_dump_json()) == withdrawal
+        assert pickle.loads(pickle.dumps(withdrawal)) == withdrawal
+
+
+class TestListPledgesOptions:
+    """Tests for pledge list options."""
+
+    def test_options_are_frozen(self) -> None:
+        """Test that options cannot change after their query params are derived."""
+        opts = ListPledgesOptions(limit=10)
+
+        with pytest.raises(ValidationError):
+            opts.limit = 20  # type: ignore
+
+    def test_query_params_are_computed_once(self) -> None:
+        """Test that query params are derived once and reused."""
+        opts = ListPledgesOptions(limit=10, currency_id="ETH", statuses=[])
+
+        params = opts._query_params
+
+        assert params["cursor_page_size"] == "10"
+        assert params["currency_id"] == "ETH"
+        assert params["statuses"] is None
+        assert opts._query_params is params
+
+    def test_model_copy_recomputes_query_params(self) -> None:
+        """Test that a modified copy does not reuse stale query params."""
+        opts = ListPledgeActionsOptions(limit=10)
+        assert opts._query_params["limit"] == "10"
+
+        copied = opts.model_copy(update={"limit": 20, "offset": 5})
+
+        assert copied._query_params["limit"] == "20"
+        assert copied._query_params["offset"] == "5"
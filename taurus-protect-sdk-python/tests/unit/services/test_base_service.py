@@ -0,0 +1,252 @@
+"""Unit tests for BaseService helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from taurus_protect._internal.openapi.exceptions import ApiException
+from taurus_protect.errors import APIError, NotFoundError, ServerError
+from taurus_protect.services._base import (
+    BaseAsyncService,
+    BaseService,
+    SingleFlight,
+    TTLCache,
+    api_call,
+    int_param,
+    iter_prefetched_pages,
+    next_cursor_page,
+)
+
+
+class _Service(BaseService):
+    def __init__(self, error: Exception) -> None:
+        super().__init__(MagicMock())
+        self._error = error
+
+    @api_call()
+    def call(self) -> None:
+        """Raise the configured error."""
+        raise self._error
+
+    @api_call(rethrow=(APIError,))
+    def call_api_only(self) -> None:
+        raise self._error
+
+
+class TestApiCall:
+    """Tests for the api_call decorator."""
+
+    def test_returns_result(self) -> None:
+        class Service(BaseService):
+            @api_call()
+            def get(self, value: int) -> int:
+                return value * 2
+
+        assert Service(MagicMock()).get(21) == 42
+
+    def test_maps_api_exception(self) -> None:
+        error = ApiException(status=404, reason="Not Found")
+
+        with pytest.raises(NotFoundError) as exc_info:
+            _Service(error).call()
+
+        assert exc_info.value.__cause__ is error
+
+    @pytest.mark.parametrize("error", [NotFoundError("missing"), ValueError("bad")])
+    def test_rethrows_listed_errors(self, error: Exception) -> None:
+        with pytest.raises(type(error)) as exc_info:
+            _Service(error).call()
+
+        assert exc_info.value is error
+
+    def test_wraps_unlisted_errors(self) -> None:
+        with pytest.raises(ServerError):
+            _Service(ValueError("bad")).call_api_only()
+
+    def test_preserves_metadata(self) -> None:
+        assert _Service.call.__name__ == "call"
+        assert _Service.call.__doc__ == "Raise the configured error."
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    def _run_concurrently(self, flight: SingleFlight, func, callers: int = 4) -> list:
+        started = threading.Event()
+        release = threading.Event()
+        results: list = []
+
+        def slow():
+            started.set()
+            release.wait(5)
+            return func()
+
+        def call(fn) -> None:
+            try:
+                results.append(flight.do("key", fn))
+            except Exception as e:  # noqa: BLE001 - collected for assertions
+                results.append(e)
+
+        threads = [threading.Thread(target=call, args=(slow,))]
+        threads[0].start()
+        started.wait(5)
+        threads += [threading.Thread(target=call, args=(func,)) for _ in range(callers - 1)]
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.1)  # let the other callers reach the in-flight call
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        return results
+
+    def test_coalesces_concurrent_calls(self) -> None:
+        flight: SingleFlight[object] = SingleFlight()
+        calls = []
+        result = object()
+
+        results = self._run_concurrently(flight, lambda: calls.append(1) or result)
+
+        assert calls == [1]
+        assert results == [result] * 4
+
+    def test_shares_exceptions(self) -> None:
+        flight: SingleFlight[object] = SingleFlight()
+        error = NotFoundError("missing")
+
+        def fail():
+            raise error
+
+        results = self._run_concurrently(flight, fail)
+
+        assert results == [error] * 4
+
+    def test_does_not_keep_completed_calls(self) -> None:
+        flight: SingleFlight[int] = SingleFlight()
+
+        assert flight.do("key", lambda: 1) == 1
+        assert flight.do("key", lambda: 2) == 2
+
+
+class TestTotalItems:
+    """Tests for BaseService._total_items."""
+
+    def test_reads_total_items(self) -> None:
+        assert BaseService._total_items(SimpleNamespace(total_items="42")) == "42"
+
+    def test_returns_none_when_missing(self) -> None:
+        assert BaseService._total_items(SimpleNamespace()) is None
+
+
+class TestIntParam:
+    """Tests for int_param."""
+
+    @pytest.mark.parametrize("value", [0, 50, 1024, 1025, 123456])
+    def test_formats_value(self, value: int) -> None:
+        assert int_param(value) == str(value)
+
+    def test_reuses_small_value_strings(self) -> None:
+        assert int_param(200) is int_param(200)
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_returns_stored_value_until_expired(self) -> None:
+        cache: TTLCache[str, int] = TTLCache(ttl=30)
+        with patch("taurus_protect.services._base.time.monotonic", side_effect=[0.0, 29.0, 30.0]):
+            cache.put("key", 1)
+            assert cache.get("key") == 1
+            assert cache.get("key") is None
+
+    def test_drops_oldest_entries_over_maxsize(self) -> None:
+        cache: TTLCache[str, int] = TTLCache(ttl=30, maxsize=2)
+        for i, key in enumerate("abc"):
+            cache.put(key, i)
+
+        assert cache.get("a") is None
+        assert (cache.get("b"), cache.get("c")) == (1, 2)
+
+    def test_zero_ttl_disables_caching(self) -> None:
+        cache: TTLCache[str, int] = TTLCache(ttl=0)
+        cache.put("key", 1)
+
+        assert cache.get("key") is None
+
+    def test_clear(self) -> None:
+        cache: TTLCache[str, int] = TTLCache(ttl=30)
+        cache.put("key", 1)
+        cache.clear()
+
+        assert cache.get("key") is None
+
+
+class TestIterPrefetchedPages:
+    """Tests for iter_prefetched_pages and next_cursor_page."""
+
+    def test_yields_replies_until_last_page(self) -> None:
+        fetched = []
+
+        def fetch(page: int) -> str:
+            fetched.append(page)
+            return f"reply-{page}"
+
+        replies = iter_prefetched_pages(
+            fetch, 0, lambda reply, page: page + 1 if page < 2 else None
+        )
+
+        assert list(replies) == ["reply-0", "reply-1", "reply-2"]
+        assert fetched == [0, 1, 2]
+
+    def test_fetches_next_page_before_yielding(self) -> None:
+        prefetched = threading.Event()
+
+        def fetch(page: int) -> int:
+            if page == 1:
+                prefetched.set()
+            return page
+
+        replies = iter_prefetched_pages(fetch, 0, lambda reply, page: 1 if page == 0 else None)
+
+        assert next(replies) == 0
+        assert prefetched.wait(5)
+        replies.close()
+
+    def test_propagates_fetch_errors(self) -> None:
+        def fetch(page: int) -> int:
+            raise NotFoundError("missing")
+
+        with pytest.raises(NotFoundError):
+            list(iter_prefetched_pages(fetch, 0, lambda reply, page: None))
+
+    def test_next_cursor_page(self) -> None:
+        def reply(current_page: object, has_next: bool) -> SimpleNamespace:
+            return SimpleNamespace(
+                cursor=SimpleNamespace(current_page=current_page, has_next=has_next)
+            )
+
+        assert next_cursor_page(reply("p2", True), (None, None)) == ("p2", "NEXT")
+        assert next_cursor_page(reply("p2", False), (None, None)) is None
+        assert next_cursor_page(reply(None, True), (None, None)) is None
+        assert next_cursor_page(SimpleNamespace(cursor=None), (None, None)) is None
+
+
+class TestBaseAsyncService:
+    """Tests for BaseAsyncService."""
+
+    class _AsyncService(BaseAsyncService[BaseService]):
+        _THREAD_NAME_PREFIX = "test-async"
+
+    def test_runs_calls_on_worker_threads(self) -> None:
+        async def run() -> list:
+            async with self._AsyncService(BaseService(MagicMock()), max_concurrency=2) as svc:
+                return await asyncio.gather(
+                    *(svc._run(lambda: threading.current_thread().name) for _ in range(3))
+                )
+
+        assert all(name.startswith("test-async") for name in asyncio.run(run()))
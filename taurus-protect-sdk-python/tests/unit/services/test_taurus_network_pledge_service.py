@@ -23,6 +23,16 @@ class TestGetPledge:
         with pytest.raises(ValueError, match="pledge_id"):
             service.get_pledge(pledge_id="")
 
+    @pytest.mark.parametrize(
+        "pledge_id, message",
+        [(None, "pledge_id cannot be None"), ("   ", "pledge_id cannot be empty")],
+    )
+    def test_rejects_none_and_blank_id(self, pledge_id, message) -> None:
+        service, api = self._make_service()
+        with pytest.raises(ValueError, match=message):
+            service.get_pledge(pledge_id=pledge_id)
+        api.taurus_network_service_get_pledge.assert_not_called()
+
     def test_raises_not_found_when_none(self) -> None:
         service, api = self._make_service()
         resp = MagicMock()
@@ -56,6 +66,25 @@ class TestListPledges:
 
         assert pledges == []
 
+    def test_passes_filters(self) -> None:
+        service, api = self._make_service()
+        resp = MagicMock()
+        resp.result = None
+        resp.total_items = None
+        resp.offset = None
+        api.taurus_network_service_get_pledges.return_value = resp
+        from taurus_protect.models.taurus_network.pledge import ListPledgesOptions
+
+        service.list_pledges(ListPledgesOptions(limit=25, currency_id="ETH", direction="ASC"))
+
+        api.taurus_network_service_get_pledges.assert_called_once_with(
+            statuses=None,
+            currency_id="ETH",
+            owner_participant_id=None,
+            sort_order="ASC",
+            cursor_page_size="25",
+        )
+
 
 class TestCreatePledge:
     """Tests for PledgeService.create_pledge()."""
@@ -83,6 +112,92 @@ class TestCreatePledge:
         with pytest.raises(ValueError, match="shared_address_id"):
             service.create_pledge(req=req)
 
+    def test_builds_request_body(self) -> None:
+        service, api = self._make_service()
+        from datetime import datetime, timezone
+        from types import SimpleNamespace
+
+        from taurus_protect.models.taurus_network.pledge import (
+            CreatePledgeRequest,
+            PledgeDurationSetup,
+        )
+
+        api.taurus_network_service_create_pledge.return_value = SimpleNamespace(
+            result=SimpleNamespace(id="p-1"),
+            action=SimpleNamespace(id="a-1"),
+        )
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        req = CreatePledgeRequest(
+            shared_address_id="sa-1",
+            currency_id="ETH",
+            amount="1000",
+            pledge_duration_setup=PledgeDurationSetup(start_date=start),
+        )
+
+        service.create_pledge(req=req)
+
+        body = api.taurus_network_service_create_pledge.call_args.kwargs["body"]
+        assert body == {
+            "sharedAddressID": "sa-1",
+            "currencyID": "ETH",
+            "amount": "1000",
+            "pledgeType": "NO_WITHDRAWALS_RIGHTS",
+            "pledgeDurationSetup": {"startDate": start.isoformat()},
+        }
+
+
+class TestCreatePledges:
+    """Tests for PledgeService.create_pledges()."""
+
+    def _make_service(self) -> tuple:
+        api_client = MagicMock()
+        pledge_api = MagicMock()
+        service = PledgeService(api_client=api_client, pledge_api=pledge_api)
+        return service, pledge_api
+
+    def test_returns_results_in_input_order(self) -> None:
+        service, api = self._make_service()
+        from types import SimpleNamespace
+
+        from taurus_protect.models.taurus_network.pledge import CreatePledgeRequest
+
+        def create(body: dict) -> SimpleNamespace:
+            pledge_id = "p-" + body["amount"]
+            return SimpleNamespace(
+                result=SimpleNamespace(id=pledge_id, amount=body["amount"]),
+                action=SimpleNamespace(id="a-" + body["amount"], pledge_id=pledge_id),
+            )
+
+        api.taurus_network_service_create_pledge.side_effect = create
+        reqs = [
+            CreatePledgeRequest(shared_address_id="sa-1", currency_id="ETH", amount=str(i))
+            for i in range(5)
+        ]
+
+        results = service.create_pledges(reqs, max_in_flight=3)
+
+        assert [pledge.id for pledge, _ in results] == ["p-0", "p-1", "p-2", "p-3", "p-4"]
+        assert [action.pledge_id for _, action in results] == [
+            "p-0", "p-1", "p-2", "p-3", "p-4"
+        ]
+
+    def test_validates_all_before_sending(self) -> None:
+        service, api = self._make_service()
+        from taurus_protect.models.taurus_network.pledge import CreatePledgeRequest
+
+        reqs = [
+            CreatePledgeRequest(shared_address_id="sa-1", currency_id="ETH", amount="1"),
+            CreatePledgeRequest(shared_address_id="sa-1", currency_id="", amount="1"),
+        ]
+        with pytest.raises(ValueError, match="currency_id"):
+            service.create_pledges(reqs)
+        api.taurus_network_service_create_pledge.assert_not_called()
+
+    def test_raises_on_invalid_max_in_flight(self) -> None:
+        service, _ = self._make_service()
+        with pytest.raises(ValueError, match="max_in_flight"):
+            service.create_pledges([], max_in_flight=0)
+
 
 class TestApprovePledgeActions:
     """Tests for PledgeService.approve_pledge_actions()."""
@@ -128,6 +243,25 @@ class TestApprovePledgeActions:
                 actions=[action], private_key=MagicMock()
             )
 
+    @pytest.mark.parametrize("order", [["a-1", "a-2", "a-3"], ["a-3", "a-1", "a-2"]])
+    def test_signs_actions_sorted_by_id(self, ecdsa_private_key, order) -> None:
+        service, api = self._make_service()
+        api.taurus_network_service_approve_pledge_actions.return_value = MagicMock(
+            approved_count=3
+        )
+        actions = []
+        for action_id in order:
+            action = MagicMock()
+            action.id = action_id
+            action.metadata.hash = "hash-" + action_id
+            actions.append(action)
+
+        count = service.approve_pledge_actions(actions=actions, private_key=ecdsa_private_key)
+
+        assert count == 3
+        body = api.taurus_network_service_approve_pledge_actions.call_args.kwargs["body"]
+        assert body["ids"] == ["a-1", "a-2", "a-3"]
+
 
 class TestRejectPledgeActions:
     """Tests for PledgeService.reject_pledge_actions()."""
@@ -230,3 +364,64 @@ class TestListPledgeWithdrawals:
         withdrawals, pagination = service.list_pledge_withdrawals()
 
         assert withdrawals == []
+
+
+class TestIterPledges:
+    """Tests for PledgeService.iter_pledges() and friends."""
+
+    def _make_service(self) -> tuple:
+        api_client = MagicMock()
+        pledge_api = MagicMock()
+        service = PledgeService(api_client=api_client, pledge_api=pledge_api)
+        return service, pledge_api
+
+    def test_follows_cursor(self) -> None:
+        service, api = self._make_service()
+        from types import SimpleNamespace
+
+        api.taurus_network_service_get_pledges.side_effect = [
+            SimpleNamespace(
+                pledges=[SimpleNamespace(id="p-1"), SimpleNamespace(id="p-2")],
+                cursor=SimpleNamespace(current_page="page-1", has_next=True),
+            ),
+            SimpleNamespace(
+                pledges=[SimpleNamespace(id="p-3")],
+                cursor=SimpleNamespace(current_page="page-2", has_next=False),
+            ),
+        ]
+
+        pledges = service.iter_pledges()
+
+        assert [p.id for p in pledges] == ["p-1", "p-2", "p-3"]
+        assert api.taurus_network_service_get_pledges.call_count == 2
+        second_call = api.taurus_network_service_get_pledges.call_args_list[1]
+        assert second_call.kwargs["cursor_current_page"] == "page-1"
+        assert second_call.kwargs["cursor_page_request"] == "NEXT"
+
+    def test_filters_actions_client_side(self) -> None:
+        service, api = self._make_service()
+        from types import SimpleNamespace
+
+        from taurus_protect.models.taurus_network.pledge import ListPledgeActionsOptions
+
+        api.taurus_network_service_get_pledge_actions.return_value = SimpleNamespace(
+            result=[
+                SimpleNamespace(id="a-1", status="PENDING", action_type="WITHDRAW"),
+                SimpleNamespace(id="a-2", status="APPROVED", action_type="WITHDRAW"),
+            ],
+            cursor=None,
+        )
+
+        actions = list(
+            service.iter_pledge_actions(
+                ListPledgeActionsOptions(limit=10, pledge_id="p-1", statuses=["PENDING"])
+            )
+        )
+
+        assert [a.id for a in actions] == ["a-1"]
+        api.taurus_network_service_get_pledge_actions.assert_called_once_with(
+            pledge_id="p-1",
+            cursor_page_size="10",
+            cursor_current_page=None,
+            cursor_page_request=None,
+        )
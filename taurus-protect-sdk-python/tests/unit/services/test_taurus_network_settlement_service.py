@@ -2,15 +2,128 @@
 
 from __future__ import annotations
 
+import dataclasses
+import pickle
+import sys
+from datetime import datetime, timezone
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
 
+from taurus_protect._internal.openapi.exceptions import ApiException
 from taurus_protect.services.taurus_network.settlement_service import (
+    CreateSettlementRequest,
+    ListSettlementsOptions,
+    Settlement,
+    SettlementAssetTransfer,
+    SettlementClip,
+    SettlementClipTransaction,
     SettlementService,
+    _settlement_from_dto,
 )
 
 
+class TestSettlementModels:
+    """Tests for the settlement dataclasses."""
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_models_have_no_instance_dict(self) -> None:
+        for obj in (
+            Settlement(),
+            SettlementClip(),
+            SettlementClipTransaction(),
+            SettlementAssetTransfer(),
+        ):
+            assert not hasattr(obj, "__dict__")
+
+    def test_pickle_roundtrip(self) -> None:
+        settlement = Settlement(
+            id="s-1",
+            first_leg_assets=[SettlementAssetTransfer("sa-1", "ETH", "10")],
+            clips=[SettlementClip(id="c-1", transactions=[SettlementClipTransaction("t-1")])],
+        )
+        assert pickle.loads(pickle.dumps(settlement)) == settlement
+
+
+class TestSettlementOptions:
+    """Tests for the settlement option and request dataclasses."""
+
+    def test_options_are_mutable(self) -> None:
+        opts = ListSettlementsOptions(page_size=10)
+        opts.page_size = 20
+        assert opts.page_size == 20
+
+    def test_replace_returns_updated_copy(self) -> None:
+        opts = ListSettlementsOptions(page_size=10, sort_order="ASC")
+        updated = dataclasses.replace(opts, current_page="abc")
+
+        assert updated.current_page == "abc"
+        assert updated.sort_order == "ASC"
+        assert opts.current_page is None
+
+    def test_asdict(self) -> None:
+        opts = ListSettlementsOptions(page_size=10)
+        assert dataclasses.asdict(opts)["page_size"] == 10
+
+
+class TestSettlementFromDto:
+    """Tests for _settlement_from_dto()."""
+
+    def test_maps_all_fields(self) -> None:
+        created = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+        dto = SimpleNamespace(
+            id="s-1",
+            creator_participant_id="p-1",
+            target_participant_id="p-2",
+            first_leg_participant_id="p-1",
+            first_leg_assets=[
+                SimpleNamespace(shared_address_id="sa-1", currency="ETH", amount="1")
+            ],
+            second_leg_assets=[],
+            clips=[
+                SimpleNamespace(
+                    id="c-1",
+                    status="PENDING",
+                    transactions=[SimpleNamespace(id="t-1", status=None)],
+                )
+            ],
+            start_execution_date=None,
+            status="CREATED",
+            workflow_id=None,
+            created_at=created,
+            updated_at=None,
+        )
+
+        settlement = _settlement_from_dto(dto)
+
+        assert settlement is not None
+        assert settlement.id == "s-1"
+        assert settlement.target_participant_id == "p-2"
+        assert settlement.status == "CREATED"
+        assert settlement.workflow_id == ""
+        assert settlement.created_at == created
+        assert settlement.first_leg_assets[0].currency == "ETH"
+        assert settlement.clips[0].id == "c-1"
+        assert settlement.clips[0].transactions[0].id == "t-1"
+        assert settlement.clips[0].transactions[0].status == ""
+
+    def test_defaults_missing_attributes(self) -> None:
+        settlement = _settlement_from_dto(
+            SimpleNamespace(id="s-1", clips=[SimpleNamespace(status="DONE")])
+        )
+
+        assert settlement is not None
+        assert settlement.id == "s-1"
+        assert settlement.status == ""
+        assert settlement.created_at is None
+        assert settlement.clips[0].id == ""
+        assert settlement.clips[0].status == "DONE"
+
+    def test_returns_none_for_none(self) -> None:
+        assert _settlement_from_dto(None) is None
+
+
 class TestGetSettlement:
     """Tests for SettlementService.get_settlement()."""
 
@@ -27,6 +140,17 @@ class TestGetSettlement:
         with pytest.raises(ValueError, match="settlement_id"):
             service.get_settlement(settlement_id="")
 
+    def test_maps_api_exception(self) -> None:
+        service, api = self._make_service()
+        api.taurus_network_service_get_settlement.side_effect = ApiException(
+            status=404, reason="Not Found"
+        )
+
+        from taurus_protect.errors import NotFoundError
+
+        with pytest.raises(NotFoundError):
+            service.get_settlement(settlement_id="s-missing")
+
     def test_raises_not_found_when_none(self) -> None:
         service, api = self._make_service()
         resp = MagicMock()
@@ -62,6 +186,62 @@ class TestListSettlements:
 
         assert settlements == []
 
+    def test_wraps_unexpected_errors(self) -> None:
+        service, api = self._make_service()
+        api.taurus_network_service_get_settlements.side_effect = RuntimeError("boom")
+
+        from taurus_protect.errors import APIError
+
+        with pytest.raises(APIError) as exc_info:
+            service.list_settlements()
+        assert isinstance(exc_info.value.__cause__, RuntimeError)
+
+    def test_maps_results_and_skips_none(self) -> None:
+        service, api = self._make_service()
+        resp = MagicMock()
+        resp.result = [SimpleNamespace(id="s-1"), None, SimpleNamespace(id="s-2")]
+        api.taurus_network_service_get_settlements.return_value = resp
+
+        settlements, _ = service.list_settlements()
+
+        assert [s.id for s in settlements] == ["s-1", "s-2"]
+
+    def test_passes_page_size_as_string(self) -> None:
+        service, api = self._make_service()
+        api.taurus_network_service_get_settlements.return_value = MagicMock(result=[])
+
+        service.list_settlements(ListSettlementsOptions(page_size=25))
+        service.list_settlements(ListSettlementsOptions(page_size=0))
+
+        calls = api.taurus_network_service_get_settlements.call_args_list
+        assert calls[0].kwargs["cursor_page_size"] == "25"
+        assert calls[1].kwargs["cursor_page_size"] is None
+
+    def test_returns_cursor_pagination(self) -> None:
+        service, api = self._make_service()
+        resp = MagicMock()
+        resp.result = []
+        resp.cursor = SimpleNamespace(current_page="abc", has_next=True, has_previous=None)
+        api.taurus_network_service_get_settlements.return_value = resp
+
+        _, pagination = service.list_settlements()
+
+        assert pagination is not None
+        assert pagination.current_page == "abc"
+        assert pagination.has_next is True
+        assert pagination.has_previous is False
+
+    def test_returns_no_pagination_without_cursor(self) -> None:
+        service, api = self._make_service()
+        resp = MagicMock()
+        resp.result = []
+        resp.cursor = None
+        api.taurus_network_service_get_settlements_for_approval.return_value = resp
+
+        _, pagination = service.list_settlements_for_approval()
+
+        assert pagination is None
+
 
 class TestCreateSettlement:
     """Tests for SettlementService.create_settlement()."""
@@ -74,7 +254,136 @@ class TestCreateSettlement:
         )
         return service, settlement_api
 
+    def _request(self) -> CreateSettlementRequest:
+        return CreateSettlementRequest(
+            target_participant_id="p-2",
+            first_leg_participant_id="p-1",
+            first_leg_assets=[SettlementAssetTransfer("sa-1", "ETH", "1")],
+            second_leg_assets=[SettlementAssetTransfer("sa-2", "BTC", "2")],
+        )
+
     def test_raises_on_none_request(self) -> None:
         service, _ = self._make_service()
         with pytest.raises(ValueError, match="request cannot be None"):
             service.create_settlement(request=None)
+
+    def test_sends_asset_payloads(self) -> None:
+        service, api = self._make_service()
+
+        service.create_settlement(self._request())
+
+        body = api.taurus_network_service_create_settlement.call_args.kwargs["body"]
+        assert body["firstLegAssets"] == [
+            {"sharedAddressID": "sa-1", "currency": "ETH", "amount": "1"}
+        ]
+        assert body["secondLegAssets"] == [
+            {"sharedAddressID": "sa-2", "currency": "BTC", "amount": "2"}
+        ]
+        assert "clips" not in body
+
+    def test_returns_settlement_id_from_reply(self) -> None:
+        service, api = self._make_service()
+        api.taurus_network_service_create_settlement.return_value = SimpleNamespace(
+            settlement_id="s-1"
+        )
+
+        assert service.create_settlement(self._request()) == "s-1"
+
+    def test_falls_back_to_result_id(self) -> None:
+        service, api = self._make_service()
+        api.taurus_network_service_create_settlement.return_value = SimpleNamespace(
+            result=SimpleNamespace(id="s-2")
+        )
+
+        assert service.create_settlement(self._request()) == "s-2"
+
+
+class TestIterSettlements:
+    """Tests for SettlementService.iter_settlements() and friends."""
+
+    def _make_service(self) -> tuple:
+        api_client = MagicMock()
+        settlement_api = MagicMock()
+        service = SettlementService(
+            api_client=api_client, settlement_api=settlement_api
+        )
+        return service, settlement_api
+
+    def test_follows_cursor(self) -> None:
+        service, api = self._make_service()
+        api.taurus_network_service_get_settlements.side_effect = [
+            SimpleNamespace(
+                result=[SimpleNamespace(id="s-1"), SimpleNamespace(id="s-2")],
+                cursor=SimpleNamespace(current_page="page-1", has_next=True),
+            ),
+            SimpleNamespace(
+                result=[SimpleNamespace(id="s-3")],
+                cursor=SimpleNamespace(current_page="page-2", has_next=False),
+            ),
+        ]
+
+        settlements = service.iter_settlements(ListSettlementsOptions(page_size=2))
+
+        assert [s.id for s in settlements] == ["s-1", "s-2", "s-3"]
+        first_call, second_call = api.taurus_network_service_get_settlements.call_args_list
+        assert first_call.kwargs["cursor_current_page"] is None
+        assert first_call.kwargs["cursor_page_size"] == "2"
+        assert second_call.kwargs["cursor_current_page"] == "page-1"
+        assert second_call.kwargs["cursor_page_request"] == "NEXT"
+
+    def test_is_lazy(self) -> None:
+        service, api = self._make_service()
+
+        service.iter_settlements_for_approval()
+
+        api.taurus_network_service_get_settlements_for_approval.assert_not_called()
+
+    def test_stops_without_next_cursor(self) -> None:
+        service, api = self._make_service()
+        api.taurus_network_service_get_settlements_for_approval.return_value = SimpleNamespace(
+            result=[SimpleNamespace(id="s-1")],
+            cursor=SimpleNamespace(current_page=None, has_next=True),
+        )
+
+        settlements = list(service.iter_settlements_for_approval())
+
+        assert [s.id for s in settlements] == ["s-1"]
+        api.taurus_network_service_get_settlements_for_approval.assert_called_once()
+
+    def test_wraps_fetch_errors(self) -> None:
+        service, api = self._make_service()
+        api.taurus_network_service_get_settlements.side_effect = ApiException(
+            status=500, reason="Internal Server Error"
+        )
+
+        from taurus_protect.errors import APIError
+
+        with pytest.raises(APIError):
+            list(service.iter_settlements())
+
+
+class TestReplaceSettlement:
+    """Tests for SettlementService.replace_settlement()."""
+
+    def test_wraps_body_with_optional_fields(self) -> None:
+        api = MagicMock()
+        service = SettlementService(api_client=MagicMock(), settlement_api=api)
+        start = datetime(2024, 2, 1, tzinfo=timezone.utc)
+        request = CreateSettlementRequest(
+            target_participant_id="p-2",
+            first_leg_participant_id="p-1",
+            first_leg_assets=[SettlementAssetTransfer("sa-1", "ETH", "1")],
+            second_leg_assets=[SettlementAssetTransfer("sa-2", "BTC", "2")],
+            clips=[{"index": "0"}],
+            start_execution_date=start,
+        )
+
+        service.replace_settlement("s-1", request)
+
+        args, kwargs = api.taurus_network_service_replace_settlement.call_args
+        assert args == ("s-1",)
+        body = kwargs["body"]["createSettlementRequest"]
+        assert body["targetParticipantID"] == "p-2"
+        assert body["secondLegAssets"][0]["currency"] == "BTC"
+        assert body["clips"] == [{"index": "0"}]
+        assert body["startExecutionDate"] == start.isoformat()
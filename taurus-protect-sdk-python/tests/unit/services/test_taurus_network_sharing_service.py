@@ -2,11 +2,203 @@
 
 from __future__ import annotations
 
+import dataclasses
+import json
+import sys
+from datetime import datetime, timezone
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
 
-from taurus_protect.services.taurus_network.sharing_service import SharingService
+from taurus_protect._internal.openapi.exceptions import ApiException
+from taurus_protect.services.taurus_network import sharing_service
+from taurus_protect.services.taurus_network.sharing_service import (
+    ListSharedAssetsOptions,
+    ShareAddressRequest,
+    SharedAddress,
+    SharedAddressBatch,
+    SharedAddressTrail,
+    SharedAsset,
+    SharingService,
+    _shared_address_from_dto,
+    _shared_asset_from_dto,
+    serialize_shared_addresses,
+)
+
+
+class TestSharingModels:
+    """Tests for the sharing dataclasses."""
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_models_have_no_instance_dict(self) -> None:
+        for obj in (SharedAddress(), SharedAddressBatch(), SharedAddressTrail(), SharedAsset()):
+            assert not hasattr(obj, "__dict__")
+
+    def test_list_defaults_are_not_shared(self) -> None:
+        first, second = SharedAddress(), SharedAddress()
+
+        first.key_value_attributes.append({"key": "k", "value": "v"})
+        first.trail.append(SharedAddressTrail(status="new"))
+
+        assert second.key_value_attributes == []
+        assert second.trail == []
+
+
+class TestSharedAddressSerialization:
+    """Tests for SharedAddress.to_dict() and serialize_shared_addresses()."""
+
+    def _make_address(self) -> SharedAddress:
+        changed = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+        return SharedAddress(
+            id="sa-1",
+            blockchain="ETH",
+            key_value_attributes=[{"key": "env", "value": "prod"}],
+            trail=[SharedAddressTrail(status="accepted", changed_at=changed)],
+            created_at=changed,
+        )
+
+    def test_to_dict_matches_asdict(self) -> None:
+        address = self._make_address()
+
+        assert address.to_dict() == dataclasses.asdict(address)
+        assert SharedAsset(id="as-1").to_dict() == dataclasses.asdict(SharedAsset(id="as-1"))
+
+    def test_to_dict_copies_attributes(self) -> None:
+        address = self._make_address()
+
+        address.to_dict()["key_value_attributes"][0]["value"] = "dev"
+
+        assert address.key_value_attributes[0]["value"] == "prod"
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_serialize_shared_addresses(self, use_orjson: bool, monkeypatch) -> None:
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(sharing_service, "orjson", None)
+
+        data = json.loads(serialize_shared_addresses([self._make_address()]))
+
+        assert data[0]["id"] == "sa-1"
+        assert data[0]["trail"][0]["status"] == "accepted"
+        assert data[0]["created_at"] == "2024-01-15T10:30:00+00:00"
+        assert data[0]["updated_at"] is None
+
+
+class TestSharedAddressFromDto:
+    """Tests for _shared_address_from_dto()."""
+
+    def test_matches_constructed_model(self) -> None:
+        changed = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+        dto = SimpleNamespace(
+            id="sa-1",
+            owner_participant_id="p-1",
+            target_participant_id="p-2",
+            address_id="a-1",
+            address="0xabc",
+            blockchain="ETH",
+            network="mainnet",
+            status=None,
+            key_value_attributes=[SimpleNamespace(key="env", value="prod")],
+            trail=[SimpleNamespace(status="accepted", changed_at=changed)],
+            created_at=changed,
+            updated_at=None,
+        )
+
+        assert _shared_address_from_dto(dto) == SharedAddress(
+            id="sa-1",
+            owner_participant_id="p-1",
+            target_participant_id="p-2",
+            address_id="a-1",
+            address="0xabc",
+            blockchain="ETH",
+            network="mainnet",
+            key_value_attributes=[{"key": "env", "value": "prod"}],
+            trail=[SharedAddressTrail(status="accepted", changed_at=changed)],
+            created_at=changed,
+        )
+
+    def test_defaults_missing_attributes(self) -> None:
+        assert _shared_address_from_dto(SimpleNamespace()) == SharedAddress()
+
+    def test_normalizes_null_fields_of_generated_dto(self) -> None:
+        from taurus_protect._internal.openapi.models.tgvalidatord_tn_shared_address import (
+            TgvalidatordTnSharedAddress,
+        )
+
+        address = _shared_address_from_dto(TgvalidatordTnSharedAddress(id="sa-1"))
+
+        assert address is not None
+        assert address.id == "sa-1"
+        assert address.owner_participant_id == ""
+        assert address.blockchain == ""
+        assert address.status == ""
+
+    def test_reads_fields_of_objects_without_dict(self) -> None:
+        class SlottedDto:
+            __slots__ = ("id", "status")
+
+            def __init__(self) -> None:
+                self.id = "sa-1"
+                self.status = "accepted"
+
+        address = _shared_address_from_dto(SlottedDto())
+
+        assert address == SharedAddress(id="sa-1", status="accepted")
+
+    def test_returns_none_for_none(self) -> None:
+        assert _shared_address_from_dto(None) is None
+
+    def test_interns_low_cardinality_fields(self) -> None:
+        first = _shared_address_from_dto(
+            SimpleNamespace(blockchain="".join(["E", "TH"]), network=None, status="accepted")
+        )
+        second = _shared_address_from_dto(
+            SimpleNamespace(blockchain="".join(["ET", "H"]), network="mainnet", status=None)
+        )
+
+        assert first is not None and second is not None
+        assert first.blockchain is second.blockchain
+        assert first.network == ""
+        assert second.status == ""
+
+    def test_trail_statuses_share_one_string(self) -> None:
+        dto = SimpleNamespace(
+            trail=[
+                SimpleNamespace(status="".join(["accep", "ted"])),
+                SimpleNamespace(status="".join(["accept", "ed"])),
+                SimpleNamespace(status="custom"),
+            ]
+        )
+
+        address = _shared_address_from_dto(dto)
+
+        assert address is not None
+        first, second, third = address.trail
+        assert first.status is second.status
+        assert third.status == "custom"
+
+
+class TestSharedAssetFromDto:
+    """Tests for _shared_asset_from_dto()."""
+
+    def test_matches_constructed_model(self) -> None:
+        dto = SimpleNamespace(
+            id="as-1",
+            whitelisted_contract_id="wc-1",
+            blockchain="ETH",
+            contract_address="0xdef",
+            status="pending",
+        )
+
+        assert _shared_asset_from_dto(dto) == SharedAsset(
+            id="as-1",
+            whitelisted_contract_id="wc-1",
+            blockchain="ETH",
+            contract_address="0xdef",
+            status="pending",
+        )
 
 
 class TestListSharedAddresses:
@@ -30,6 +222,80 @@ class TestListSharedAddresses:
 
         assert addresses == []
 
+    def test_maps_results_and_skips_none(self) -> None:
+        service, api = self._make_service()
+        resp = MagicMock()
+        resp.result = [SimpleNamespace(id="sa-1"), None, SimpleNamespace(id="sa-2")]
+        api.taurus_network_service_get_shared_addresses.return_value = resp
+
+        addresses, _ = service.list_shared_addresses()
+
+        assert [a.id for a in addresses] == ["sa-1", "sa-2"]
+
+    def test_attributes_are_not_shared_within_page(self) -> None:
+        service, api = self._make_service()
+        resp = MagicMock()
+        resp.result = [
+            SimpleNamespace(
+                id=f"sa-{i}",
+                key_value_attributes=[
+                    SimpleNamespace(key="env", value="prod"),
+                    SimpleNamespace(key="desk", value=f"d{i}"),
+                ],
+            )
+            for i in range(2)
+        ]
+        api.taurus_network_service_get_shared_addresses.return_value = resp
+
+        first, second = service.list_shared_addresses()[0]
+        first.key_value_attributes[0]["value"] = "dev"
+
+        assert second.key_value_attributes[0] == {"key": "env", "value": "prod"}
+        assert second.key_value_attributes[1] == {"key": "desk", "value": "d1"}
+
+
+class TestListSharedAddressesBatched:
+    """Tests for SharingService.list_shared_addresses_batched()."""
+
+    def test_batch_rows_match_list_results(self) -> None:
+        service = SharingService(api_client=MagicMock(), shared_api=MagicMock())
+        api = service._shared_api
+        resp = MagicMock()
+        resp.result = [
+            SimpleNamespace(
+                id="sa-1",
+                blockchain="ETH",
+                status="accepted",
+                key_value_attributes=[SimpleNamespace(key="k", value="v")],
+                trail=[SimpleNamespace(status="new", changed_at=None)],
+            ),
+            None,
+            SimpleNamespace(id="sa-2", blockchain="BTC", status="rejected"),
+        ]
+        resp.cursor = SimpleNamespace(current_page="p1", has_next=1, has_previous=None)
+        api.taurus_network_service_get_shared_addresses.return_value = resp
+
+        batch, pagination = service.list_shared_addresses_batched()
+        addresses, _ = service.list_shared_addresses()
+
+        assert len(batch) == 2
+        assert batch.ids == ["sa-1", "sa-2"]
+        assert batch.statuses == ["accepted", "rejected"]
+        assert batch.blockchains == ["ETH", "BTC"]
+        assert [batch.row(i) for i in range(len(batch))] == addresses
+        assert pagination is not None and pagination.has_next is True
+
+    def test_maps_api_exception(self) -> None:
+        service = SharingService(api_client=MagicMock(), shared_api=MagicMock())
+        service._shared_api.taurus_network_service_get_shared_addresses.side_effect = (
+            ApiException(status=404, reason="Not Found")
+        )
+
+        from taurus_protect.errors import NotFoundError
+
+        with pytest.raises(NotFoundError):
+            service.list_shared_addresses_batched()
+
 
 class TestShareAddress:
     """Tests for SharingService.share_address()."""
@@ -45,6 +311,31 @@ class TestShareAddress:
         with pytest.raises(ValueError, match="request cannot be None"):
             service.share_address(request=None)
 
+    def test_rejects_blank_participant_id(self) -> None:
+        service, api = self._make_service()
+        with pytest.raises(ValueError, match="to_participant_id cannot be empty"):
+            service.share_address(ShareAddressRequest(to_participant_id=" ", address_id="a-1"))
+        api.taurus_network_service_share_address.assert_not_called()
+
+    def test_sends_body_with_attributes(self) -> None:
+        service, api = self._make_service()
+
+        service.share_address(
+            ShareAddressRequest(
+                to_participant_id="p-2",
+                address_id="a-1",
+                key_value_attributes=[{"key": "env", "value": "prod"}],
+            )
+        )
+
+        api.taurus_network_service_share_address.assert_called_once_with(
+            body={
+                "toParticipantID": "p-2",
+                "addressID": "a-1",
+                "keyValueAttributes": [{"key": "env", "value": "prod"}],
+            }
+        )
+
 
 class TestUnshareAddress:
     """Tests for SharingService.unshare_address()."""
@@ -60,6 +351,17 @@ class TestUnshareAddress:
         with pytest.raises(ValueError, match="shared_address_id"):
             service.unshare_address(shared_address_id="")
 
+    def test_maps_api_exception(self) -> None:
+        service, api = self._make_service()
+        api.taurus_network_service_unshare_address.side_effect = ApiException(
+            status=404, reason="Not Found"
+        )
+
+        from taurus_protect.errors import NotFoundError
+
+        with pytest.raises(NotFoundError):
+            service.unshare_address(shared_address_id="sa-missing")
+
 
 class TestListSharedAssets:
     """Tests for SharingService.list_shared_assets()."""
@@ -82,6 +384,39 @@ class TestListSharedAssets:
 
         assert assets == []
 
+    def test_passes_filters_and_returns_cursor(self) -> None:
+        service, api = self._make_service()
+        api.taurus_network_service_get_shared_assets.return_value = SimpleNamespace(
+            result=[SimpleNamespace(id="as-1")],
+            cursor=SimpleNamespace(current_page="abc", has_next=True, has_previous=None),
+        )
+
+        assets, pagination = service.list_shared_assets(
+            ListSharedAssetsOptions(blockchain="ETH", page_size=25)
+        )
+
+        assert [a.id for a in assets] == ["as-1"]
+        assert pagination is not None
+        assert pagination.current_page == "abc"
+        assert pagination.has_next is True
+        assert pagination.has_previous is False
+        kwargs = api.taurus_network_service_get_shared_assets.call_args.kwargs
+        assert kwargs["blockchain"] == "ETH"
+        assert kwargs["cursor_page_size"] == "25"
+
+    def test_formats_uncommon_and_disabled_page_sizes(self) -> None:
+        service, api = self._make_service()
+        api.taurus_network_service_get_shared_assets.return_value = SimpleNamespace(
+            result=None, cursor=None
+        )
+
+        service.list_shared_assets(ListSharedAssetsOptions(page_size=7))
+        service.list_shared_assets(ListSharedAssetsOptions(page_size=0))
+
+        calls = api.taurus_network_service_get_shared_assets.call_args_list
+        assert calls[0].kwargs["cursor_page_size"] == "7"
+        assert calls[1].kwargs["cursor_page_size"] is None
+
 
 class TestUnshareWhitelistedAsset:
     """Tests for SharingService.unshare_whitelisted_asset()."""
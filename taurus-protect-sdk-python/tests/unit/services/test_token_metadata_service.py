@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
@@ -30,6 +31,14 @@ class TestTokenMetadataServiceGet:
         with pytest.raises(ValueError, match="contract_address"):
             service.get(blockchain="ETH", contract_address="")
 
+    def test_rejects_blank_and_none_arguments(self) -> None:
+        service, api = self._make_service()
+        with pytest.raises(ValueError, match="blockchain cannot be empty"):
+            service.get(blockchain="   ", contract_address="0x123")
+        with pytest.raises(ValueError, match="contract_address cannot be None"):
+            service.get(blockchain="ETH", contract_address=None)  # type: ignore[arg-type]
+        api.token_metadata_service_get_evmerc_token_metadata.assert_not_called()
+
     def test_calls_api(self) -> None:
         service, api = self._make_service()
         resp = MagicMock()
@@ -138,3 +147,98 @@ class TestTokenMetadataServiceGetCryptoPunk:
             service.get_crypto_punk(
                 network="mainnet", contract_address="0x123", punk_id=""
             )
+
+
+class TestTokenMetadataServiceCache:
+    """Tests for the TokenMetadataService lookup cache."""
+
+    def _make_service(self, **kwargs: object) -> tuple:
+        token_metadata_api = MagicMock()
+        resp = MagicMock()
+        resp.result = SimpleNamespace(name="Token", description="", decimals="18")
+        token_metadata_api.token_metadata_service_get_evmerc_token_metadata.return_value = resp
+        kwargs.setdefault("cache_enabled", True)
+        service = TokenMetadataService(
+            api_client=MagicMock(), token_metadata_api=token_metadata_api, **kwargs
+        )
+        return service, token_metadata_api
+
+    def test_repeated_lookup_hits_cache(self) -> None:
+        service, api = self._make_service()
+
+        first = service.get_erc(network="mainnet", contract_address="0xabc", token_id="1")
+        second = service.get_erc(network="mainnet", contract_address="0xabc", token_id="1")
+
+        assert first == second
+        assert api.token_metadata_service_get_evmerc_token_metadata.call_count == 1
+
+    def test_cached_value_is_not_shared(self) -> None:
+        service, _ = self._make_service()
+
+        first = service.get_erc(network="mainnet", contract_address="0xabc", token_id="1")
+        assert first is not None
+        first.name = "changed"
+        second = service.get_erc(network="mainnet", contract_address="0xabc", token_id="1")
+
+        assert second is not None
+        assert second.name == "Token"
+
+    def test_different_arguments_miss_cache(self) -> None:
+        service, api = self._make_service()
+
+        service.get_erc(network="mainnet", contract_address="0xabc", token_id="1")
+        service.get_erc(network="mainnet", contract_address="0xabc", token_id="2")
+        service.get_erc(
+            network="mainnet", contract_address="0xabc", token_id="1", with_data=True
+        )
+
+        assert api.token_metadata_service_get_evmerc_token_metadata.call_count == 3
+
+    def test_lookup_with_data_is_not_cached(self) -> None:
+        service, api = self._make_service()
+
+        service.get(blockchain="ETH", contract_address="0xabc", with_data=True)
+        service.get(blockchain="ETH", contract_address="0xabc", with_data=True)
+
+        assert api.token_metadata_service_get_evmerc_token_metadata.call_count == 2
+
+    def test_cache_is_off_by_default(self) -> None:
+        api = MagicMock()
+        api.token_metadata_service_get_evmerc_token_metadata.return_value = MagicMock(
+            result=SimpleNamespace(name="Token", description="", decimals="18")
+        )
+        service = TokenMetadataService(api_client=MagicMock(), token_metadata_api=api)
+
+        service.get(blockchain="ETH", contract_address="0xabc")
+        service.get(blockchain="ETH", contract_address="0xabc")
+
+        assert api.token_metadata_service_get_evmerc_token_metadata.call_count == 2
+
+    def test_not_found_is_not_cached(self) -> None:
+        service, api = self._make_service()
+        api.token_metadata_service_get_evmerc_token_metadata.return_value = MagicMock(result=None)
+
+        assert service.get(blockchain="ETH", contract_address="0xabc") is None
+        assert service.get(blockchain="ETH", contract_address="0xabc") is None
+        assert api.token_metadata_service_get_evmerc_token_metadata.call_count == 2
+
+    def test_clear_cache_and_disabled_cache(self) -> None:
+        service, api = self._make_service()
+        service.get(blockchain="ETH", contract_address="0xabc")
+        service.clear_cache()
+        service.get(blockchain="ETH", contract_address="0xabc")
+        assert api.token_metadata_service_get_evmerc_token_metadata.call_count == 2
+
+        uncached, uncached_api = self._make_service(cache_enabled=False)
+        uncached.get(blockchain="ETH", contract_address="0xabc")
+        uncached.get(blockchain="ETH", contract_address="0xabc")
+        assert uncached_api.token_metadata_service_get_evmerc_token_metadata.call_count == 2
+
+    def test_evicts_least_recently_used(self) -> None:
+        service, api = self._make_service(cache_size=1)
+
+        service.get(blockchain="ETH", contract_address="0x1")
+        service.get(blockchain="ETH", contract_address="0x2")
+        service.get(blockchain="ETH", contract_address="0x1")
+
+        assert api.token_metadata_service_get_evmerc_token_metadata.call_count == 3
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import threading
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from taurus_protect.errors import NotFoundError
-from taurus_protect.services.transaction_service import TransactionService
+from taurus_protect.services.transaction_service import (
+    AsyncTransactionService,
+    TransactionService,
+)
 
 
 class TestGet:
@@ -37,6 +44,17 @@ class TestGet:
 
         assert result is mock_tx
 
+    def test_get_sends_only_id_filter(self) -> None:
+        service, api = self._make_service()
+        api.transaction_service_get_transactions.return_value.result = [MagicMock()]
+
+        with patch("taurus_protect.services.transaction_service.map_transaction"):
+            service.get(42)
+
+        api.transaction_service_get_transactions.assert_called_once_with(
+            limit="1", offset="0", ids=["42"]
+        )
+
     def test_get_raises_for_non_positive_id(self) -> None:
         service, _ = self._make_service()
 
@@ -137,6 +155,16 @@ class TestList:
         with pytest.raises(ValueError, match="offset cannot be negative"):
             service.list(offset=-1)
 
+    def test_list_passes_string_page_params(self) -> None:
+        service, api = self._make_service()
+        api.transaction_service_get_transactions.return_value = MagicMock(result=[])
+
+        service.list(limit=50, offset=5000)
+
+        kwargs = api.transaction_service_get_transactions.call_args.kwargs
+        assert kwargs["limit"] == "50"
+        assert kwargs["offset"] == "5000"
+
 
 class TestListByAddress:
     """Tests for TransactionService.list_by_address()."""
@@ -214,3 +242,233 @@ class TestExportCsv:
 
         with pytest.raises(ValueError, match="offset cannot be negative"):
             service.export_csv(offset=-1)
+
+
+class TestTransactionCache:
+    """Tests for the optional transaction lookup cache."""
+
+    def _make_service(self, **kwargs: object) -> tuple:
+        transactions_api = MagicMock()
+        reply = MagicMock()
+        reply.result = [SimpleNamespace(id="7", tx_hash="0xabc", confirmations="3")]
+        transactions_api.transaction_service_get_transactions.return_value = reply
+        service = TransactionService(
+            api_client=MagicMock(), transactions_api=transactions_api, **kwargs
+        )
+        return service, transactions_api
+
+    def test_disabled_by_default(self) -> None:
+        service, api = self._make_service()
+
+        service.get(7)
+        service.get(7)
+
+        assert api.transaction_service_get_transactions.call_count == 2
+
+    def test_get_and_get_by_hash_share_entries(self) -> None:
+        service, api = self._make_service(cache_enabled=True)
+
+        tx = service.get(7)
+
+        assert service.get(7) is tx
+        assert service.get_by_hash("0xabc") is tx
+        assert api.transaction_service_get_transactions.call_count == 1
+
+    @pytest.mark.parametrize("key", [7, "0xabc"])
+    def test_invalidate_drops_both_keys(self, key: object) -> None:
+        service, api = self._make_service(cache_enabled=True)
+        service.get(7)
+
+        service.invalidate(key)  # type: ignore[arg-type]
+        service.get_by_hash("0xabc")
+        service.get(7)
+
+        assert api.transaction_service_get_transactions.call_count == 2
+
+    def test_clear_cache_and_size_bound(self) -> None:
+        service, api = self._make_service(cache_enabled=True, cache_size=1)
+
+        service.get(7)
+        service.get(7)  # only the hash key survived the size bound
+        service.clear_cache()
+        service.get_by_hash("0xabc")
+
+        assert api.transaction_service_get_transactions.call_count == 3
+
+    def test_not_found_is_not_cached(self) -> None:
+        service, api = self._make_service(cache_enabled=True)
+        api.transaction_service_get_transactions.return_value.result = []
+
+        for _ in range(2):
+            with pytest.raises(NotFoundError):
+                service.get(7)
+
+        assert api.transaction_service_get_transactions.call_count == 2
+
+
+class TestIterExportCsv:
+    """Tests for TransactionService.iter_export_csv() and export_csv_to_file()."""
+
+    def _make_service(self, pages: list, total_items: object = None) -> tuple:
+        transactions_api = MagicMock()
+        transactions_api.transaction_service_export_transactions.side_effect = [
+            SimpleNamespace(result=page, total_items=total_items) for page in pages
+        ]
+        service = TransactionService(api_client=MagicMock(), transactions_api=transactions_api)
+        return service, transactions_api
+
+    def test_drops_repeated_headers_and_stops_at_total(self) -> None:
+        service, api = self._make_service(["h1,h2\na,1\nb,2\n", "h1,h2\nc,3\n"], "3")
+
+        chunks = list(service.iter_export_csv(page_size=2))
+
+        assert "".join(chunks) == "h1,h2\na,1\nb,2\nc,3\n"
+        offsets = [
+            c.kwargs["offset"] for c in api.transaction_service_export_transactions.call_args_list
+        ]
+        assert offsets == ["0", "2"]
+
+    def test_stops_on_empty_page_without_total(self) -> None:
+        service, api = self._make_service(["h\na\n", "h\n"])
+
+        assert "".join(service.iter_export_csv(page_size=1)) == "h\na\n"
+        assert api.transaction_service_export_transactions.call_count == 2
+
+    def test_raises_for_invalid_page_size(self) -> None:
+        service, _ = self._make_service([])
+
+        with pytest.raises(ValueError, match="page_size must be positive"):
+            next(service.iter_export_csv(page_size=0))
+
+    def test_export_csv_to_file(self, tmp_path) -> None:
+        service, _ = self._make_service(["h\na\n", "h\nb\n", ""])
+        path = tmp_path / "transactions.csv"
+
+        service.export_csv_to_file(path, page_size=1)
+
+        assert path.read_text(encoding="utf-8") == "h\na\nb\n"
+
+
+class TestIterAll:
+    """Tests for TransactionService.iter_all()."""
+
+    def _make_service(self, pages: list, total_items: object = None) -> tuple:
+        transactions_api = MagicMock()
+        transactions_api.transaction_service_get_transactions.side_effect = [
+            SimpleNamespace(
+                result=[SimpleNamespace(id=tx_id) for tx_id in page], total_items=total_items
+            )
+            for page in pages
+        ]
+        service = TransactionService(api_client=MagicMock(), transactions_api=transactions_api)
+        return service, transactions_api
+
+    def test_walks_pages_until_short_page(self) -> None:
+        service, api = self._make_service([["1", "2"], ["3", "4"], ["5"]])
+
+        ids = [tx.id for tx in service.iter_all(currency="ETH", page_size=2)]
+
+        assert ids == ["1", "2", "3", "4", "5"]
+        calls = api.transaction_service_get_transactions.call_args_list
+        assert [c.kwargs["offset"] for c in calls] == ["0", "2", "4"]
+        assert all(c.kwargs["currency"] == "ETH" for c in calls)
+
+    def test_stops_at_total_items(self) -> None:
+        service, api = self._make_service([["1", "2"], ["3", "4"]], total_items="4")
+
+        assert [tx.id for tx in service.iter_all(page_size=2)] == ["1", "2", "3", "4"]
+        assert api.transaction_service_get_transactions.call_count == 2
+
+    def test_raises_for_invalid_page_size(self) -> None:
+        service, _ = self._make_service([])
+
+        with pytest.raises(ValueError, match="page_size must be positive"):
+            service.iter_all(page_size=0)
+
+
+class TestFastDecode:
+    """Tests for the fast_decode transaction list path."""
+
+    def _make_service(self, status: int, body: bytes) -> tuple:
+        transactions_api = MagicMock()
+        raw = transactions_api.transaction_service_get_transactions_without_preload_content
+        raw.return_value = SimpleNamespace(status=status, reason="", data=body, headers={})
+        service = TransactionService(
+            api_client=MagicMock(), transactions_api=transactions_api, fast_decode=True
+        )
+        return service, transactions_api
+
+    def test_matches_generated_mapping(self) -> None:
+        from taurus_protect._internal.openapi.models.tgvalidatord_transaction import (
+            TgvalidatordTransaction,
+        )
+        from taurus_protect.mappers.transaction import map_transaction
+
+        row = {
+            "id": "7",
+            "hash": "0xabc",
+            "currency": "ETH",
+            "requestId": "r-1",
+            "confirmationDate": "2024-01-15T10:31:00Z",
+        }
+        body = json.dumps({"result": [row], "totalItems": "1"}).encode()
+        service, api = self._make_service(200, body)
+
+        transactions, pagination = service.list(currency="ETH", limit=10)
+
+        assert transactions == [map_transaction(TgvalidatordTransaction.from_dict(row))]
+        assert pagination is not None
+        api.transaction_service_get_transactions.assert_not_called()
+
+    def test_maps_error_status(self) -> None:
+        service, _ = self._make_service(404, b'{"message": "missing"}')
+
+        with pytest.raises(NotFoundError):
+            service.get_by_hash("0xabc")
+
+
+class TestAsyncTransactionService:
+    """Tests for AsyncTransactionService."""
+
+    def test_forwards_calls_to_sync_service(self) -> None:
+        service = MagicMock()
+        service.get_by_hash.side_effect = lambda h: f"tx-{h}"
+        service.list.return_value = ([], None)
+
+        async def run() -> tuple:
+            async with AsyncTransactionService(service) as transactions:
+                found = await asyncio.gather(*(transactions.get_by_hash(h) for h in "abc"))
+                listed = await transactions.list(currency="ETH", limit=10)
+            return found, listed
+
+        found, listed = asyncio.run(run())
+
+        assert found == ["tx-a", "tx-b", "tx-c"]
+        assert listed == ([], None)
+        service.list.assert_called_once_with(None, None, "ETH", None, 10, 0)
+
+    def test_runs_requests_concurrently(self) -> None:
+        service = MagicMock()
+        barrier = threading.Barrier(4, timeout=5)
+        service.get.side_effect = lambda tx_id: (barrier.wait(), tx_id)[1]
+
+        async def run() -> list:
+            async with AsyncTransactionService(service, max_concurrency=4) as transactions:
+                return await asyncio.gather(*(transactions.get(i) for i in range(4)))
+
+        assert asyncio.run(run()) == [0, 1, 2, 3]
+
+    def test_propagates_errors(self) -> None:
+        service = MagicMock()
+        service.get.side_effect = NotFoundError("Transaction 1 not found")
+
+        async def run() -> None:
+            async with AsyncTransactionService(service) as transactions:
+                await transactions.get(1)
+
+        with pytest.raises(NotFoundError):
+            asyncio.run(run())
+
+    def test_rejects_invalid_concurrency(self) -> None:
+        with pytest.raises(ValueError, match="max_concurrency must be positive"):
+            AsyncTransactionService(MagicMock(), max_concurrency=0)
@@ -6,7 +6,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from taurus_protect.errors import APIError, NotFoundError
+from taurus_protect._internal.openapi.exceptions import ApiException
+from taurus_protect.errors import APIError, AuthenticationError, NotFoundError
 from taurus_protect.services.user_service import UserService
 
 
@@ -78,6 +79,64 @@ class TestGetCurrent:
 
         assert result is mock_user
 
+
+class TestGetCurrentCache:
+    """Tests for the cached current user."""
+
+    def _make_service(self, **kwargs: object) -> tuple:
+        users_api = MagicMock()
+        service = UserService(api_client=MagicMock(), users_api=users_api, **kwargs)
+        return service, users_api
+
+    def test_reuses_user_within_ttl(self) -> None:
+        service, api = self._make_service()
+
+        with patch("taurus_protect.services.user_service.user_from_dto", return_value=MagicMock()):
+            first = service.get_current()
+            second = service.get_current()
+
+        assert second is first
+        api.user_service_get_me.assert_called_once()
+
+    def test_refetches_after_ttl(self) -> None:
+        service, api = self._make_service(current_user_ttl=10)
+        clock = "taurus_protect.services.user_service.time.monotonic"
+
+        with patch("taurus_protect.services.user_service.user_from_dto", return_value=MagicMock()):
+            with patch(clock, return_value=100.0):
+                service.get_current()
+            with patch(clock, return_value=109.0):
+                service.get_current()
+            with patch(clock, return_value=111.0):
+                service.get_current()
+
+        assert api.user_service_get_me.call_count == 2
+
+    def test_refresh_current_and_zero_ttl_bypass_cache(self) -> None:
+        service, api = self._make_service()
+        uncached, uncached_api = self._make_service(current_user_ttl=0)
+
+        with patch("taurus_protect.services.user_service.user_from_dto", return_value=MagicMock()):
+            service.get_current()
+            service.refresh_current()
+            uncached.get_current()
+            uncached.get_current()
+
+        assert api.user_service_get_me.call_count == 2
+        assert uncached_api.user_service_get_me.call_count == 2
+
+    def test_auth_errors_drop_cached_user(self) -> None:
+        service, api = self._make_service()
+
+        with patch("taurus_protect.services.user_service.user_from_dto", return_value=MagicMock()):
+            service.get_current()
+            api.user_service_get_user.side_effect = ApiException(status=401, reason="Unauthorized")
+            with pytest.raises(AuthenticationError):
+                service.get("user-1")
+            service.get_current()
+
+        assert api.user_service_get_me.call_count == 2
+
     def test_get_current_raises_when_no_result(self) -> None:
         service, api = self._make_service()
 
@@ -138,6 +197,65 @@ class TestList:
         assert users == []
 
 
+class TestWatch:
+    """Tests for UserService.watch()."""
+
+    def _make_service(self) -> tuple:
+        users_api = MagicMock()
+        users_api._user_service_get_users_serialize.return_value = (
+            "GET",
+            "https://protect.example/api/rest/v1/users?limit=10&offset=0",
+            {"Accept": "application/json"},
+            None,
+            [],
+        )
+        service = UserService(api_client=MagicMock(), users_api=users_api)
+        return service, users_api
+
+    def test_serializes_request_once(self) -> None:
+        service, api = self._make_service()
+        client = api.api_client
+        client.response_deserialize.return_value = MagicMock(
+            data=MagicMock(result=None, total_items="0")
+        )
+
+        with patch("taurus_protect.services.user_service.time.sleep") as sleep:
+            polls = service.watch(interval=5, limit=10)
+            pages = [next(polls) for _ in range(3)]
+            polls.close()
+
+        assert pages[0][0] == []
+        api._user_service_get_users_serialize.assert_called_once()
+        assert client.call_api.call_count == 3
+        assert sleep.call_count == 2
+        headers = [call.args[2] for call in client.call_api.call_args_list]
+        assert headers[0] == {"Accept": "application/json"}
+        assert headers[0] is not headers[1]
+
+    def test_maps_api_errors(self) -> None:
+        service, api = self._make_service()
+        api.api_client.response_deserialize.side_effect = ApiException(
+            status=401, reason="Unauthorized"
+        )
+
+        with pytest.raises(AuthenticationError):
+            next(service.watch(interval=5))
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"interval": 0}, "interval must be positive"),
+            ({"interval": 5, "limit": 0}, "limit must be positive"),
+            ({"interval": 5, "offset": -1}, "offset cannot be negative"),
+        ],
+    )
+    def test_validates_arguments_eagerly(self, kwargs: dict, message: str) -> None:
+        service, _ = self._make_service()
+
+        with pytest.raises(ValueError, match=message):
+            service.watch(**kwargs)
+
+
 class TestGetUsersByEmail:
     """Tests for UserService.get_users_by_email()."""
 
@@ -168,6 +286,43 @@ class TestGetUsersByEmail:
 
         assert len(result) == 1
 
+    def test_get_users_by_email_batches_large_lists(self) -> None:
+        service, api = self._make_service()
+        emails = [f"user{i}@example.com" for i in range(250)]
+
+        def get_users(**kwargs: object) -> MagicMock:
+            reply = MagicMock()
+            reply.result = list(kwargs["emails"])  # type: ignore[call-overload]
+            return reply
+
+        api.user_service_get_users.side_effect = get_users
+
+        with patch(
+            "taurus_protect.services.user_service.users_from_dto",
+            side_effect=lambda dtos: [MagicMock(id=dto) for dto in dtos],
+        ) as mapper:
+            result = service.get_users_by_email(emails)
+
+        calls = api.user_service_get_users.call_args_list
+        assert sorted(len(c.kwargs["emails"]) for c in calls) == [50, 100, 100]
+        assert sorted(c.kwargs["limit"] for c in calls) == ["100", "100", "50"]
+        mapper.assert_called_once()
+        assert [user.id for user in result] == emails
+
+    def test_get_users_by_email_deduplicates_users(self) -> None:
+        service, api = self._make_service()
+        reply = MagicMock()
+        reply.result = [MagicMock(), MagicMock()]
+        api.user_service_get_users.return_value = reply
+
+        with patch(
+            "taurus_protect.services.user_service.users_from_dto",
+            return_value=[MagicMock(id="u-1"), MagicMock(id="u-1")],
+        ):
+            result = service.get_users_by_email(["a@example.com", "b@example.com"])
+
+        assert [user.id for user in result] == ["u-1"]
+
 
 class TestCreateUserAttribute:
     """Tests for UserService.create_user_attribute()."""
@@ -196,3 +351,46 @@ class TestCreateUserAttribute:
         service.create_user_attribute("user-1", "role", "admin")
 
         api.user_service_create_attribute.assert_called_once()
+
+
+class TestCreateUserAttributes:
+    """Tests for UserService.create_user_attributes()."""
+
+    def _make_service(self) -> tuple:
+        api_client = MagicMock()
+        users_api = MagicMock()
+        service = UserService(api_client=api_client, users_api=users_api)
+        return service, users_api
+
+    def test_raises_for_empty_key_before_calling_api(self) -> None:
+        service, api = self._make_service()
+
+        with pytest.raises(ValueError, match="key"):
+            service.create_user_attributes("user-1", {"role": "admin", "": "x"})
+
+        api.user_service_create_attribute.assert_not_called()
+
+    def test_creates_each_attribute(self) -> None:
+        service, api = self._make_service()
+        attributes = {f"key-{i}": f"value-{i}" for i in range(20)}
+
+        service.create_user_attributes("user-1", attributes)
+
+        calls = api.user_service_create_attribute.call_args_list
+        assert len(calls) == 20
+        assert all(call.kwargs["user_id"] == "user-1" for call in calls)
+        assert {call.kwargs["body"].key: call.kwargs["body"].value for call in calls} == attributes
+
+    def test_empty_mapping_is_noop(self) -> None:
+        service, api = self._make_service()
+
+        service.create_user_attributes("user-1", {})
+
+        api.user_service_create_attribute.assert_not_called()
+
+    def test_maps_api_errors(self) -> None:
+        service, api = self._make_service()
+        api.user_service_create_attribute.side_effect = ApiException(status=404, reason="Not Found")
+
+        with pytest.raises(NotFoundError):
+            service.create_user_attributes("user-1", {"a": "1", "b": "2"})
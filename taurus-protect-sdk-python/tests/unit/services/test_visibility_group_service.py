@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import threading
+import time
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from taurus_protect.models.visibility_group import VisibilityGroup
 from taurus_protect.services.visibility_group_service import VisibilityGroupService
 
 
@@ -99,6 +102,267 @@ class TestVisibilityGroupServiceGet:
             service.get(group_id="missing-id")
 
 
+class TestVisibilityGroupServiceCache:
+    """Tests for the visibility group cache."""
+
+    def _make_service(self, cache_ttl: float = 30.0) -> tuple:
+        visibility_groups_api = MagicMock()
+        visibility_groups_api.user_service_get_users_by_visibility_group_id.return_value = (
+            MagicMock(result=None)
+        )
+        service = VisibilityGroupService(
+            api_client=MagicMock(),
+            visibility_groups_api=visibility_groups_api,
+            cache_ttl=cache_ttl,
+        )
+        return service, visibility_groups_api
+
+    def _groups(self, count: int = 60) -> list:
+        return [VisibilityGroup(id=str(i), name=f"Group {i}") for i in range(count)]
+
+    def test_get_reuses_listed_groups(self) -> None:
+        service, api = self._make_service()
+        with patch(
+            "taurus_protect.services.visibility_group_service.visibility_groups_from_dto",
+            return_value=self._groups(),
+        ):
+            service.list()
+            first = service.get("1")
+            second = service.get("1")
+
+        assert api.user_service_get_visibility_groups.call_count == 1
+        assert first == second
+        assert first is not second
+
+    def test_get_finds_groups_beyond_first_page(self) -> None:
+        service, _ = self._make_service()
+        with patch(
+            "taurus_protect.services.visibility_group_service.visibility_groups_from_dto",
+            return_value=self._groups(),
+        ):
+            assert service.get("55").name == "Group 55"
+
+    def test_get_returns_first_group_with_duplicate_id(self) -> None:
+        service, _ = self._make_service(cache_ttl=0)
+        groups = [VisibilityGroup(id="1", name="First"), VisibilityGroup(id="1", name="Second")]
+        with patch(
+            "taurus_protect.services.visibility_group_service.visibility_groups_from_dto",
+            return_value=groups,
+        ):
+            assert service.get("1").name == "First"
+
+    def test_get_does_not_modify_cached_group(self) -> None:
+        service, api = self._make_service()
+        api.user_service_get_users_by_visibility_group_id.return_value = MagicMock(
+            result=[MagicMock(id="u-1", email="a@example.com", name="A")]
+        )
+        groups = self._groups()
+        with patch(
+            "taurus_protect.services.visibility_group_service.visibility_groups_from_dto",
+            return_value=groups,
+        ):
+            group = service.get("1")
+
+        assert len(group.users) == 1
+        assert groups[1].users == []
+
+    def test_get_fetches_users_while_listing_groups(self) -> None:
+        service, api = self._make_service()
+        users_started = threading.Event()
+
+        def get_users(visibility_group_id: str) -> MagicMock:
+            users_started.set()
+            return MagicMock(result=None)
+
+        def get_groups() -> MagicMock:
+            # Only returns once the users request is in flight
+            assert users_started.wait(5)
+            return MagicMock(result=[MagicMock()])
+
+        api.user_service_get_users_by_visibility_group_id.side_effect = get_users
+        api.user_service_get_visibility_groups.side_effect = get_groups
+        with patch(
+            "taurus_protect.services.visibility_group_service.visibility_groups_from_dto",
+            return_value=self._groups(),
+        ):
+            assert service.get("1").id == "1"
+
+    def test_get_ignores_user_fetch_errors(self) -> None:
+        service, api = self._make_service()
+        api.user_service_get_users_by_visibility_group_id.side_effect = RuntimeError("boom")
+        with patch(
+            "taurus_protect.services.visibility_group_service.visibility_groups_from_dto",
+            return_value=self._groups(),
+        ):
+            assert service.get("1").users == []
+
+    def test_get_many_uses_one_group_list(self) -> None:
+        service, api = self._make_service()
+        with patch(
+            "taurus_protect.services.visibility_group_service.visibility_groups_from_dto",
+            return_value=self._groups(),
+        ):
+            result = service.get_many(["1", "55", "missing"])
+            service.get_many(["2"])
+
+        assert sorted(result) == ["1", "55"]
+        assert result["55"].name == "Group 55"
+        assert api.user_service_get_visibility_groups.call_count == 1
+        api.user_service_get_users_by_visibility_group_id.assert_not_called()
+
+    def test_get_many_raises_on_empty_id(self) -> None:
+        service, _ = self._make_service()
+        with pytest.raises(ValueError, match="group_id"):
+            service.get_many(["1", ""])
+
+    def test_iter_all_uses_one_request(self) -> None:
+        service, api = self._make_service()
+        with patch(
+            "taurus_protect.services.visibility_group_service.visibility_groups_from_dto",
+            return_value=self._groups(),
+        ):
+            groups = list(service.iter_all())
+            service.get("1")
+
+        assert len(groups) == 60
+        assert api.user_service_get_visibility_groups.call_count == 1
+
+    def test_list_reuses_cached_groups(self) -> None:
+        service, api = self._make_service()
+        groups = self._groups()
+        with patch(
+            "taurus_protect.services.visibility_group_service.visibility_groups_from_dto",
+            return_value=groups,
+        ) as from_dto:
+            first, _ = service.list(limit=10)
+            second, pagination = service.list(limit=10, offset=50)
+            list(service.iter_all())
+
+        assert api.user_service_get_visibility_groups.call_count == 1
+        assert from_dto.call_count == 1
+        assert [g.id for g in second] == [str(i) for i in range(50, 60)]
+        assert pagination.total_items == 60
+        assert first[0] == groups[0]
+        assert first[0] is not groups[0]
+
+    def test_list_without_cache_maps_only_the_page(self) -> None:
+        service, api = self._make_service(cache_ttl=0)
+        dtos = [MagicMock() for _ in range(60)]
+        api.user_service_get_visibility_groups.return_value = MagicMock(result=dtos)
+        with patch(
+            "taurus_protect.services.visibility_group_service.visibility_groups_from_dto",
+            side_effect=lambda page: self._groups(len(page)),
+        ) as from_dto:
+            groups, pagination = service.list(limit=10, offset=20)
+
+        from_dto.assert_called_once_with(dtos[20:30])
+        assert len(groups) == 10
+        assert pagination.total_items == 60
+        assert pagination.has_more
+
+    def test_list_includes_users(self) -> None:
+        service, api = self._make_service()
+
+        def get_users(visibility_group_id: str) -> MagicMock:
+            return MagicMock(result=[MagicMock(id=f"u-{visibility_group_id}", email="", name="")])
+
+        api.user_service_get_users_by_visibility_group_id.side_effect = get_users
+        with patch(
+            "taurus_protect.services.visibility_group_service.visibility_groups_from_dto",
+            return_value=self._groups(),
+        ):
+            groups, _ = service.list(limit=5, include_users=True)
+            group = service.get("3")
+
+        assert [g.users[0].id for g in groups] == ["u-0", "u-1", "u-2", "u-3", "u-4"]
+        assert group.users[0].id == "u-3"
+        assert api.user_service_get_users_by_visibility_group_id.call_count == 5
+        assert api.user_service_get_visibility_groups.call_count == 1
+
+    def test_get_reuses_cached_users(self) -> None:
+        service, api = self._make_service()
+        api.user_service_get_users_by_visibility_group_id.return_value = MagicMock(
+            result=[MagicMock(id="u-1", email="a@example.com", name="A")]
+        )
+        with patch(
+            "taurus_protect.services.visibility_group_service.visibility_groups_from_dto",
+            return_value=self._groups(),
+        ):
+            first = service.get("1")
+            first.users.clear()
+            second = service.get("1")
+
+        assert len(second.users) == 1
+        api.user_service_get_users_by_visibility_group_id.assert_called_once()
+
+    def test_get_does_not_modify_cached_users(self) -> None:
+        service, api = self._make_service()
+        api.user_service_get_users_by_visibility_group_id.return_value = MagicMock(
+            result=[MagicMock(id="u-1", email="a@example.com", name="A")]
+        )
+        with patch(
+            "taurus_protect.services.visibility_group_service.visibility_groups_from_dto",
+            return_value=self._groups(),
+        ):
+            service.get("1").users[0].email = "changed@example.com"
+            second = service.get("1")
+
+        assert second.users[0].email == "a@example.com"
+        api.user_service_get_users_by_visibility_group_id.assert_called_once()
+
+    def test_coalesces_concurrent_group_fetches(self) -> None:
+        service, api = self._make_service()
+        started = threading.Event()
+        release = threading.Event()
+
+        def get_groups() -> MagicMock:
+            started.set()
+            release.wait(5)
+            return MagicMock(result=[MagicMock()])
+
+        api.user_service_get_visibility_groups.side_effect = get_groups
+        results: list = []
+        with patch(
+            "taurus_protect.services.visibility_group_service.visibility_groups_from_dto",
+            return_value=self._groups(),
+        ):
+            threads = [threading.Thread(target=lambda: results.append(service.list()))]
+            threads[0].start()
+            assert started.wait(5)
+            threads += [threading.Thread(target=lambda: results.append(service.list()))]
+            threads[1].start()
+            time.sleep(0.1)  # let the second caller reach the in-flight fetch
+            release.set()
+            for thread in threads:
+                thread.join(5)
+
+        assert len(results) == 2
+        assert api.user_service_get_visibility_groups.call_count == 1
+
+    def test_refetches_after_invalidate(self) -> None:
+        service, api = self._make_service()
+        with patch(
+            "taurus_protect.services.visibility_group_service.visibility_groups_from_dto",
+            return_value=self._groups(),
+        ):
+            service.get("1")
+            service.invalidate()
+            service.get("1")
+
+        assert api.user_service_get_visibility_groups.call_count == 2
+
+    def test_zero_ttl_disables_cache(self) -> None:
+        service, api = self._make_service(cache_ttl=0)
+        with patch(
+            "taurus_protect.services.visibility_group_service.visibility_groups_from_dto",
+            return_value=self._groups(),
+        ):
+            service.get("1")
+            service.list()
+
+        assert api.user_service_get_visibility_groups.call_count == 2
+
+
 class TestVisibilityGroupServiceGetUsers:
     """Tests for VisibilityGroupService.get_users()."""
 
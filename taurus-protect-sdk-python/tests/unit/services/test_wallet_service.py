@@ -2,12 +2,47 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
+from typing import Any, Callable, List
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from taurus_protect.errors import APIError, NotFoundError
-from taurus_protect.services.wallet_service import WalletService
+from taurus_protect.models.wallet import CreateWalletRequest
+from taurus_protect.services.wallet_service import AsyncWalletService, WalletService
+
+
+def _blocking(result: Any) -> tuple:
+    """Return (side_effect, started, release) for an API call that waits to be released."""
+    started = threading.Event()
+    release = threading.Event()
+
+    def side_effect(*args: Any, **kwargs: Any) -> Any:
+        started.set()
+        release.wait(5)
+        return result
+
+    return side_effect, started, release
+
+
+def _call_concurrently(
+    func: Callable[[], Any], started: threading.Event, release: threading.Event, callers: int = 4
+) -> List:
+    """Call ``func`` from several threads while the first call is in flight."""
+    results: List = []
+    threads = [threading.Thread(target=lambda: results.append(func())) for _ in range(callers)]
+    threads[0].start()
+    assert started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    time.sleep(0.1)  # let the other callers reach the in-flight call
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    return results
 
 
 class TestGet:
@@ -51,6 +86,72 @@ class TestGet:
         with pytest.raises(NotFoundError):
             service.get(1)
 
+    def test_get_coalesces_concurrent_calls(self) -> None:
+        service, api = self._make_service()
+        side_effect, started, release = _blocking(MagicMock())
+        api.wallet_service_get_wallet_v2.side_effect = side_effect
+        wallet = MagicMock()
+
+        with patch("taurus_protect.services.wallet_service.wallet_from_dto", return_value=wallet):
+            results = _call_concurrently(lambda: service.get(1), started, release)
+
+        assert results == [wallet] * 4
+        api.wallet_service_get_wallet_v2.assert_called_once_with("1")
+
+
+class TestGetMany:
+    """Tests for WalletService.get_many()."""
+
+    def _make_service(self) -> tuple:
+        def get_wallets(**kwargs: object) -> MagicMock:
+            ids = [wallet_id for wallet_id in kwargs["ids"] if wallet_id != "404"]
+            return MagicMock(result=[MagicMock(id=wallet_id) for wallet_id in ids])
+
+        wallets_api = MagicMock()
+        wallets_api.wallet_service_get_wallets_v2.side_effect = get_wallets
+        service = WalletService(api_client=MagicMock(), wallets_api=wallets_api)
+        return service, wallets_api
+
+    def test_returns_wallets_by_id(self) -> None:
+        service, api = self._make_service()
+
+        with patch(
+            "taurus_protect.services.wallet_service.wallets_from_dto",
+            side_effect=lambda dtos: [MagicMock(id=dto.id) for dto in dtos],
+        ):
+            result = service.get_many([1, 2, 404, 1])
+
+        assert sorted(result) == [1, 2]
+        assert result[2].id == "2"
+        api.wallet_service_get_wallets_v2.assert_called_once()
+        kwargs = api.wallet_service_get_wallets_v2.call_args.kwargs
+        assert kwargs["ids"] == ["1", "2", "404"]
+        assert kwargs["limit"] == "3"
+
+    def test_batches_large_requests(self) -> None:
+        service, api = self._make_service()
+
+        with patch(
+            "taurus_protect.services.wallet_service.wallets_from_dto",
+            side_effect=lambda dtos: [MagicMock(id=dto.id) for dto in dtos],
+        ):
+            result = service.get_many(list(range(1, 251)))
+
+        assert len(result) == 250
+        assert api.wallet_service_get_wallets_v2.call_count == 3
+
+    def test_empty_ids_make_no_request(self) -> None:
+        service, api = self._make_service()
+
+        assert service.get_many([]) == {}
+        api.wallet_service_get_wallets_v2.assert_not_called()
+
+    def test_raises_for_non_positive_id(self) -> None:
+        service, _ = self._make_service()
+
+        with pytest.raises(ValueError, match="wallet_id must be positive"):
+            service.get_many([1, 0])
+
 
 class TestList:
     """Tests for WalletService.list()."""
@@ -103,6 +204,103 @@ class TestList:
         wallets, pagination = service.list()
         assert wallets == []
 
+    def test_list_coalesces_concurrent_calls(self) -> None:
+        service, api = self._make_service()
+        side_effect, started, release = _blocking(MagicMock(result=[MagicMock()]))
+        api.wallet_service_get_wallets_v2.side_effect = side_effect
+        wallet = MagicMock()
+
+        with patch(
+            "taurus_protect.services.wallet_service.wallets_from_dto",
+            return_value=[wallet],
+        ):
+            results = _call_concurrently(lambda: service.list(limit=10), started, release)
+
+        assert [wallets for wallets, _ in results] == [[wallet]] * 4
+        assert results[0][0] is not results[1][0]
+        api.wallet_service_get_wallets_v2.assert_called_once()
+
+    def test_list_leaves_other_filters_unset(self) -> None:
+        service, api = self._make_service()
+        api.wallet_service_get_wallets_v2.return_value = MagicMock(result=None)
+
+        service.list(limit=20, offset=40)
+
+        api.wallet_service_get_wallets_v2.assert_called_once_with(
+            currencies=None,
+            query=None,
+            limit="20",
+            offset="40",
+            name=None,
+            sort_order=None,
+            exclude_disabled=None,
+            tag_ids=None,
+            only_positive_balance=None,
+            blockchain=None,
+            network=None,
+            ids=None,
+        )
+
+
+class TestIterAll:
+    """Tests for WalletService.iter_all()."""
+
+    def _make_service(self, total: int, max_page_size: int = 1000) -> tuple:
+        def get_wallets(**kwargs: object) -> MagicMock:
+            offset = int(kwargs["offset"] or 0)
+            limit = min(int(kwargs["limit"]), max_page_size)
+            ids = list(range(offset, min(offset + limit, total)))
+            return MagicMock(result=ids, total_items=str(total), offset=str(offset))
+
+        wallets_api = MagicMock()
+        wallets_api.wallet_service_get_wallets_v2.side_effect = get_wallets
+        service = WalletService(api_client=MagicMock(), wallets_api=wallets_api)
+        return service, wallets_api
+
+    def test_iterates_all_pages(self) -> None:
+        service, api = self._make_service(total=5)
+
+        with patch(
+            "taurus_protect.services.wallet_service.wallets_from_dto",
+            side_effect=lambda dtos: list(dtos),
+        ):
+            wallets = list(service.iter_all(currency="ETH", page_size=2))
+
+        assert wallets == [0, 1, 2, 3, 4]
+        assert api.wallet_service_get_wallets_v2.call_count == 3
+        kwargs = api.wallet_service_get_wallets_v2.call_args.kwargs
+        assert kwargs["currencies"] == ["ETH"]
+        assert kwargs["offset"] == "4"
+
+    def test_stops_when_last_page_is_full(self) -> None:
+        service, api = self._make_service(total=4)
+
+        with patch(
+            "taurus_protect.services.wallet_service.wallets_from_dto",
+            side_effect=lambda dtos: list(dtos),
+        ):
+            assert len(list(service.iter_all(page_size=2))) == 4
+
+        assert api.wallet_service_get_wallets_v2.call_count == 2
+
+    def test_follows_pages_shorter_than_requested(self) -> None:
+        service, api = self._make_service(total=7, max_page_size=3)
+
+        with patch(
+            "taurus_protect.services.wallet_service.wallets_from_dto",
+            side_effect=lambda dtos: list(dtos),
+        ):
+            wallets = list(service.iter_all(page_size=5))
+
+        assert wallets == list(range(7))
+        assert api.wallet_service_get_wallets_v2.call_count == 3
+
+    def test_validates_page_size_eagerly(self) -> None:
+        service, _ = self._make_service(total=0)
+
+        with pytest.raises(ValueError, match="page_size"):
+            service.iter_all(page_size=0)
+
 
 class TestCreate:
     """Tests for WalletService.create()."""
@@ -147,6 +345,35 @@ class TestCreate:
 
         assert result is mock_wallet
 
+    def test_create_sends_request_fields(self) -> None:
+        service, api = self._make_service()
+        api.wallet_service_create_wallet.return_value = MagicMock(result=MagicMock())
+
+        with patch(
+            "taurus_protect.services.wallet_service.wallet_from_create_dto",
+            return_value=MagicMock(),
+        ):
+            service.create(
+                CreateWalletRequest(blockchain="ETH", network="mainnet", name="W", comment="c")
+            )
+
+        api.wallet_service_create_wallet.assert_called_once_with(
+            body={
+                "blockchain": "ETH",
+                "network": "mainnet",
+                "name": "W",
+                "is_omnibus": False,
+                "comment": "c",
+            }
+        )
+
+    def test_create_raises_for_empty_network(self) -> None:
+        service, api = self._make_service()
+
+        with pytest.raises(ValueError, match="network"):
+            service.create(CreateWalletRequest(blockchain="ETH", network="", name="W"))
+        api.wallet_service_create_wallet.assert_not_called()
+
 
 class TestGetByName:
     """Tests for WalletService.get_by_name()."""
@@ -183,7 +410,7 @@ class TestGetByName:
 
 
 class TestCreateAttribute:
-    """Tests for WalletService.create_attribute()."""
+    """Tests for WalletService.create_attribute() and create_attributes()."""
 
     def _make_service(self) -> tuple:
         api_client = MagicMock()
@@ -210,6 +437,35 @@ class TestCreateAttribute:
 
         api.wallet_service_create_wallet_attributes.assert_called_once()
 
+    def test_create_attributes_sends_one_request(self) -> None:
+        service, api = self._make_service()
+
+        service.create_attributes(7, {"desk": "otc", "region": "eu"})
+
+        api.wallet_service_create_wallet_attributes.assert_called_once_with(
+            "7",
+            body={
+                "attributes": [
+                    {"key": "desk", "value": "otc"},
+                    {"key": "region", "value": "eu"},
+                ]
+            },
+        )
+
+    def test_create_attributes_validates_before_sending(self) -> None:
+        service, api = self._make_service()
+
+        with pytest.raises(ValueError, match="value"):
+            service.create_attributes(1, {"desk": "otc", "region": ""})
+        api.wallet_service_create_wallet_attributes.assert_not_called()
+
+    def test_create_attributes_skips_empty_mapping(self) -> None:
+        service, api = self._make_service()
+
+        service.create_attributes(1, {})
+
+        api.wallet_service_create_wallet_attributes.assert_not_called()
+
 
 class TestGetBalanceHistory:
     """Tests for WalletService.get_balance_history()."""
@@ -243,6 +499,48 @@ class TestGetBalanceHistory:
         assert result == []
 
 
+class TestGetBalanceHistories:
+    """Tests for WalletService.get_balance_histories()."""
+
+    def _make_service(self) -> tuple:
+        api_client = MagicMock()
+        wallets_api = MagicMock()
+        service = WalletService(api_client=api_client, wallets_api=wallets_api)
+        return service, wallets_api
+
+    def test_returns_history_per_wallet(self) -> None:
+        service, api = self._make_service()
+        api.wallet_service_get_wallet_balance_history.side_effect = (
+            lambda wallet_id, interval: MagicMock(result=[wallet_id])
+        )
+
+        with patch(
+            "taurus_protect.services.wallet_service.balance_history_point_from_dto",
+            side_effect=lambda dto: f"point-{dto}",
+        ):
+            result = service.get_balance_histories([1, 2, 3, 2], 24)
+
+        assert result == {1: ["point-1"], 2: ["point-2"], 3: ["point-3"]}
+        assert api.wallet_service_get_wallet_balance_history.call_count == 3
+
+    def test_propagates_api_errors(self) -> None:
+        service, api = self._make_service()
+        api.wallet_service_get_wallet_balance_history.side_effect = APIError(
+            "Server error", code=500
+        )
+
+        with pytest.raises(APIError):
+            service.get_balance_histories([1, 2], 24)
+
+    def test_raises_for_invalid_arguments(self) -> None:
+        service, _ = self._make_service()
+
+        with pytest.raises(ValueError, match="wallet_id must be positive"):
+            service.get_balance_histories([1, -1], 24)
+        with pytest.raises(ValueError, match="interval_hours must be positive"):
+            service.get_balance_histories([1], 0)
+
+
 class TestGetTokens:
     """Tests for WalletService.get_tokens()."""
 
@@ -273,3 +571,99 @@ class TestGetTokens:
 
         result = service.get_tokens(1)
         assert result == []
+
+
+class TestIterTokens:
+    """Tests for WalletService.iter_tokens()."""
+
+    def _make_service(self) -> tuple:
+        wallets_api = MagicMock()
+        service = WalletService(api_client=MagicMock(), wallets_api=wallets_api)
+        return service, wallets_api
+
+    def test_follows_cursor_until_last_page(self) -> None:
+        service, api = self._make_service()
+        api.wallet_service_get_wallet_tokens.side_effect = [
+            MagicMock(balances=["a", "b"], next="c2"),
+            MagicMock(balances=["c"], next=None),
+        ]
+
+        with patch(
+            "taurus_protect.services.wallet_service.asset_balance_from_dto",
+            side_effect=lambda dto: f"balance-{dto}",
+        ):
+            tokens = list(service.iter_tokens(5, page_size=2))
+
+        assert tokens == ["balance-a", "balance-b", "balance-c"]
+        assert [c.args for c in api.wallet_service_get_wallet_tokens.call_args_list] == [
+            ("5", "2", None),
+            ("5", "2", "c2"),
+        ]
+
+    def test_stops_on_empty_page(self) -> None:
+        service, api = self._make_service()
+        api.wallet_service_get_wallet_tokens.return_value = MagicMock(balances=[], next="c2")
+
+        assert list(service.iter_tokens(5)) == []
+        api.wallet_service_get_wallet_tokens.assert_called_once()
+
+    def test_validates_eagerly(self) -> None:
+        service, api = self._make_service()
+
+        with pytest.raises(ValueError, match="page_size must be positive"):
+            service.iter_tokens(5, page_size=0)
+        api.wallet_service_get_wallet_tokens.assert_not_called()
+
+    def test_wraps_api_errors(self) -> None:
+        service, api = self._make_service()
+        api.wallet_service_get_wallet_tokens.side_effect = RuntimeError("boom")
+
+        with pytest.raises(APIError):
+            list(service.iter_tokens(5))
+
+
+class TestAsyncWalletService:
+    """Tests for AsyncWalletService."""
+
+    def test_forwards_calls_to_sync_service(self) -> None:
+        service = MagicMock()
+        service.get_tokens.side_effect = lambda wallet_id, limit: [f"token-{wallet_id}"]
+        service.list.return_value = ([], None)
+
+        async def run() -> tuple:
+            async with AsyncWalletService(service) as wallets:
+                tokens = await asyncio.gather(*(wallets.get_tokens(i) for i in (1, 2, 3)))
+                listed = await wallets.list(limit=10)
+            return tokens, listed
+
+        tokens, listed = asyncio.run(run())
+
+        assert tokens == [["token-1"], ["token-2"], ["token-3"]]
+        assert listed == ([], None)
+        service.list.assert_called_once_with(10, 0)
+
+    def test_runs_requests_concurrently(self) -> None:
+        service = MagicMock()
+        barrier = threading.Barrier(4, timeout=5)
+        service.get.side_effect = lambda wallet_id: (barrier.wait(), wallet_id)[1]
+
+        async def run() -> list:
+            async with AsyncWalletService(service, max_concurrency=4) as wallets:
+                return await asyncio.gather(*(wallets.get(i) for i in range(4)))
+
+        assert asyncio.run(run()) == [0, 1, 2, 3]
+
+    def test_propagates_errors(self) -> None:
+        service = MagicMock()
+        service.get.side_effect = NotFoundError("Wallet 1 not found")
+
+        async def run() -> None:
+            async with AsyncWalletService(service) as wallets:
+                await wallets.get(1)
+
+        with pytest.raises(NotFoundError):
+            asyncio.run(run())
+
+    def test_rejects_invalid_concurrency(self) -> None:
+        with pytest.raises(ValueError, match="max_concurrency must be positive"):
+            AsyncWalletService(MagicMock(), max_concurrency=0)
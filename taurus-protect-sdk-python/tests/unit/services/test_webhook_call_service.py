@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import sys
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -13,6 +17,15 @@ from taurus_protect.services.webhook_call_service import (
 )
 
 
+class TestWebhookCallDataclasses:
+    """Tests for ApiRequestCursor and WebhookCallResult."""
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_dataclasses_have_no_instance_dict(self) -> None:
+        for obj in (ApiRequestCursor(), WebhookCallResult(calls=[])):
+            assert not hasattr(obj, "__dict__")
+
+
 class TestGetWebhookCalls:
     """Tests for WebhookCallService.get_webhook_calls()."""
 
@@ -139,3 +152,309 @@ class TestWebhookCallServiceGet:
 
         with pytest.raises(NotFoundError):
             service.get("call-missing")
+
+
+def _calls_reply(ids: list, next_page: str = "") -> SimpleNamespace:
+    return SimpleNamespace(
+        calls=[SimpleNamespace(id=call_id, status="SUCCESS") for call_id in ids],
+        cursor=SimpleNamespace(current_page=next_page, has_next=bool(next_page)),
+    )
+
+
+class TestWebhookCallServiceGetPaging:
+    """Tests for the paging and cache used by WebhookCallService.get()."""
+
+    def _make_service(self, cache_size: int = 512) -> tuple:
+        webhook_calls_api = MagicMock()
+        service = WebhookCallService(
+            api_client=MagicMock(),
+            webhook_calls_api=webhook_calls_api,
+            cache_enabled=True,
+            cache_size=cache_size,
+        )
+        return service, webhook_calls_api
+
+    def test_get_finds_call_beyond_first_page(self) -> None:
+        service, api = self._make_service()
+        api.webhook_service_get_webhook_calls.side_effect = [
+            _calls_reply(["c-1", "c-2"], next_page="p2"),
+            _calls_reply(["c-3"]),
+        ]
+
+        call = service.get("c-3")
+
+        assert call.id == "c-3"
+        second = api.webhook_service_get_webhook_calls.call_args_list[1].kwargs
+        assert second["cursor_current_page"] == "p2"
+        assert second["cursor_page_request"] == "NEXT"
+
+    def test_get_stops_after_last_page(self) -> None:
+        service, api = self._make_service()
+        api.webhook_service_get_webhook_calls.side_effect = [
+            _calls_reply(["c-1"], next_page="p2"),
+            _calls_reply(["c-2"]),
+        ]
+
+        from taurus_protect.errors import NotFoundError
+
+        with pytest.raises(NotFoundError):
+            service.get("c-missing")
+        assert api.webhook_service_get_webhook_calls.call_count == 2
+
+    def test_get_stops_after_max_pages(self) -> None:
+        service, api = self._make_service()
+        api.webhook_service_get_webhook_calls.side_effect = [
+            _calls_reply([f"c-{page}"], next_page=f"p{page + 1}") for page in range(10)
+        ]
+
+        from taurus_protect.errors import NotFoundError
+
+        with pytest.raises(NotFoundError):
+            service.get("c-missing", max_pages=3)
+        assert api.webhook_service_get_webhook_calls.call_count == 3
+
+    def test_get_searches_default_number_of_pages(self) -> None:
+        service, api = self._make_service()
+        api.webhook_service_get_webhook_calls.side_effect = [
+            _calls_reply([f"c-{page}"], next_page=f"p{page + 1}") for page in range(10)
+        ]
+
+        from taurus_protect.errors import NotFoundError
+
+        with pytest.raises(NotFoundError):
+            service.get("c-missing")
+        assert (
+            api.webhook_service_get_webhook_calls.call_count
+            == WebhookCallService.DEFAULT_GET_MAX_PAGES
+        )
+
+    def test_get_raises_on_invalid_max_pages(self) -> None:
+        service, _ = self._make_service()
+        with pytest.raises(ValueError):
+            service.get("c-1", max_pages=0)
+
+    def test_get_uses_calls_seen_by_list(self) -> None:
+        service, api = self._make_service()
+        api.webhook_service_get_webhook_calls.return_value = _calls_reply(["c-1", "c-2"])
+
+        service.list()
+        call = service.get("c-2")
+
+        assert call.id == "c-2"
+        api.webhook_service_get_webhook_calls.assert_called_once()
+
+    def test_cache_is_off_by_default(self) -> None:
+        api = MagicMock()
+        service = WebhookCallService(api_client=MagicMock(), webhook_calls_api=api)
+        api.webhook_service_get_webhook_calls.side_effect = [
+            SimpleNamespace(calls=[SimpleNamespace(id="c-1", status="FAILED")], cursor=None),
+            SimpleNamespace(calls=[SimpleNamespace(id="c-1", status="SUCCESS")], cursor=None),
+        ]
+
+        assert service.get("c-1").status == "FAILED"
+        assert service.get("c-1").status == "SUCCESS"
+
+    def test_cache_is_bounded(self) -> None:
+        service, api = self._make_service(cache_size=1)
+        api.webhook_service_get_webhook_calls.return_value = _calls_reply(["c-1", "c-2"])
+
+        service.list()
+        service.get("c-1")
+
+        assert api.webhook_service_get_webhook_calls.call_count == 2
+
+    def test_clear_cache(self) -> None:
+        service, api = self._make_service()
+        api.webhook_service_get_webhook_calls.return_value = _calls_reply(["c-1"])
+
+        service.get("c-1")
+        service.clear_cache()
+        service.get("c-1")
+
+        assert api.webhook_service_get_webhook_calls.call_count == 2
+
+
+class TestWebhookCallServiceListCache:
+    """Tests for the page cache used by WebhookCallService.list()."""
+
+    def test_list_reuses_cached_page(self) -> None:
+        api = MagicMock()
+        api.webhook_service_get_webhook_calls.return_value = _calls_reply(["c-1"])
+        service = WebhookCallService(
+            api_client=MagicMock(), webhook_calls_api=api, page_cache_ttl=30.0
+        )
+
+        first, _ = service.list(status="FAILED")
+        second, _ = service.list(status="FAILED")
+        service.list(status="SUCCESS")
+
+        assert first == second
+        assert first is not second
+        assert api.webhook_service_get_webhook_calls.call_count == 2
+
+    def test_clear_cache_drops_pages(self) -> None:
+        api = MagicMock()
+        api.webhook_service_get_webhook_calls.return_value = _calls_reply(["c-1"])
+        service = WebhookCallService(
+            api_client=MagicMock(), webhook_calls_api=api, page_cache_ttl=30.0
+        )
+
+        service.list()
+        service.clear_cache()
+        service.list()
+
+        assert api.webhook_service_get_webhook_calls.call_count == 2
+
+    def test_page_cache_is_off_by_default(self) -> None:
+        api = MagicMock()
+        api.webhook_service_get_webhook_calls.side_effect = [
+            _calls_reply(["c-1"]),
+            _calls_reply(["c-1", "c-2"]),
+        ]
+        service = WebhookCallService(api_client=MagicMock(), webhook_calls_api=api)
+
+        service.list(status="FAILED")
+        calls, _ = service.list(status="FAILED")
+
+        assert [call.id for call in calls] == ["c-1", "c-2"]
+
+
+class TestWebhookCallServiceIterAll:
+    """Tests for WebhookCallService.iter_all()."""
+
+    def _make_service(self) -> tuple:
+        webhook_calls_api = MagicMock()
+        service = WebhookCallService(api_client=MagicMock(), webhook_calls_api=webhook_calls_api)
+        return service, webhook_calls_api
+
+    def test_iter_all_follows_cursor(self) -> None:
+        service, api = self._make_service()
+        api.webhook_service_get_webhook_calls.side_effect = [
+            _calls_reply(["c-1", "c-2"], next_page="p2"),
+            _calls_reply(["c-3"]),
+        ]
+
+        calls = list(service.iter_all(webhook_id="wh-1", page_size=2))
+
+        assert [c.id for c in calls] == ["c-1", "c-2", "c-3"]
+        first, second = (c.kwargs for c in api.webhook_service_get_webhook_calls.call_args_list)
+        assert first["cursor_current_page"] is None
+        assert first["cursor_page_size"] == "2"
+        assert second["webhook_id"] == "wh-1"
+        assert second["cursor_current_page"] == "p2"
+        assert second["cursor_page_request"] == "NEXT"
+
+    def test_iter_all_prefetches_next_page(self) -> None:
+        service, api = self._make_service()
+        prefetched = threading.Event()
+        replies = iter([_calls_reply(["c-1"], next_page="p2"), _calls_reply(["c-2"])])
+
+        def fetch(**kwargs: object) -> SimpleNamespace:
+            if kwargs["cursor_current_page"] == "p2":
+                prefetched.set()
+            return next(replies)
+
+        api.webhook_service_get_webhook_calls.side_effect = fetch
+
+        calls = service.iter_all()
+        assert next(calls).id == "c-1"
+
+        assert prefetched.wait(5)
+        calls.close()
+
+    def test_iter_all_validates_eagerly(self) -> None:
+        service, api = self._make_service()
+
+        with pytest.raises(ValueError):
+            service.iter_all(page_size=0)
+        api.webhook_service_get_webhook_calls.assert_not_called()
+
+    def test_iter_all_wraps_errors(self) -> None:
+        from taurus_protect.errors import APIError
+
+        service, api = self._make_service()
+        api.webhook_service_get_webhook_calls.side_effect = RuntimeError("boom")
+
+        with pytest.raises(APIError):
+            list(service.iter_all())
+
+
+class TestWebhookCallServiceCoalescing:
+    """Tests for sharing in-flight requests between concurrent callers."""
+
+    def _call_concurrently(self, api: MagicMock, reply: SimpleNamespace, func) -> list:
+        started = threading.Event()
+        release = threading.Event()
+
+        def fetch(**kwargs: object) -> SimpleNamespace:
+            started.set()
+            release.wait(5)
+            return reply
+
+        api.webhook_service_get_webhook_calls.side_effect = fetch
+        results: list = []
+        threads = [threading.Thread(target=lambda: results.append(func())) for _ in range(4)]
+        threads[0].start()
+        assert started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.1)  # let the other callers reach the in-flight call
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        return results
+
+    def test_concurrent_list_calls_share_request(self) -> None:
+        api = MagicMock()
+        service = WebhookCallService(api_client=MagicMock(), webhook_calls_api=api)
+
+        results = self._call_concurrently(
+            api, _calls_reply(["c-1"]), lambda: service.list(status="FAILED")
+        )
+
+        assert len(results) == 4
+        assert all([c.id for c in calls] == ["c-1"] for calls, _ in results)
+        assert api.webhook_service_get_webhook_calls.call_count == 1
+
+    def test_concurrent_get_calls_share_request(self) -> None:
+        api = MagicMock()
+        service = WebhookCallService(api_client=MagicMock(), webhook_calls_api=api)
+
+        results = self._call_concurrently(api, _calls_reply(["c-1"]), lambda: service.get("c-1"))
+
+        assert [call.id for call in results] == ["c-1"] * 4
+        assert api.webhook_service_get_webhook_calls.call_count == 1
+
+
+class TestWebhookCallServiceCount:
+    """Tests for WebhookCallService.count()."""
+
+    def _make_service(self) -> tuple:
+        webhook_calls_api = MagicMock()
+        service = WebhookCallService(api_client=MagicMock(), webhook_calls_api=webhook_calls_api)
+        return service, webhook_calls_api
+
+    def test_count_returns_size_and_next_cursor(self) -> None:
+        service, api = self._make_service()
+        api.webhook_service_get_webhook_calls.return_value = _calls_reply(
+            ["c-1", "c-2"], next_page="p2"
+        )
+
+        with patch("taurus_protect.services.webhook_call_service.webhook_calls_from_dto") as mapper:
+            assert service.count(status="FAILED", limit=2) == (2, "p2")
+
+        mapper.assert_not_called()
+        kwargs = api.webhook_service_get_webhook_calls.call_args.kwargs
+        assert kwargs["status"] == "FAILED"
+        assert kwargs["cursor_page_size"] == "2"
+
+    def test_count_last_page(self) -> None:
+        service, api = self._make_service()
+        api.webhook_service_get_webhook_calls.return_value = _calls_reply([])
+
+        assert service.count() == (0, None)
+
+    def test_count_raises_on_invalid_limit(self) -> None:
+        service, _ = self._make_service()
+        with pytest.raises(ValueError, match="limit must be positive"):
+            service.count(limit=0)
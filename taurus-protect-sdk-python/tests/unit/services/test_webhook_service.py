@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
@@ -15,7 +16,9 @@ class TestWebhookServiceList:
     def _make_service(self) -> tuple:
         api_client = MagicMock()
         webhooks_api = MagicMock()
-        service = WebhookService(api_client=api_client, webhooks_api=webhooks_api)
+        service = WebhookService(
+            api_client=api_client, webhooks_api=webhooks_api, page_cache_ttl=30.0
+        )
         return service, webhooks_api
 
     def test_list_returns_webhooks(self) -> None:
@@ -57,6 +60,36 @@ class TestWebhookServiceList:
 
         assert webhooks == []
 
+    def test_list_reuses_cached_page(self) -> None:
+        service, api = self._make_service()
+        api.webhook_service_get_webhooks.return_value = MagicMock(webhooks=None, cursor=None)
+
+        service.list(limit=10)
+        service.list(limit=10)
+        service.list(limit=20)
+
+        assert api.webhook_service_get_webhooks.call_count == 2
+
+    def test_create_and_delete_drop_cached_pages(self) -> None:
+        service, api = self._make_service()
+        api.webhook_service_get_webhooks.return_value = MagicMock(webhooks=None, cursor=None)
+
+        service.list()
+        service.delete("webhook-1")
+        service.list()
+
+        assert api.webhook_service_get_webhooks.call_count == 2
+
+    def test_page_cache_is_off_by_default(self) -> None:
+        api = MagicMock()
+        api.webhook_service_get_webhooks.return_value = MagicMock(webhooks=None, cursor=None)
+        service = WebhookService(api_client=MagicMock(), webhooks_api=api)
+
+        service.list()
+        service.list()
+
+        assert api.webhook_service_get_webhooks.call_count == 2
+
 
 class TestWebhookServiceGet:
     """Tests for WebhookService.get()."""
@@ -64,7 +97,9 @@ class TestWebhookServiceGet:
     def _make_service(self) -> tuple:
         api_client = MagicMock()
         webhooks_api = MagicMock()
-        service = WebhookService(api_client=api_client, webhooks_api=webhooks_api)
+        service = WebhookService(
+            api_client=api_client, webhooks_api=webhooks_api, page_cache_ttl=30.0
+        )
         return service, webhooks_api
 
     def test_get_raises_on_empty_id(self) -> None:
@@ -83,6 +118,48 @@ class TestWebhookServiceGet:
         with pytest.raises(NotFoundError):
             service.get("wh-missing")
 
+    def _webhooks_reply(self, ids: list) -> SimpleNamespace:
+        return SimpleNamespace(
+            webhooks=[SimpleNamespace(id=i, url="https://example.com/hook") for i in ids],
+            cursor=None,
+        )
+
+    def test_get_reuses_indexed_page(self) -> None:
+        service, api = self._make_service()
+        api.webhook_service_get_webhooks.return_value = self._webhooks_reply(["wh-1", "wh-2"])
+
+        assert service.get("wh-1").id == "wh-1"
+        assert service.get("wh-2").id == "wh-2"
+
+        api.webhook_service_get_webhooks.assert_called_once()
+
+    def test_get_refetches_unknown_id(self) -> None:
+        service, api = self._make_service()
+        api.webhook_service_get_webhooks.side_effect = [
+            self._webhooks_reply(["wh-1"]),
+            self._webhooks_reply(["wh-1", "wh-2"]),
+        ]
+
+        service.get("wh-1")
+
+        assert service.get("wh-2").id == "wh-2"
+        assert api.webhook_service_get_webhooks.call_count == 2
+
+    def test_delete_drops_indexed_page(self) -> None:
+        service, api = self._make_service()
+        api.webhook_service_get_webhooks.side_effect = [
+            self._webhooks_reply(["wh-1"]),
+            self._webhooks_reply([]),
+        ]
+
+        service.get("wh-1")
+        service.delete("wh-1")
+
+        from taurus_protect.errors import NotFoundError
+
+        with pytest.raises(NotFoundError):
+            service.get("wh-1")
+
 
 class TestWebhookServiceCreate:
     """Tests for WebhookService.create()."""
@@ -103,6 +180,50 @@ class TestWebhookServiceCreate:
         with pytest.raises(ValueError, match="events cannot be empty"):
             service.create(url="https://example.com", events=[])
 
+    @pytest.mark.parametrize("event", ["", "  ", "REQUEST_CREATED,REQUEST_APPROVED"])
+    def test_create_raises_on_invalid_event(self, event: str) -> None:
+        service, api = self._make_service()
+        with pytest.raises(ValueError, match="invalid event type"):
+            service.create(url="https://example.com", events=["REQUEST_CREATED", event])
+        api.webhook_service_create_webhook.assert_not_called()
+
+    def _create_reply(self, body: dict) -> SimpleNamespace:
+        return SimpleNamespace(webhook=SimpleNamespace(id=body["url"], url=body["url"]))
+
+    def test_create_many_returns_webhooks_in_order(self) -> None:
+        service, api = self._make_service()
+        api.webhook_service_create_webhook.side_effect = lambda body: self._create_reply(body)
+        urls = [f"https://example.com/{i}" for i in range(10)]
+
+        webhooks = service.create_many([(url, ["REQUEST_CREATED"]) for url in urls])
+
+        assert [w.id for w in webhooks] == urls
+        assert api.webhook_service_create_webhook.call_count == 10
+
+    def test_create_many_validates_before_sending(self) -> None:
+        service, api = self._make_service()
+
+        with pytest.raises(ValueError, match="events cannot be empty"):
+            service.create_many(
+                [("https://example.com/1", ["REQUEST_CREATED"]), ("https://example.com/2", [])]
+            )
+        api.webhook_service_create_webhook.assert_not_called()
+
+    def test_create_many_empty(self) -> None:
+        service, api = self._make_service()
+
+        assert service.create_many([]) == []
+        api.webhook_service_create_webhook.assert_not_called()
+
+    def test_create_many_wraps_errors(self) -> None:
+        from taurus_protect.errors import APIError
+
+        service, api = self._make_service()
+        api.webhook_service_create_webhook.side_effect = RuntimeError("boom")
+
+        with pytest.raises(APIError):
+            service.create_many([("https://example.com", ["REQUEST_CREATED"])])
+
 
 class TestWebhookServiceDelete:
     """Tests for WebhookService.delete()."""
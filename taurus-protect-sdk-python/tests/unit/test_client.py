@@ -739,6 +739,41 @@ class TestProtectClientConfiguration:
         assert client._rules_cache_ttl == 600.0
         client.close()
 
+    def test_default_connection_pool_maxsize(
+        self, host: str, api_key: str, api_secret_hex: str, super_admin_keys_pem: List[str]
+    ) -> None:
+        """Test that the API client pool keeps the default number of connections."""
+        client = ProtectClient.create(
+            host=host, api_key=api_key, api_secret=api_secret_hex,
+            super_admin_keys_pem=super_admin_keys_pem,
+        )
+        config = client._get_api_client().configuration
+        assert config.connection_pool_maxsize == ProtectClient.DEFAULT_CONNECTION_POOL_MAXSIZE
+        client.close()
+
+    def test_custom_connection_pool_maxsize(
+        self, host: str, api_key: str, api_secret_hex: str, super_admin_keys_pem: List[str]
+    ) -> None:
+        """Test that a custom connection pool size reaches the API client."""
+        client = ProtectClient.create(
+            host=host, api_key=api_key, api_secret=api_secret_hex,
+            super_admin_keys_pem=super_admin_keys_pem,
+            connection_pool_maxsize=64,
+        )
+        assert client._get_api_client().configuration.connection_pool_maxsize == 64
+        client.close()
+
+    def test_invalid_connection_pool_maxsize_raises(
+        self, host: str, api_key: str, api_secret_hex: str, super_admin_keys_pem: List[str]
+    ) -> None:
+        """Test that a non-positive connection pool size is rejected."""
+        with pytest.raises(ConfigurationError, match="connection_pool_maxsize"):
+            ProtectClient.create(
+                host=host, api_key=api_key, api_secret=api_secret_hex,
+                super_admin_keys_pem=super_admin_keys_pem,
+                connection_pool_maxsize=0,
+            )
+
     def test_host_property_returns_configured_host(
         self, api_key: str, api_secret_hex: str, super_admin_keys_pem: List[str]
     ) -> None: